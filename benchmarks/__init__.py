@@ -0,0 +1,8 @@
+import os
+import sys
+
+# lyra's modules import each other as top level packages (`from models.line import Line`),
+# so the lyra directory has to be importable the same way when running the benchmarks from the repository root.
+_LYRA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "lyra")
+if _LYRA_DIR not in sys.path:
+    sys.path.insert(0, _LYRA_DIR)
\ No newline at end of file
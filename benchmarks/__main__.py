@@ -0,0 +1,56 @@
+"""Runs Lyra's benchmarks.
+
+Usage, from the repository root::
+
+    python -m benchmarks                                 # run everything and print the results
+    python -m benchmarks --save-baseline baseline.json   # record a baseline on this machine
+    python -m benchmarks --baseline baseline.json        # exit with status 1 on any regression
+
+Baselines are machine specific, so record them on the machine the comparison runs on.
+"""
+import argparse
+import fnmatch
+import sys
+from benchmarks import datasets, runner
+from benchmarks.cases import CASES
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark Lyra's core geometry paths.")
+    parser.add_argument("-k", "--filter", default="*", help="only run cases matching this glob pattern")
+    parser.add_argument("-s", "--sizes", nargs="+", choices=list(datasets.SIZES), default=["small", "medium"], help="dataset sizes to run")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="runs per case, the fastest one is kept")
+    parser.add_argument("--baseline", help="baseline file to compare the results against")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="how many times slower (or bigger) than the baseline counts as a regression")
+    parser.add_argument("--save-baseline", metavar="PATH", help="write the results to this file")
+    args = parser.parse_args(argv)
+
+    names = [name for name in CASES if fnmatch.fnmatch(name, args.filter)]
+    sizes = {label: datasets.SIZES[label] for label in args.sizes}
+
+    results = {}
+    width = max(len(f"{name}[{label}]") for name in names for label in sizes) if names else 0
+    print(f"{'case':<{width}}  {'time/op (us)':>14}  {'inputs (KiB)':>12}  {'peak (KiB)':>12}")
+    for name in names:
+        for label, size in sizes.items():
+            key = f"{name}[{label}]"
+            result = results[key] = runner.run_case(name, size, args.repeat)
+            print(f"{key:<{width}}  {result['per_op_us']:>14.3f}  {result['inputs_kib']:>12.1f}  {result['peak_kib']:>12.1f}", flush=True)
+
+    if args.save_baseline:
+        runner.save(results, args.save_baseline)
+        print(f"\nSaved baseline to {args.save_baseline}")
+
+    if args.baseline:
+        regressions = runner.compare(results, runner.load(args.baseline), args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+            for regression in regressions:
+                print(f"    {regression}")
+            return 1
+
+        print(f"\nNo regressions against {args.baseline}")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
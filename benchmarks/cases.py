@@ -0,0 +1,82 @@
+from typing import Callable, Dict, Tuple
+from models.line import Line
+from models.triangle import Triangle
+from benchmarks import datasets
+
+# a case takes the dataset size and returns the function to time along with the number of operations it performs.
+# building the dataset is done up front so it's never part of the measurement.
+Case = Callable[[int], Tuple[Callable[[], object], int]]
+
+CASES: Dict[str, Case] = {}
+
+def case(name: str):
+    def decorator(func: Case) -> Case:
+        CASES[name] = func
+        return func
+
+    return decorator
+
+@case("line.from_AB_coordinates")
+def from_AB_coordinates(n: int):
+    pairs = datasets.point_pairs(n)
+    def run():
+        for a, b in pairs:
+            Line.from_AB_coordinates(a, b)
+
+    return run, n
+
+@case("line.from_coefficients")
+def from_coefficients(n: int):
+    coefficients = datasets.coefficients(n)
+    def run():
+        for a, b, c in coefficients:
+            Line.from_coefficients(a, b, c)
+
+    return run, n
+
+@case("line.from_coefficients+anchors")
+def from_coefficients_with_anchors(n: int):
+    coefficients = datasets.coefficients(n)
+    def run():
+        for a, b, c in coefficients:
+            Line.from_coefficients(a, b, c).point_B
+
+    return run, n
+
+@case("line.points_on_line")
+def points_on_line(n: int):
+    lines = [Line.from_AB_coordinates(a, b) for a, b in datasets.point_pairs(n)]
+    window = (-datasets.COORDINATE_RANGE, datasets.COORDINATE_RANGE)
+    def run():
+        for line in lines:
+            for _ in line.points_on_line(x_range=window, y_range=window):
+                pass
+
+    return run, n
+
+@case("line.intersects_with_line_on_point")
+def intersects_with_line_on_point(n: int):
+    pairs = [(Line.from_coefficients(*p), Line.from_coefficients(*q)) for p, q in datasets.crossing_coefficient_pairs(n)]
+    def run():
+        for l1, l2 in pairs:
+            l1.intersects_with_line_on_point(l2)
+
+    return run, n
+
+@case("line.angle_with_line")
+def angle_with_line(n: int):
+    pairs = [(Line.from_coefficients(*p), Line.from_coefficients(*q)) for p, q in datasets.crossing_coefficient_pairs(n)]
+    def run():
+        for l1, l2 in pairs:
+            l1.angle_with_line(l2)
+
+    return run, n
+
+@case("triangle.from_vertices")
+def triangle_from_vertices(n: int):
+    vertices = datasets.triangles(n)
+    def run():
+        for a, b, c in vertices:
+            Triangle.from_vertices(a, b, c)
+
+    return run, n
@@ -0,0 +1,67 @@
+import random
+from typing import List, Tuple
+from models.point import Point
+
+# every dataset is generated from a fixed seed so runs on different machines (and baselines) measure the same work.
+SEED = 1729
+
+SIZES = {
+    "small": 1_000,
+    "medium": 10_000,
+    "large": 100_000,
+}
+
+COORDINATE_RANGE = 10_000
+
+def _point(rng: random.Random) -> Point:
+    return Point(rng.randint(-COORDINATE_RANGE, COORDINATE_RANGE), rng.randint(-COORDINATE_RANGE, COORDINATE_RANGE))
+
+def points(n: int, seed: int = SEED) -> List[Point]:
+    """Returns n random points with integer coordinates."""
+    rng = random.Random(seed)
+    return [_point(rng) for _ in range(n)]
+
+def point_pairs(n: int, seed: int = SEED) -> List[Tuple[Point, Point]]:
+    """Returns n pairs of distinct random points."""
+    rng = random.Random(seed)
+    pairs = []
+    while len(pairs) < n:
+        a, b = _point(rng), _point(rng)
+        if a != b:
+            pairs.append((a, b))
+
+    return pairs
+
+def coefficients(n: int, seed: int = SEED) -> List[Tuple[int, int, int]]:
+    """Returns n random line coefficients (a, b, c) with a and b not both 0."""
+    rng = random.Random(seed)
+    result = []
+    while len(result) < n:
+        a, b, c = (rng.randint(-1000, 1000) for _ in range(3))
+        if a or b:
+            result.append((a, b, c))
+
+    return result
+
+def crossing_coefficient_pairs(n: int, seed: int = SEED) -> List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]:
+    """Returns n pairs of random line coefficients whose lines are not parallel."""
+    rng = random.Random(seed)
+    pool = coefficients(2 * n + 64, seed)
+    pairs = []
+    while len(pairs) < n:
+        (a1, b1, c1), (a2, b2, c2) = rng.sample(pool, 2)
+        if a1 * b2 != a2 * b1:
+            pairs.append(((a1, b1, c1), (a2, b2, c2)))
+
+    return pairs
+
+def triangles(n: int, seed: int = SEED) -> List[Tuple[Point, Point, Point]]:
+    """Returns n random vertex triples that form proper (non collinear) triangles."""
+    rng = random.Random(seed)
+    result = []
+    while len(result) < n:
+        a, b, c = _point(rng), _point(rng), _point(rng)
+        if (b.x - a.x) * (c.y - a.y) != (b.y - a.y) * (c.x - a.x):
+            result.append((a, b, c))
+
+    return result
@@ -0,0 +1,65 @@
+import gc
+import json
+import time
+import tracemalloc
+from typing import Dict, List
+from benchmarks.cases import CASES
+
+Results = Dict[str, Dict[str, float]]
+
+def run_case(name: str, size: int, repeat: int = 3) -> Dict[str, float]:
+    """Times a benchmark case and measures its peak memory.
+
+    The time is the best of ``repeat`` runs, each on freshly built objects so cached properties don't carry over.
+    The memory is measured in a separate run since tracing allocations slows everything down.
+    Tracing starts before the inputs are built, so the peak covers them as well as whatever the operation allocates on top,
+    most of which is freed again before it returns.
+    """
+    factory = CASES[name]
+    best = float("inf")
+    for _ in range(repeat):
+        func, ops = factory(size)
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    func = None # frees the inputs of the last timed run
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func, ops = factory(size)
+        inputs, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "per_op_us": best / ops * 1e6,
+        "inputs_kib": inputs / 1024,
+        "peak_kib": peak / 1024,
+    }
+
+def compare(results: Results, baseline: Results, tolerance: float) -> List[str]:
+    """Returns a description of every result that is more than ``tolerance`` times worse than the baseline."""
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+
+        for metric, value in result.items():
+            old = baseline[key].get(metric)
+            if old and value > old * tolerance:
+                regressions.append(f"{key} {metric}: {value:.2f} vs baseline {old:.2f} ({value / old:.2f}x)")
+
+    return regressions
+
+def load(path: str) -> Results:
+    with open(path) as f:
+        return json.load(f)
+
+def save(results: Results, path: str):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=4, sort_keys=True)
+        f.write("\n")
@@ -1,12 +1,20 @@
-from models import Line, Point, Triangle, INFINITY
+from models import AffineTransform, Line, LineArray, LineInternTable, Parallelogram, Point, PointArray, Polygon, Triangle, TriangleArray, INFINITY, kernels
+from algorithms import IncrementalConvexHull, KDTree, LineIndex, TriangleIndex, Triangulation, convex_hull, delaunay_triangulation, hull_edges, iter_segment_intersections, parallel_classify_triangles, parallel_line_intersections, parallel_lines_from_AB_coordinates, segment_intersections
+from storage import FORMAT_VERSION, GeometryFile, load_geometry, mapped_coordinates, open_geometry, save_geometry, stream_binary, stream_csv, stream_lines, stream_triangles
+
+def _check_different(a: Point, b: Point):
+    # the same error `Line.from_AB_coordinates` used to raise when these helpers built a line.
+    if a == b:
+        raise ValueError("Expected different coordinates from point A and B, but got the same coordinates {}".format(a))
 
 def distance_bw_points(a: Point, b: Point):
-    l = Line.from_AB_coordinates(a, b)
-    return l.length
+    _check_different(a, b)
+    return kernels.distance(a.x, a.y, b.x, b.y)
 
 def find_ratio(a: Point, b: Point, c: Point):
-    line = Line.from_AB_coordinates(a, b)
-    return line.find_ratio_of_division_on_point(c)
+    _check_different(a, b)
+    return kernels.division_ratio(a.x, a.y, b.x, b.y, c.x, c.y)
 
 def slope_from_points(a: Point, b: Point):
-    return Line.from_AB_coordinates(a, b).slope
\ No newline at end of file
+    _check_different(a, b)
+    return kernels.slope(a.x, a.y, b.x, b.y)
\ No newline at end of file
@@ -0,0 +1,7 @@
+from .convex_hull import IncrementalConvexHull, convex_hull, hull_edges
+from .delaunay import Triangulation, delaunay_triangulation
+from .kd_tree import KDTree
+from .intersections import iter_segment_intersections, segment_intersections
+from .line_index import LineIndex
+from .parallel import parallel_classify_triangles, parallel_line_intersections, parallel_lines_from_AB_coordinates
+from .triangle_index import TriangleIndex
\ No newline at end of file
@@ -0,0 +1,62 @@
+import math
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+_Box = Tuple[Union[int, float], Union[int, float], Union[int, float], Union[int, float]]
+
+class _UniformGrid:
+    # a sparse uniform grid of square cells, each holding the indices of the bounding boxes (x0, y0, x1, y1) overlapping it.
+    # shared by the spatial indexes, which only differ in what the boxes are around and how candidates are checked.
+
+    __slots__ = ("cell", "x0", "y0", "nx", "ny", "cells")
+
+    def __init__(self, boxes: Sequence[_Box], cell_size: Optional[Union[int, float]] = None):
+        if not boxes:
+            raise ValueError("Expected at least one shape to index.")
+
+        x0 = min(b[0] for b in boxes)
+        y0 = min(b[1] for b in boxes)
+        x1 = max(b[2] for b in boxes)
+        y1 = max(b[3] for b in boxes)
+
+        if cell_size is None:
+            # big enough that most shapes only overlap a few cells,
+            # but no bigger than needed to spread the shapes out over the grid.
+            mean_extent = sum(max(b[2] - b[0], b[3] - b[1]) for b in boxes) / len(boxes)
+            cell_size = max(mean_extent, math.sqrt((x1 - x0) * (y1 - y0) / len(boxes))) or 1
+
+        elif cell_size <= 0:
+            raise ValueError(f"Expected a positive cell size, but got {cell_size}")
+
+        self.cell = cell_size
+        self.x0, self.y0 = x0, y0
+        self.nx = int((x1 - x0) // cell_size) + 1
+        self.ny = int((y1 - y0) // cell_size) + 1
+
+        self.cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for i, (bx0, by0, bx1, by1) in enumerate(boxes):
+            i0, j0 = self.cell_of(bx0, by0)
+            i1, j1 = self.cell_of(bx1, by1)
+            for ci in range(i0, i1 + 1):
+                for cj in range(j0, j1 + 1):
+                    self.cells[(ci, cj)].append(i)
+
+    def __repr__(self) -> str:
+        return f"cell_size={self.cell} grid={self.nx}x{self.ny}"
+
+    def cell_of(self, x, y) -> Tuple[int, int]:
+        return int((x - self.x0) // self.cell), int((y - self.y0) // self.cell)
+
+    def at(self, x, y) -> List[int]:
+        # the indices in the cell containing the point.
+        return self.cells.get(self.cell_of(x, y), [])
+
+    def candidates(self, i0: int, j0: int, i1: int, j1: int) -> Iterator[int]:
+        # the indices in every cell of the block of cells, without repeats.
+        seen = set()
+        for ci in range(max(i0, 0), min(i1, self.nx - 1) + 1):
+            for cj in range(max(j0, 0), min(j1, self.ny - 1) + 1):
+                for i in self.cells.get((ci, cj), ()):
+                    if i not in seen:
+                        seen.add(i)
+                        yield i
@@ -0,0 +1,167 @@
+import heapq
+from typing import Iterable, List, Sequence, Tuple, Union
+from models.line import Line
+from models.point import Point
+from models.point_array import PointArray
+from models.predicates import orient
+
+def _coordinates(points: Union[PointArray, Iterable[Point]]) -> Tuple[Sequence[Union[int, float]], Sequence[Union[int, float]]]:
+    if isinstance(points, PointArray):
+        return points.xs, points.ys
+
+    points = points if isinstance(points, Sequence) else list(points)
+    return [p.x for p in points], [p.y for p in points]
+
+def _monotone_chain(xs: Sequence[Union[int, float]], ys: Sequence[Union[int, float]], order: Sequence[int]) -> List[int]:
+    # Andrew's monotone chain over indices already sorted by x and then y.
+    # builds the lower and upper hull in one pass each, dropping every point that makes a clockwise (or no) turn.
+    def chain(indices):
+        hull = []
+        for k in indices:
+            x, y = xs[k], ys[k]
+            while len(hull) >= 2:
+                i, j = hull[-2], hull[-1]
+                if orient(xs[i], ys[i], xs[j], ys[j], x, y) > 0:
+                    break
+                hull.pop()
+
+            if not hull or xs[hull[-1]] != x or ys[hull[-1]] != y:
+                hull.append(k)
+
+        return hull
+
+    if not order:
+        return []
+
+    lower = chain(order)
+    upper = chain(reversed(order))
+    hull = lower[:-1] + upper[:-1]
+    # a single point or all points being the same.
+    return hull or [order[0]]
+
+def convex_hull(points: Union[PointArray, Iterable[Point]], *, presorted: bool = False) -> List[int]:
+    """Returns the convex hull of a set of points.
+
+    The hull is found with Andrew's monotone chain algorithm in O(n log n),
+    or O(n) if the points are already sorted by their x-coordinate and then y-coordinate.
+
+    .. note::
+        Points lying on an edge of the hull are not part of it.
+
+    Parameters
+    ----------
+    points : Union[:class:`.PointArray`, Iterable[:class:`.Point`]]
+        The points to find the hull of.
+    presorted : :class:`bool`
+        Whether the points are already sorted by their x-coordinate and then y-coordinate, by default False.
+
+    Returns
+    -------
+    List[:class:`int`]
+        The indices of the points on the hull in counter clockwise order, starting with the lowest of the leftmost points.
+    """
+    xs, ys = _coordinates(points)
+    order = range(len(xs)) if presorted else sorted(range(len(xs)), key=lambda i: (xs[i], ys[i]))
+    return _monotone_chain(xs, ys, order)
+
+def hull_edges(points: Union[PointArray, Sequence[Point]], hull: Sequence[int]) -> List[Line]:
+    """Returns the edges of a convex hull as lines.
+
+    Parameters
+    ----------
+    points : Union[:class:`.PointArray`, Sequence[:class:`.Point`]]
+        The points the hull was found from.
+    hull : Sequence[:class:`int`]
+        The indices of the points on the hull, as returned by `convex_hull`.
+
+    Returns
+    -------
+    List[:class:`.Line`]
+        The edges in counter clockwise order, each going from one hull point to the next.
+        Empty if the hull has less than two points.
+    """
+    if len(hull) < 2:
+        return []
+
+    vertices = [points[i] for i in hull]
+    if len(vertices) == 2:
+        return [Line.from_AB_coordinates(vertices[0], vertices[1])]
+
+    return [Line.from_AB_coordinates(a, b) for a, b in zip(vertices, vertices[1:] + vertices[:1])]
+
+class IncrementalConvexHull:
+    """A convex hull that grows as chunks of points stream in.
+
+    Only the points on the current hull are kept, in sorted order,
+    so adding a chunk of m points to a hull of h points costs O(m log m + h) and the whole stream never has to be held in memory.
+    Points are referred to by their position in the stream, counting across all chunks.
+
+    .. container:: operations
+
+        .. describe:: len(x)
+
+            Returns the number of points on the hull.
+    """
+
+    __slots__ = ("_sorted", "_count")
+
+    def __init__(self):
+        # (x, y, index) of the points on the hull sorted by x and then y.
+        self._sorted: List[Tuple[Union[int, float], Union[int, float], int]] = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def __repr__(self) -> str:
+        return f"<IncrementalConvexHull points_seen={self._count} hull_size={len(self)}>"
+
+    @property
+    def count(self) -> int:
+        """:class:`int`: The number of points added so far."""
+        return self._count
+
+    def add(self, points: Union[PointArray, Iterable[Point]]):
+        """Merges a chunk of points into the hull.
+
+        Parameters
+        ----------
+        points : Union[:class:`.PointArray`, Iterable[:class:`.Point`]]
+            The points to add.
+        """
+        xs, ys = _coordinates(points)
+        offset = self._count
+        self._count += len(xs)
+
+        chunk = sorted(zip(xs, ys, range(offset, self._count)))
+        merged = list(heapq.merge(self._sorted, chunk))
+        mxs = [p[0] for p in merged]
+        mys = [p[1] for p in merged]
+        hull = set(_monotone_chain(mxs, mys, range(len(merged))))
+        self._sorted = [p for k, p in enumerate(merged) if k in hull]
+
+    @property
+    def indices(self) -> List[int]:
+        """List[:class:`int`]: The stream indices of the points on the hull in counter clockwise order,
+        starting with the lowest of the leftmost points."""
+        return [self._sorted[k][2] for k in self._ordered()]
+
+    @property
+    def points(self) -> List[Point]:
+        """List[:class:`.Point`]: The points on the hull in counter clockwise order."""
+        return [Point(self._sorted[k][0], self._sorted[k][1]) for k in self._ordered()]
+
+    def _ordered(self) -> List[int]:
+        xs = [p[0] for p in self._sorted]
+        ys = [p[1] for p in self._sorted]
+        return _monotone_chain(xs, ys, range(len(self._sorted)))
+
+    def edges(self) -> List[Line]:
+        """Returns the edges of the hull as lines.
+
+        Returns
+        -------
+        List[:class:`.Line`]
+            The edges in counter clockwise order.
+        """
+        return hull_edges(self.points, range(len(self)))
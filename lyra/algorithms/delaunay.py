@@ -0,0 +1,438 @@
+from array import array
+import random
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from models.point import Point
+from models.point_array import PointArray
+from models.predicates import incircle, orient
+from models.triangle import Triangle
+
+# the vertex "at infinity". every hull edge has a ghost triangle with this vertex on the outside,
+# which means points outside the hull don't need a special case and no finite super triangle is needed.
+_GHOST = -1
+
+_HILBERT_ORDER = 16
+
+# the index of the next and the previous vertex of a triangle.
+_NEXT = (1, 2, 0)
+_PREV = (2, 0, 1)
+
+def _hilbert_key(x: int, y: int) -> int:
+    # the distance along a hilbert curve filling a 2^16 x 2^16 grid.
+    n = 1 << _HILBERT_ORDER
+    d = 0
+    s = n >> 1
+    while s:
+        rx = 1 if x & s else 0
+        ry = 1 if y & s else 0
+        d += s * s * ((3 * rx) ^ ry)
+        if ry == 0:
+            if rx == 1:
+                x, y = n - 1 - x, n - 1 - y
+            x, y = y, x
+        s >>= 1
+
+    return d
+
+class Triangulation:
+    """The result of a triangulation.
+
+    The triangles are stored as a flat buffer of vertex index triples into `Triangulation.points`,
+    every triple being in counter clockwise order. :class:`.Triangle` objects are only created when asked for.
+
+    .. note::
+        This class should not be manually instantiated.
+        Use `delaunay_triangulation` to create one.
+
+    .. container:: operations
+
+        .. describe:: len(x)
+
+            Returns the number of triangles.
+
+        .. describe:: x[i]
+
+            Returns the i-th triangle as a :class:`.Triangle`.
+
+        .. describe:: iter(x)
+
+            Iterates over the triangles as :class:`.Triangle` objects.
+    """
+
+    __slots__ = ("_points", "_indices")
+
+    def __init__(self, points: PointArray, indices: array):
+        self._points = points
+        self._indices = indices
+
+    def __new__(cls, *args, **kwargs):
+        raise RuntimeError(f"This class should not be instantiated manually. Use the provided functions to create a new {cls.__name__} object.")
+
+    def __len__(self) -> int:
+        return len(self._indices) // 3
+
+    def __getitem__(self, index: int) -> Triangle:
+        a, b, c = self.triple(index)
+        points = self._points
+        return Triangle.from_vertices(points[a], points[b], points[c])
+
+    def __iter__(self) -> Iterator[Triangle]:
+        return map(self.__getitem__, range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"<Triangulation points={len(self._points)} triangles={len(self)}>"
+
+    @classmethod
+    def _from_indices(cls, points: PointArray, indices: array) -> "Triangulation":
+        self = super().__new__(cls)
+        self.__init__(points, indices)
+        return self
+
+    @property
+    def points(self) -> PointArray:
+        """:class:`.PointArray`: The points that were triangulated."""
+        return self._points
+
+    @property
+    def indices(self) -> array:
+        """:class:`array.array`: The flat buffer of vertex indices, three per triangle."""
+        return self._indices
+
+    def triple(self, index: int) -> Tuple[int, int, int]:
+        """Returns the indices of the vertices of a triangle.
+
+        Parameters
+        ----------
+        index : :class:`int`
+            The index of the triangle.
+
+        Returns
+        -------
+        Tuple[:class:`int`, :class:`int`, :class:`int`]
+            The indices of the vertices into `Triangulation.points` in counter clockwise order.
+        """
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("triangle index out of range")
+
+        i = index * 3
+        return self._indices[i], self._indices[i + 1], self._indices[i + 2]
+
+    def triples(self) -> Iterator[Tuple[int, int, int]]:
+        """Returns a Generator yielding the vertex indices of every triangle.
+
+        Returns
+        -------
+        :class:`Generator`
+            a Generator object yielding tuples of three vertex indices.
+        """
+        it = iter(self._indices)
+        return zip(it, it, it)
+
+    def to_triangles(self) -> List[Triangle]:
+        """Returns every triangle as a list of :class:`.Triangle` objects.
+
+        Returns
+        -------
+        List[:class:`.Triangle`]
+            The list of triangles.
+        """
+        return list(self)
+
+class _BowyerWatson:
+    # incremental Bowyer-Watson triangulation.
+    #
+    # triangle t stores its vertices in counter clockwise order at verts[3t:3t + 3] and its neighbours at nbrs[3t:3t + 3],
+    # where neighbour i is the triangle across the edge opposite to vertex i.
+    # flat lists instead of a list per triangle, so the hot loops only index and don't allocate.
+    # ghost triangles (u, v, _GHOST) sit outside every hull edge (v, u).
+    #
+    # inserting a point finds the triangle it lies in by walking towards it from the last inserted point,
+    # removes every triangle whose circumcircle contains the point (the cavity)
+    # and connects the boundary of the cavity to the new point, reusing the slots of the removed triangles.
+
+    def __init__(self, xs: Sequence[Union[int, float]], ys: Sequence[Union[int, float]]):
+        # lists index faster than array buffers, which box a new object on every access.
+        self.xs = list(xs)
+        self.ys = list(ys)
+        self.verts: List[int] = []
+        self.nbrs: List[int] = []
+        self.alive = bytearray()
+        self.free: List[int] = []
+        self.last = -1
+
+    def orient(self, a: int, b: int, c: int):
+        # positive if a, b and c are in counter clockwise order, negative if clockwise and 0 if collinear.
+        # exact even for float coordinates, so rounding can't break the triangulation apart.
+        xs, ys = self.xs, self.ys
+        return orient(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c])
+
+    def conflicts(self, t: int, px, py) -> bool:
+        # whether the point (px, py) is inside the circumcircle of a triangle.
+        xs, ys, verts = self.xs, self.ys, self.verts
+        i = 3 * t
+        a, b, c = verts[i], verts[i + 1], verts[i + 2]
+        if c == _GHOST:
+            ax, ay, bx, by = xs[a], ys[a], xs[b], ys[b]
+            o = orient(ax, ay, bx, by, px, py)
+            if o != 0:
+                return o > 0
+
+            # on the line through the hull edge, only in conflict when strictly between its ends.
+            return (ax - px) * (bx - px) + (ay - py) * (by - py) < 0
+
+        return incircle(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c], px, py) > 0
+
+    def new_triangle(self, a: int, b: int, c: int) -> int:
+        # the ghost vertex is always kept last.
+        if a == _GHOST:
+            a, b, c = b, c, a
+        elif b == _GHOST:
+            a, b, c = c, a, b
+
+        verts, nbrs = self.verts, self.nbrs
+        if self.free:
+            t = self.free.pop()
+            i = 3 * t
+            verts[i] = a
+            verts[i + 1] = b
+            verts[i + 2] = c
+            nbrs[i] = nbrs[i + 1] = nbrs[i + 2] = -1
+            self.alive[t] = 1
+
+        else:
+            t = len(self.alive)
+            verts += (a, b, c)
+            nbrs += (-1, -1, -1)
+            self.alive.append(1)
+
+        return t
+
+    def link(self, triangles: Iterable[int]):
+        # connects the triangles sharing an edge, an edge u -> v of one triangle is v -> u in the other.
+        verts, nbrs = self.verts, self.nbrs
+        edges = {}
+        for t in triangles:
+            for i in range(3):
+                edge = (verts[3 * t + (i + 1) % 3], verts[3 * t + (i + 2) % 3])
+                other = edges.pop((edge[1], edge[0]), None)
+                if other is None:
+                    edges[edge] = 3 * t + i
+                else:
+                    nbrs[3 * t + i] = other // 3
+                    nbrs[other] = t
+
+    def start(self, a: int, b: int, c: int):
+        if self.orient(a, b, c) < 0:
+            b, c = c, b
+
+        t = self.new_triangle(a, b, c)
+        ghosts = [self.new_triangle(b, a, _GHOST), self.new_triangle(c, b, _GHOST), self.new_triangle(a, c, _GHOST)]
+        self.link([t] + ghosts)
+        self.last = t
+
+    def locate(self, px, py) -> Optional[int]:
+        # walks from the last created triangle towards the point.
+        # returns a triangle in conflict with the point or None if the point is a duplicate of a vertex.
+        xs, ys, verts, nbrs = self.xs, self.ys, self.verts, self.nbrs
+        t = self.last
+        for _ in range(len(self.alive) + 3):
+            i = 3 * t
+            a, b, c = verts[i], verts[i + 1], verts[i + 2]
+            if c == _GHOST:
+                return t
+
+            ax, ay, bx, by, cx, cy = xs[a], ys[a], xs[b], ys[b], xs[c], ys[c]
+            if orient(bx, by, cx, cy, px, py) < 0:
+                t = nbrs[i]
+            elif orient(cx, cy, ax, ay, px, py) < 0:
+                t = nbrs[i + 1]
+            elif orient(ax, ay, bx, by, px, py) < 0:
+                t = nbrs[i + 2]
+            elif (ax == px and ay == py) or (bx == px and by == py) or (cx == px and cy == py):
+                return None
+            else:
+                return t
+
+        # the walk can only cycle when floating point rounding makes the triangulation slightly non delaunay.
+        for t, alive in enumerate(self.alive):
+            if alive:
+                if any(v != _GHOST and xs[v] == px and ys[v] == py for v in verts[3 * t:3 * t + 3]):
+                    return None
+
+                if self.conflicts(t, px, py):
+                    return t
+
+        return None
+
+    def insert(self, p: int):
+        px, py = self.xs[p], self.ys[p]
+        t = self.locate(px, py)
+        if t is None:
+            return
+
+        xs, ys, verts, nbrs = self.xs, self.ys, self.verts, self.nbrs
+        cavity = [t]
+        in_cavity = {t}
+        boundary = [] # (u, v, n, j) for every edge u -> v of the cavity, n being the triangle outside and j the edge's index in it
+        for t in cavity: # grows while it's iterated
+            i = 3 * t
+            for e in (0, 1, 2):
+                n = nbrs[i + e]
+                if n in in_cavity:
+                    continue
+
+                # `self.conflicts(n, px, py)` inlined, this runs for every triangle around the cavity.
+                m = 3 * n
+                a, b, c = verts[m], verts[m + 1], verts[m + 2]
+                if c == _GHOST:
+                    ax, ay, bx, by = xs[a], ys[a], xs[b], ys[b]
+                    o = orient(ax, ay, bx, by, px, py)
+                    conflict = o > 0 if o != 0 else (ax - px) * (bx - px) + (ay - py) * (by - py) < 0
+                else:
+                    conflict = incircle(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c], px, py) > 0
+
+                if conflict:
+                    in_cavity.add(n)
+                    cavity.append(n)
+                else:
+                    j = 0 if nbrs[m] == t else 1 if nbrs[m + 1] == t else 2
+                    boundary.append((verts[i + _NEXT[e]], verts[i + _PREV[e]], n, j))
+
+        alive = self.alive
+        for t in cavity:
+            alive[t] = 0
+        free = self.free
+        free += cavity
+
+        # the new triangles (u, v, p) form a fan around p, the one starting at v is the neighbour across the edge v -> p.
+        starting_at = {}
+        for u, v, n, j in boundary:
+            # `self.new_triangle(u, v, p)` inlined, keeping track of where u ends up after the ghost vertex is moved last.
+            # p is always two places after u.
+            if u == _GHOST:
+                offset, a, b, c = 2, v, p, u
+            elif v == _GHOST:
+                offset, a, b, c = 1, p, u, v
+            else:
+                offset, a, b, c = 0, u, v, p
+
+            if free:
+                t = free.pop()
+                i = 3 * t
+                verts[i] = a
+                verts[i + 1] = b
+                verts[i + 2] = c
+                alive[t] = 1
+            else:
+                t = len(alive)
+                i = 3 * t
+                verts += (a, b, c)
+                nbrs += (-1, -1, -1)
+                alive.append(1)
+
+            nbrs[i + _PREV[offset]] = n
+            nbrs[3 * n + j] = t
+            starting_at[u] = i + offset
+            if offset == 0:
+                self.last = t
+
+        for u_at in starting_at.values():
+            # the triangle (v, w, p) is across the edge v -> p of the triangle (u, v, p) and the other way around.
+            i = u_at - u_at % 3
+            w_at = starting_at[verts[i + _NEXT[u_at - i]]]
+            k = w_at - w_at % 3
+            nbrs[u_at] = k // 3
+            nbrs[k + _NEXT[w_at - k]] = i // 3
+
+    def triangles(self) -> Iterator[int]:
+        verts = self.verts
+        for t, alive in enumerate(self.alive):
+            if alive and verts[3 * t + 2] != _GHOST:
+                yield from verts[3 * t:3 * t + 3]
+
+def _insertion_order(xs: Sequence[Union[int, float]], ys: Sequence[Union[int, float]], rng: random.Random) -> List[int]:
+    # biased randomized insertion order: the points are shuffled into rounds of doubling size
+    # and sorted along a hilbert curve within each round.
+    # the randomness keeps the expected amount of work at O(n log n) and the hilbert order keeps every walk short.
+    n = len(xs)
+    min_x, max_x, min_y, max_y = min(xs), max(xs), min(ys), max(ys)
+    span = max(max_x - min_x, max_y - min_y) or 1
+    scale = ((1 << _HILBERT_ORDER) - 1) / span
+
+    order = list(range(n))
+    rng.shuffle(order)
+    rounds = []
+    end = n
+    while end > 0:
+        start = end // 2 if end > 64 else 0
+        rounds.append(order[start:end])
+        end = start
+
+    result = []
+    for chunk in reversed(rounds):
+        chunk.sort(key=lambda i: _hilbert_key(int((xs[i] - min_x) * scale), int((ys[i] - min_y) * scale)))
+        result.extend(chunk)
+
+    return result
+
+def delaunay_triangulation(points: Union[PointArray, Iterable[Point]], seed: Optional[int] = 0) -> Triangulation:
+    """Returns the delaunay triangulation of a set of points.
+
+    The triangulation is built with the Bowyer-Watson algorithm, inserting the points in a biased randomized order
+    (random rounds, each sorted along a hilbert curve), which takes O(n log n) expected time.
+
+    .. note::
+        Integer coordinates are triangulated exactly.
+        Duplicate points are ignored and if all points are collinear, the triangulation is empty.
+
+    Parameters
+    ----------
+    points : Union[:class:`.PointArray`, Iterable[:class:`.Point`]]
+        The points to triangulate.
+    seed : Optional[:class:`int`]
+        The seed for the random insertion order, by default 0. Pass in None for a different order on every call.
+
+    Returns
+    -------
+    :class:`.Triangulation`
+        The triangulation, referring to the points by their index.
+    """
+    points = points if isinstance(points, PointArray) else PointArray.from_points(points)
+    xs, ys = points.xs, points.ys
+    indices = array("q")
+    if len(points) < 3:
+        return Triangulation._from_indices(points, indices)
+
+    order = _insertion_order(xs, ys, random.Random(seed))
+    bw = _BowyerWatson(xs, ys)
+
+    # the first triangle needs three points that aren't collinear, any skipped points are inserted after it.
+    a = order[0]
+    deferred = []
+    b = c = None
+    for k, i in enumerate(order[1:], 1):
+        if b is None:
+            if xs[i] != xs[a] or ys[i] != ys[a]:
+                b = i
+            else:
+                deferred.append(i)
+        elif bw.orient(a, b, i) != 0:
+            c = i
+            break
+        else:
+            deferred.append(i)
+
+    if c is None:
+        return Triangulation._from_indices(points, indices)
+
+    bw.start(a, b, c)
+    for i in deferred:
+        bw.insert(i)
+
+    for i in order[k + 1:]:
+        bw.insert(i)
+
+    indices.extend(bw.triangles())
+    return Triangulation._from_indices(points, indices)
@@ -0,0 +1,206 @@
+import heapq
+from collections import defaultdict
+from fractions import Fraction
+from numbers import Rational
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
+from models.line import Line
+from models.line_array import LineArray
+from models.point import Point
+
+# a segment is stored as (x1, y1, x2, y2) with (x1, y1) being the lexicographically smaller endpoint.
+# that's the endpoint the sweep line reaches first, or the lower one for vertical segments.
+_Segment = Tuple[Union[int, float], Union[int, float], Union[int, float], Union[int, float]]
+
+def _segments_from(lines: Union[Sequence[Line], LineArray]) -> List[_Segment]:
+    if isinstance(lines, LineArray):
+        A, B = lines.points_A, lines.points_B
+        coords = zip(A.xs, A.ys, B.xs, B.ys)
+
+    else:
+        coords = ((line.point_A.x, line.point_A.y, line.point_B.x, line.point_B.y) for line in lines)
+
+    return [(x1, y1, x2, y2) if (x1, y1) <= (x2, y2) else (x2, y2, x1, y1) for x1, y1, x2, y2 in coords]
+
+def _normalize(v):
+    # Fractions with a denominator of 1 are turned back into ints for nicer output.
+    return v.numerator if isinstance(v, Fraction) and v.denominator == 1 else v
+
+class _Sweep:
+    # the Bentley-Ottmann sweep line algorithm, as described in "Computational Geometry" by de Berg et al.
+    #
+    # the sweep line moves from left to right (and bottom to top on the same x) stopping at event points,
+    # which are the endpoints of the segments and the intersections found so far.
+    # the status is the list of segments crossing the sweep line ordered from bottom to top.
+    # only segments that are neighbours in the status can intersect next,
+    # so only O(1) pairs have to be checked at every event instead of all of them.
+    #
+    # the status is a sorted python list, searched with bisection.
+    # inserting and removing is a memmove which is fast enough in practice compared to a balanced tree written in python.
+
+    def __init__(self, segments: List[_Segment]):
+        self.segments = segments
+        self.exact = all(isinstance(v, Rational) for segment in segments for v in segment)
+        self.slopes = [self._div(y2 - y1, x2 - x1) if x1 != x2 else None for x1, y1, x2, y2 in segments]
+
+        self.queue: List[Tuple[Union[int, float], Union[int, float]]] = []
+        self.queued: Set[Tuple[Union[int, float], Union[int, float]]] = set()
+        self.starts: Dict[Tuple[Union[int, float], Union[int, float]], List[int]] = defaultdict(list)
+        # segments known to cross an event point in their interior.
+        # only needed since float rounding can place a computed intersection slightly off the segments.
+        self.crossings: Dict[Tuple[Union[int, float], Union[int, float]], Set[int]] = defaultdict(set)
+        self.status: List[int] = []
+
+        for i, (x1, y1, x2, y2) in enumerate(segments):
+            if (x1, y1) == (x2, y2):
+                raise ValueError(f"Expected different coordinates for both ends of the segment at index {i}, but got the same coordinates {Point(x1, y1)}")
+
+            self.starts[(x1, y1)].append(i)
+            self._push((x1, y1))
+            self._push((x2, y2))
+
+    def _div(self, a, b):
+        return Fraction(a, b) if self.exact else a / b
+
+    def _push(self, point):
+        if point not in self.queued:
+            self.queued.add(point)
+            heapq.heappush(self.queue, point)
+
+    def _y_at(self, i: int, x, y):
+        # the y-coordinate of the segment where it crosses the vertical line through x.
+        # vertical segments are only in the status while the sweep line is on them,
+        # so they are considered to cross it at the current event point.
+        x1, y1, x2, y2 = self.segments[i]
+        if x1 == x2:
+            return y
+
+        if x == x1:
+            return y1
+
+        if x == x2:
+            return y2
+
+        return y1 + self.slopes[i] * (x - x1)
+
+    def _slope_key(self, i: int):
+        slope = self.slopes[i]
+        return (1, 0) if slope is None else (0, slope)
+
+    def _intersection(self, i: int, j: int):
+        x1, y1, x2, y2 = self.segments[i]
+        x3, y3, x4, y4 = self.segments[j]
+        d = (x2 - x1) * (y4 - y3) - (y2 - y1) * (x4 - x3)
+        if d == 0: # parallel or collinear, overlaps are reported on the endpoints.
+            return None
+
+        t = self._div((x3 - x1) * (y4 - y3) - (y3 - y1) * (x4 - x3), d)
+        u = self._div((x3 - x1) * (y2 - y1) - (y3 - y1) * (x2 - x1), d)
+        if not (0 <= t <= 1 and 0 <= u <= 1):
+            return None
+
+        return (_normalize(x1 + t * (x2 - x1)), _normalize(y1 + t * (y2 - y1)))
+
+    def _check(self, i: int, j: int, point):
+        q = self._intersection(i, j)
+        if q is not None and q > point:
+            self.crossings[q].update((i, j))
+            self._push(q)
+
+    def _bisect(self, x, y, right: bool) -> int:
+        lo, hi = 0, len(self.status)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            key = self._y_at(self.status[mid], x, y)
+            if key < y or (right and key == y):
+                lo = mid + 1
+            else:
+                hi = mid
+
+        return lo
+
+    def run(self) -> Iterator[Tuple[Point, Tuple[int, ...]]]:
+        status = self.status
+        while self.queue:
+            point = heapq.heappop(self.queue)
+            self.queued.discard(point)
+            x, y = point
+
+            upper = self.starts.pop(point, [])
+            lo, hi = self._bisect(x, y, False), self._bisect(x, y, True)
+            through = set(status[lo:hi])
+
+            crossing = self.crossings.pop(point, set())
+            for i in crossing - through:
+                if i in status:
+                    idx = status.index(i)
+                    lo, hi = min(lo, idx), max(hi, idx + 1)
+                    through.add(i)
+
+            lower = {i for i in through if self.segments[i][2:] == point}
+            contains = through - lower
+
+            involved = set(upper) | through
+            if len(involved) > 1:
+                yield Point(x, y), tuple(sorted(involved))
+
+            # everything through the point is removed and the segments continuing past it
+            # are inserted back in the order they leave the point, which reverses the order of the crossing ones.
+            remaining = [i for i in status[lo:hi] if i not in through]
+            new = sorted(set(upper) | contains, key=self._slope_key)
+            status[lo:hi] = remaining + new
+            lo += len(remaining)
+
+            if not new:
+                if 0 < lo < len(status):
+                    self._check(status[lo - 1], status[lo], point)
+
+            else:
+                if lo > 0:
+                    self._check(status[lo - 1], status[lo], point)
+
+                last = lo + len(new) - 1
+                if last + 1 < len(status):
+                    self._check(status[last], status[last + 1], point)
+
+def iter_segment_intersections(lines: Union[Sequence[Line], LineArray]) -> Iterator[Tuple[Point, Tuple[int, ...]]]:
+    """Returns a Generator yielding every point where two or more segments meet.
+
+    Every line is treated as the segment from `Line.point_A` to `Line.point_B`.
+    The intersections are found with a Bentley-Ottmann sweep in O((n + k) log n) comparisons
+    for n segments and k intersections, instead of checking every pair of segments.
+    Intersections are yielded as soon as the sweep line passes them, ordered by their x-coordinate and then y-coordinate,
+    so huge outputs don't have to be held in memory.
+
+    .. note::
+        If all coordinates are integers or fractions, the intersections are calculated exactly
+        and non integer coordinates are returned as :class:`fractions.Fraction` objects.
+        Collinear overlapping segments are reported at the endpoints of their overlap.
+
+    Parameters
+    ----------
+    lines : Union[Sequence[:class:`.Line`], :class:`.LineArray`]
+        The segments to intersect.
+
+    Returns
+    -------
+    :class:`Generator`
+        a Generator object yielding tuples of the :class:`.Point` of intersection and the sorted indices of all segments through it.
+    """
+    return _Sweep(_segments_from(lines)).run()
+
+def segment_intersections(lines: Union[Sequence[Line], LineArray]) -> List[Tuple[Point, Tuple[int, ...]]]:
+    """Returns every point where two or more segments meet.
+
+    This is the same as `iter_segment_intersections` but collects the results in a list.
+
+    Parameters
+    ----------
+    lines : Union[Sequence[:class:`.Line`], :class:`.LineArray`]
+        The segments to intersect.
+
+    Returns
+    -------
+    List[Tuple[:class:`.Point`, Tuple[:class:`int`, ...]]]
+        The points of intersection along with the sorted indices of all segments through them.
+    """
+    return list(iter_segment_intersections(lines))
@@ -0,0 +1,317 @@
+from array import array
+import heapq
+import math
+from typing import Iterable, List, Optional, Tuple, Union
+from models.point import Point
+from models.point_array import PointArray
+
+# how many points of a node are looked at to find the axis they are most spread out along.
+_SPREAD_SAMPLE = 64
+
+class KDTree:
+    """A k-d tree over many points answering nearest neighbour, radius and closest pair queries in logarithmic time.
+
+    The tree is built in one go by splitting the points at the median of the coordinate they are (roughly) most spread out along,
+    until at most ``leaf_size`` points are left in a node. It's balanced by construction and implicit,
+    the points are only reordered so every node covers a contiguous range of them, and only a split axis and value are stored per node.
+
+    Distances are compared squared, so every query is exact for integer coordinates.
+    Ties are broken by the position of the points, the lowest index first.
+
+    .. container:: operations
+
+        .. describe:: len(x)
+
+            Returns the number of indexed points.
+
+    Parameters
+    ----------
+    points : Union[:class:`.PointArray`, Iterable[:class:`.Point`]]
+        The points to index. Query results refer to them by their position in this sequence.
+    leaf_size : :class:`int`
+        The largest number of points a leaf holds, which are scanned one by one. By default 16.
+    """
+
+    __slots__ = ("_xs", "_ys", "_ids", "_axes", "_splits", "_leaf_size")
+
+    # the tree is stored like a binary heap: node k covers the points [lo, hi) and its children are nodes 2k + 1 and 2k + 2,
+    # covering [lo, mid) and [mid, hi) with `mid = (lo + hi) // 2`. every point of the left child has a coordinate along the split axis
+    # no greater than the split value of the node, and every point of the right child no smaller.
+
+    def __init__(self, points: Union[PointArray, Iterable[Point]], leaf_size: int = 16):
+        points = points if isinstance(points, PointArray) else PointArray.from_points(points)
+        if not len(points):
+            raise ValueError("Expected at least one point to index.")
+
+        if leaf_size < 1:
+            raise ValueError(f"Expected a leaf size of at least 1, but got {leaf_size}")
+
+        xs, ys = points.xs, points.ys
+        n = len(points)
+
+        size, depth = n, 0
+        while size > leaf_size:
+            size = (size + 1) // 2
+            depth += 1
+
+        typecode = points.typecode
+        axes = bytearray(2 ** (depth + 1) - 1)
+        splits = array(typecode, bytes(len(axes) * array(typecode).itemsize))
+        order = list(range(n))
+        stack = [(0, 0, n)]
+        while stack:
+            node, lo, hi = stack.pop()
+            if hi - lo <= leaf_size:
+                continue
+
+            part = order[lo:hi]
+            # the spread is only estimated from a sample of the points, it's just a heuristic to keep the cells square.
+            sample = part[::max(1, len(part) // _SPREAD_SAMPLE)]
+            sample_xs = list(map(xs.__getitem__, sample))
+            sample_ys = list(map(ys.__getitem__, sample))
+            axis = 0 if max(sample_xs) - min(sample_xs) >= max(sample_ys) - min(sample_ys) else 1
+            axes[node] = axis
+            # a full sort instead of a selection, since sorting runs in C.
+            # children split along the same axis get an already sorted range, which sorts in linear time.
+            coordinates = xs if axis == 0 else ys
+            part.sort(key=coordinates.__getitem__)
+            order[lo:hi] = part
+
+            mid = (lo + hi) // 2
+            splits[node] = coordinates[part[mid - lo]]
+            stack.append((2 * node + 1, lo, mid))
+            stack.append((2 * node + 2, mid, hi))
+
+        self._xs = array(xs.typecode, map(xs.__getitem__, order))
+        self._ys = array(ys.typecode, map(ys.__getitem__, order))
+        self._ids = array("q", order)
+        self._axes = axes
+        self._splits = splits
+        self._leaf_size = leaf_size
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __repr__(self) -> str:
+        return f"<KDTree len={len(self)} leaf_size={self._leaf_size}>"
+
+    def _nearest(self, x, y, k: int) -> List[Tuple[Union[int, float], int]]:
+        # the k closest points as (squared distance, index) pairs, closest first.
+        xs, ys, ids, axes, splits, leaf_size = self._xs, self._ys, self._ids, self._axes, self._splits, self._leaf_size
+        best: List[Tuple[Union[int, float], int]] = [] # max heap of (-squared distance, -index)
+        # (node, lo, hi, a lower bound of the squared distance to anything in the node)
+        stack = [(0, 0, len(ids), 0)]
+        while stack:
+            node, lo, hi, bound = stack.pop()
+            if len(best) == k and bound > -best[0][0]:
+                continue
+
+            if hi - lo <= leaf_size:
+                for p in range(lo, hi):
+                    dx, dy = xs[p] - x, ys[p] - y
+                    item = (-(dx * dx + dy * dy), -ids[p])
+                    if len(best) < k:
+                        heapq.heappush(best, item)
+                    elif item > best[0]:
+                        heapq.heapreplace(best, item)
+                continue
+
+            mid = (lo + hi) // 2
+            diff = (x if axes[node] == 0 else y) - splits[node]
+            # the far side is pushed first so the near side is searched first.
+            far_bound = max(bound, diff * diff)
+            if diff < 0:
+                stack.append((2 * node + 2, mid, hi, far_bound))
+                stack.append((2 * node + 1, lo, mid, bound))
+            else:
+                stack.append((2 * node + 1, lo, mid, far_bound))
+                stack.append((2 * node + 2, mid, hi, bound))
+
+        return sorted((-d, -i) for d, i in best)
+
+    def nearest(self, point: Point, k: int = 1) -> List[Tuple[int, float]]:
+        """Returns the points closest to a point.
+
+        Parameters
+        ----------
+        point : :class:`.Point`
+            The point to search around.
+        k : :class:`int`
+            The number of points to return, by default 1.
+
+        Returns
+        -------
+        List[Tuple[:class:`int`, :class:`float`]]
+            The indices of the closest points and their distance to the point, closest first.
+            Fewer than k are returned if there are not enough points.
+
+        Raises
+        ------
+        ValueError
+            If k is less than 1.
+        """
+        if k < 1:
+            raise ValueError(f"Expected k to be at least 1, but got {k}")
+
+        return [(i, math.sqrt(d)) for d, i in self._nearest(point.x, point.y, k)]
+
+    def nearest_many(self, points: Union[PointArray, Iterable[Point]], k: int = 1) -> Tuple[array, array]:
+        """Finds the closest points of a whole batch of points, as `KDTree.nearest` does.
+
+        Parameters
+        ----------
+        points : Union[:class:`.PointArray`, Iterable[:class:`.Point`]]
+            The points to search around.
+        k : :class:`int`
+            The number of points to find for every point, by default 1. It's capped at the number of indexed points.
+
+        Returns
+        -------
+        Tuple[:class:`array.array`, :class:`array.array`]
+            An int64 buffer of indices and a float64 buffer of distances, holding the k closest points
+            of the first point (closest first), then the k closest points of the second one and so on.
+
+        Raises
+        ------
+        ValueError
+            If k is less than 1.
+        """
+        if k < 1:
+            raise ValueError(f"Expected k to be at least 1, but got {k}")
+
+        points = points if isinstance(points, PointArray) else PointArray.from_points(points)
+        nearest = self._nearest
+        k = min(k, len(self))
+        indices, distances = array("q"), array("d")
+        for x, y in zip(points.xs, points.ys):
+            for d, i in nearest(x, y, k):
+                indices.append(i)
+                distances.append(math.sqrt(d))
+
+        return indices, distances
+
+    def _within(self, x, y, radius) -> List[int]:
+        xs, ys, ids, axes, splits, leaf_size = self._xs, self._ys, self._ids, self._axes, self._splits, self._leaf_size
+        r2 = radius * radius
+        found = []
+        stack = [(0, 0, len(ids))]
+        while stack:
+            node, lo, hi = stack.pop()
+            if hi - lo <= leaf_size:
+                for p in range(lo, hi):
+                    dx, dy = xs[p] - x, ys[p] - y
+                    if dx * dx + dy * dy <= r2:
+                        found.append(ids[p])
+                continue
+
+            mid = (lo + hi) // 2
+            diff = (x if axes[node] == 0 else y) - splits[node]
+            if diff <= 0 or diff * diff <= r2:
+                stack.append((2 * node + 1, lo, mid))
+            if diff >= 0 or diff * diff <= r2:
+                stack.append((2 * node + 2, mid, hi))
+
+        found.sort()
+        return found
+
+    def within(self, point: Point, radius: Union[int, float]) -> List[int]:
+        """Returns the points within a distance of a point.
+
+        Parameters
+        ----------
+        point : :class:`.Point`
+            The point to search around.
+        radius : Union[:class:`int`, :class:`float`]
+            How far away from the point a point may be to still count, the boundary included.
+
+        Returns
+        -------
+        List[:class:`int`]
+            The sorted indices of the points.
+
+        Raises
+        ------
+        ValueError
+            If the radius is negative.
+        """
+        if not radius >= 0: # NaN included
+            raise ValueError(f"Expected a radius of at least 0, but got {radius}")
+
+        return self._within(point.x, point.y, radius)
+
+    def within_many(self, points: Union[PointArray, Iterable[Point]], radius: Union[int, float]) -> List[List[int]]:
+        """Finds the points within a distance of every point of a whole batch, as `KDTree.within` does.
+
+        Parameters
+        ----------
+        points : Union[:class:`.PointArray`, Iterable[:class:`.Point`]]
+            The points to search around.
+        radius : Union[:class:`int`, :class:`float`]
+            How far away from a point a point may be to still count, the boundary included.
+
+        Returns
+        -------
+        List[List[:class:`int`]]
+            The sorted indices of the points around every point.
+
+        Raises
+        ------
+        ValueError
+            If the radius is negative.
+        """
+        if not radius >= 0: # NaN included
+            raise ValueError(f"Expected a radius of at least 0, but got {radius}")
+
+        points = points if isinstance(points, PointArray) else PointArray.from_points(points)
+        within = self._within
+        return [within(x, y, radius) for x, y in zip(points.xs, points.ys)]
+
+    def closest_pair(self) -> Optional[Tuple[int, int, float]]:
+        """Returns the two indexed points closest to each other.
+
+        Every point searches the tree for a closer point than the closest pair found so far,
+        which prunes all but a few leaves around it, for O(n log n) time overall. Duplicate points are a pair at distance 0.
+
+        Returns
+        -------
+        Optional[Tuple[:class:`int`, :class:`int`, :class:`float`]]
+            The indices of the two points, lowest first, and their distance, or None if there are less than two points.
+            Of several pairs at the same distance, the one with the lowest indices is returned.
+        """
+        xs, ys, ids, axes, splits, leaf_size = self._xs, self._ys, self._ids, self._axes, self._splits, self._leaf_size
+        n = len(ids)
+        if n < 2:
+            return None
+
+        best = None # (squared distance, i, j)
+        for q in range(n):
+            x, y, iq = xs[q], ys[q], ids[q]
+            stack = [(0, 0, n, 0)]
+            while stack:
+                node, lo, hi, bound = stack.pop()
+                if best is not None and bound > best[0]:
+                    continue
+
+                if hi - lo <= leaf_size:
+                    for p in range(lo, hi):
+                        if p == q:
+                            continue
+                        dx, dy = xs[p] - x, ys[p] - y
+                        ip = ids[p]
+                        pair = (dx * dx + dy * dy, iq, ip) if iq < ip else (dx * dx + dy * dy, ip, iq)
+                        if best is None or pair < best:
+                            best = pair
+                    continue
+
+                mid = (lo + hi) // 2
+                diff = (x if axes[node] == 0 else y) - splits[node]
+                far_bound = max(bound, diff * diff)
+                if diff < 0:
+                    stack.append((2 * node + 2, mid, hi, far_bound))
+                    stack.append((2 * node + 1, lo, mid, bound))
+                else:
+                    stack.append((2 * node + 1, lo, mid, far_bound))
+                    stack.append((2 * node + 2, mid, hi, bound))
+
+        d, i, j = best
+        return i, j, math.sqrt(d)
@@ -0,0 +1,197 @@
+import heapq
+import math
+from typing import List, Optional, Sequence, Tuple, Union
+from models.line import Line
+from models.line_array import LineArray
+from models.point import Point
+from models.predicates import orient
+from algorithms._grid import _UniformGrid
+from algorithms.intersections import _segments_from
+
+class LineIndex:
+    """A uniform grid over the bounding boxes of many segments, built once to answer spatial queries in sub linear time.
+
+    Every line is treated as the segment from `Line.point_A` to `Line.point_B`
+    and registered in every grid cell its bounding box overlaps.
+    A query then only has to look at the segments in the cells around it instead of all of them.
+
+    .. container:: operations
+
+        .. describe:: len(x)
+
+            Returns the number of indexed segments.
+
+    Parameters
+    ----------
+    lines : Union[Sequence[:class:`.Line`], :class:`.LineArray`]
+        The lines to index. Query results refer to them by their position in this sequence.
+    cell_size : Optional[Union[:class:`int`, :class:`float`]]
+        The width and height of a grid cell. By default this is picked from the size of the segments and how spread out they are.
+    """
+
+    __slots__ = ("_segments", "_grid")
+
+    def __init__(self, lines: Union[Sequence[Line], LineArray], cell_size: Optional[Union[int, float]] = None):
+        self._segments = segments = _segments_from(lines)
+        if not segments:
+            raise ValueError("Expected at least one line to index.")
+
+        self._grid = _UniformGrid([(x1, min(y1, y2), x2, max(y1, y2)) for x1, y1, x2, y2 in segments], cell_size)
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def __repr__(self) -> str:
+        return f"<LineIndex len={len(self)} {self._grid!r}>"
+
+    def _distance(self, i: int, x, y) -> float:
+        # distance from the point to the closest point of the segment.
+        x1, y1, x2, y2 = self._segments[i]
+        dx, dy = x2 - x1, y2 - y1
+        t = ((x - x1) * dx + (y - y1) * dy) / (dx * dx + dy * dy)
+        t = min(1, max(0, t))
+        return math.hypot(x - (x1 + t * dx), y - (y1 + t * dy))
+
+    def _contains(self, i: int, x, y) -> bool:
+        x1, y1, x2, y2 = self._segments[i]
+        return (
+            orient(x1, y1, x2, y2, x, y) == 0
+            and x1 <= x <= x2
+            and min(y1, y2) <= y <= max(y1, y2)
+        )
+
+    def lines_through(self, point: Point, tolerance: Union[int, float] = 0) -> List[int]:
+        """Returns the indices of the segments that pass through or near a point.
+
+        Parameters
+        ----------
+        point : :class:`.Point`
+            The point to check.
+        tolerance : Union[:class:`int`, :class:`float`]
+            How far away from the point a segment may be to still count, by default 0.
+            With a tolerance of 0 the check is exact for integer and fraction coordinates.
+
+        Returns
+        -------
+        List[:class:`int`]
+            The sorted indices of the segments.
+        """
+        x, y = point.x, point.y
+        i0, j0 = self._grid.cell_of(x - tolerance, y - tolerance)
+        i1, j1 = self._grid.cell_of(x + tolerance, y + tolerance)
+        if tolerance:
+            hits = (i for i in self._grid.candidates(i0, j0, i1, j1) if self._distance(i, x, y) <= tolerance)
+        else:
+            hits = (i for i in self._grid.candidates(i0, j0, i1, j1) if self._contains(i, x, y))
+
+        return sorted(hits)
+
+    def nearest(self, point: Point, k: int = 1) -> List[Tuple[int, float]]:
+        """Returns the segments closest to a point.
+
+        The grid is searched in growing rings of cells around the point, starting at the first ring that reaches the grid,
+        and stopping as soon as no unvisited cell can hold anything closer.
+
+        Parameters
+        ----------
+        point : :class:`.Point`
+            The point to search around.
+        k : :class:`int`
+            The number of segments to return, by default 1.
+
+        Returns
+        -------
+        List[Tuple[:class:`int`, :class:`float`]]
+            The indices of the closest segments and their distance to the point, closest first.
+
+        Raises
+        ------
+        ValueError
+            If k is less than 1.
+        """
+        if k < 1:
+            raise ValueError(f"Expected k to be at least 1, but got {k}")
+
+        x, y = point.x, point.y
+        grid = self._grid
+        ci, cj = grid.cell_of(x, y)
+        max_ring = max(ci, grid.nx - 1 - ci, cj, grid.ny - 1 - cj)
+        # rings closer than this lie entirely outside the grid for a point outside of it, so they are skipped.
+        first_ring = max(0, -ci, ci - (grid.nx - 1), -cj, cj - (grid.ny - 1))
+        best: List[Tuple[float, int]] = [] # max heap of (-distance, -index)
+        seen = set()
+
+        for r in range(first_ring, max_ring + 1):
+            ring = grid.candidates(ci - r, cj - r, ci + r, cj + r) if r == 0 else (
+                i
+                for i0, j0, i1, j1 in (
+                    (ci - r, cj - r, ci + r, cj - r), (ci - r, cj + r, ci + r, cj + r),
+                    (ci - r, cj - r + 1, ci - r, cj + r - 1), (ci + r, cj - r + 1, ci + r, cj + r - 1),
+                )
+                for i in grid.candidates(i0, j0, i1, j1)
+            )
+            for i in ring:
+                if i in seen:
+                    continue
+                seen.add(i)
+                d = self._distance(i, x, y)
+                if len(best) < k:
+                    heapq.heappush(best, (-d, -i))
+                elif (-d, -i) > best[0]:
+                    heapq.heapreplace(best, (-d, -i))
+
+            if len(best) == k:
+                # the closest anything outside the rings searched so far can be.
+                bound = min(
+                    x - (grid.x0 + (ci - r) * grid.cell), grid.x0 + (ci + r + 1) * grid.cell - x,
+                    y - (grid.y0 + (cj - r) * grid.cell), grid.y0 + (cj + r + 1) * grid.cell - y,
+                )
+                if bound >= -best[0][0]:
+                    break
+
+        return [(-i, -d) for d, i in sorted(best, reverse=True)]
+
+    def query_window(self, x_min: Union[int, float], y_min: Union[int, float], x_max: Union[int, float], y_max: Union[int, float]) -> List[int]:
+        """Returns the indices of the segments that cross a rectangular window.
+
+        Parameters
+        ----------
+        x_min : Union[:class:`int`, :class:`float`]
+            The left edge of the window.
+        y_min : Union[:class:`int`, :class:`float`]
+            The bottom edge of the window.
+        x_max : Union[:class:`int`, :class:`float`]
+            The right edge of the window.
+        y_max : Union[:class:`int`, :class:`float`]
+            The top edge of the window.
+
+        Returns
+        -------
+        List[:class:`int`]
+            The sorted indices of the segments with at least one point inside the window (edges included).
+        """
+        i0, j0 = self._grid.cell_of(x_min, y_min)
+        i1, j1 = self._grid.cell_of(x_max, y_max)
+        return sorted(i for i in self._grid.candidates(i0, j0, i1, j1) if self._crosses_window(i, x_min, y_min, x_max, y_max))
+
+    def _crosses_window(self, i: int, x_min, y_min, x_max, y_max) -> bool:
+        # Liang-Barsky clipping of the segment against the window.
+        x1, y1, x2, y2 = self._segments[i]
+        dx, dy = x2 - x1, y2 - y1
+        t0, t1 = 0, 1
+        for p, q in ((-dx, x1 - x_min), (dx, x_max - x1), (-dy, y1 - y_min), (dy, y_max - y1)):
+            if p == 0:
+                if q < 0:
+                    return False
+                continue
+
+            t = q / p
+            if p < 0:
+                t0 = max(t0, t)
+            else:
+                t1 = min(t1, t)
+
+            if t0 > t1:
+                return False
+
+        return True
@@ -0,0 +1,309 @@
+"""Batch operations spread across a pool of worker processes.
+
+The input columns are copied once into a shared memory block and every worker reads its chunk
+and writes its results straight from and into shared memory, so no geometry objects are ever pickled between processes.
+Batches fitting in a single chunk are processed in the calling process without starting any workers.
+"""
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+import os
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from models.line import Line
+from models.line_array import LineArray
+from models.point import Point
+from models.point_array import PointArray
+from models.triangle_array import TriangleArray, _determinants
+
+# chunks smaller than this cost more to send to a worker than to process in place.
+_MIN_CHUNK_SIZE = 10_000
+
+class _SharedColumns:
+    # equally long columns of machine values laid out one after the other in a single shared memory block.
+
+    __slots__ = ("memory", "typecodes", "length", "views")
+
+    def __init__(self, typecodes: str, length: int, name: Optional[str] = None):
+        self.typecodes = typecodes
+        self.length = length
+        sizes = [array(typecode).itemsize * length for typecode in typecodes]
+        self.memory = SharedMemory(name, create=name is None, size=sum(sizes) if name is None else 0)
+
+        self.views = []
+        offset = 0
+        for typecode, size in zip(typecodes, sizes):
+            self.views.append(self.memory.buf[offset:offset + size].cast(typecode))
+            offset += size
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    def read(self, i: int, start: int = 0, stop: Optional[int] = None) -> array:
+        # copies a column (or part of it) out of shared memory.
+        column = array(self.typecodes[i])
+        with self.views[i][start:stop] as part, part.cast("B") as raw:
+            column.frombytes(raw)
+
+        return column
+
+    def close(self, unlink: bool = False):
+        # every view has to be released before the block can be closed.
+        for view in self.views:
+            view.release()
+
+        self.views.clear()
+        self.memory.close()
+        if unlink:
+            self.memory.unlink()
+
+# each kernel processes the rows [start, stop) of the input columns and writes the same rows of the output columns.
+
+def _lines_kernel(start: int, stop: int, inputs: _SharedColumns, outputs: _SharedColumns):
+    typecode = inputs.typecodes[0]
+    x1, y1, x2, y2 = (inputs.read(i, start, stop) for i in range(4))
+    for i, (ax, ay, bx, by) in enumerate(zip(x1, y1, x2, y2), start):
+        if ax == bx and ay == by:
+            raise ValueError("Expected different coordinates from point A and B, but got the same coordinates {} at index {}".format(Point(ax, ay), i))
+
+    lines = LineArray.from_AB_coordinates(PointArray(x1, y1, typecode), PointArray(x2, y2, typecode))
+    columns = (lines.x_coefficients, lines.y_coefficients, lines.constants, lines.slopes, lines.lengths, lines.midpoints.xs, lines.midpoints.ys)
+    for view, column in zip(outputs.views, columns):
+        view[start:stop] = column
+
+def _triangles_kernel(start: int, stop: int, inputs: _SharedColumns, outputs: _SharedColumns):
+    typecode = inputs.typecodes[0]
+    ax, ay, bx, by, cx, cy = (inputs.read(i, start, stop) for i in range(6))
+    det = _determinants(ax, ay, bx, by, cx, cy, typecode, start)
+
+    triangles = TriangleArray._from_columns(PointArray(ax, ay, typecode), PointArray(bx, by, typecode), PointArray(cx, cy, typecode), det)
+    columns = (det, triangles.is_isoceles, triangles.is_equilateral, triangles.is_right_angled)
+    for view, column in zip(outputs.views, columns):
+        view[start:stop] = column
+
+def _intersections_kernel(start: int, stop: int, inputs: _SharedColumns, outputs: _SharedColumns):
+    # the same formula as `Line.intersects_with_line_on_point`, with NaN coordinates for parallel lines.
+    a1, b1, c1, a2, b2, c2 = (inputs.read(i, start, stop) for i in range(6))
+    nan = float("nan")
+    xs, ys = array("d"), array("d")
+    for a1_, b1_, c1_, a2_, b2_, c2_ in zip(a1, b1, c1, a2, b2, c2):
+        den = a1_ * b2_ - a2_ * b1_
+        if den == 0:
+            xs.append(nan)
+            ys.append(nan)
+        else:
+            xs.append((b1_ * c2_ - b2_ * c1_) / den)
+            ys.append((c1_ * a2_ - c2_ * a1_) / den)
+
+    outputs.views[0][start:stop] = xs
+    outputs.views[1][start:stop] = ys
+
+_KERNELS: Dict[str, Callable[[int, int, _SharedColumns, _SharedColumns], None]] = {
+    "lines": _lines_kernel,
+    "triangles": _triangles_kernel,
+    "intersections": _intersections_kernel,
+}
+
+def _run_chunk(task: Tuple[str, str, str, str, str, int, int, int]):
+    # runs in the worker processes, which only ever receive the names of the shared memory blocks.
+    kernel, input_name, input_typecodes, output_name, output_typecodes, length, start, stop = task
+    inputs = _SharedColumns(input_typecodes, length, input_name)
+    outputs = _SharedColumns(output_typecodes, length, output_name)
+    try:
+        _KERNELS[kernel](start, stop, inputs, outputs)
+    finally:
+        inputs.close()
+        outputs.close()
+
+def _execute(kernel: str, columns: Sequence[array], output_typecodes: str, workers: Optional[int], chunk_size: Optional[int], executor: Optional[Executor]) -> List[array]:
+    length = len(columns[0])
+    if not length:
+        return [array(typecode) for typecode in output_typecodes]
+
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(_MIN_CHUNK_SIZE, -(-length // (4 * workers)))
+
+    inputs = _SharedColumns("".join(column.typecode for column in columns), length)
+    outputs = _SharedColumns(output_typecodes, length)
+    try:
+        for view, column in zip(inputs.views, columns):
+            view[:] = column
+
+        tasks = [
+            (kernel, inputs.name, inputs.typecodes, outputs.name, outputs.typecodes, length, start, min(start + chunk_size, length))
+            for start in range(0, length, chunk_size)
+        ]
+        if len(tasks) == 1 or (workers == 1 and executor is None):
+            for task in tasks:
+                _run_chunk(task)
+
+        elif executor is not None:
+            # consuming the results raises the first exception of any worker.
+            list(executor.map(_run_chunk, tasks))
+
+        else:
+            with ProcessPoolExecutor(min(workers, len(tasks))) as pool:
+                list(pool.map(_run_chunk, tasks))
+
+        return [outputs.read(i) for i in range(len(output_typecodes))]
+
+    finally:
+        inputs.close(unlink=True)
+        outputs.close(unlink=True)
+
+def _as_point_array(points: Union[PointArray, Iterable[Point]], typecode: str) -> PointArray:
+    points = points if isinstance(points, PointArray) else PointArray.from_points(points)
+    return points if points.typecode == typecode else PointArray(points.xs, points.ys, typecode)
+
+def _coefficient_columns(lines: Union[LineArray, Sequence[Line]]) -> Tuple[array, array, array]:
+    if isinstance(lines, LineArray):
+        return lines.x_coefficients, lines.y_coefficients, lines.constants
+
+    coefficients = [(line.x_coefficient, line.y_coefficient, line.constant) for line in lines]
+    typecode = "q" if all(isinstance(v, int) for row in coefficients for v in row) else "d"
+    convert = int if typecode == "q" else float
+    return tuple(array(typecode, (convert(row[i]) for row in coefficients)) for i in range(3))
+
+def parallel_lines_from_AB_coordinates(
+    points_A: Union[PointArray, Iterable[Point]],
+    points_B: Union[PointArray, Iterable[Point]],
+    /, *,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> LineArray:
+    """Does the same as `LineArray.from_AB_coordinates` with the work spread across worker processes.
+
+    Parameters
+    ----------
+    points_A : Union[:class:`.PointArray`, Iterable[:class:`.Point`]]
+        The points from which the lines start.
+    points_B : Union[:class:`.PointArray`, Iterable[:class:`.Point`]]
+        The points where the lines end.
+    workers : Optional[:class:`int`]
+        The number of worker processes to start, by default one per CPU. Ignored when an ``executor`` is passed in.
+    chunk_size : Optional[:class:`int`]
+        The number of lines each task processes. By default the batch is split in about four tasks per worker.
+    executor : Optional[:class:`concurrent.futures.Executor`]
+        A process pool to reuse instead of starting a new one for every call.
+
+    Returns
+    -------
+    :class:`.LineArray`
+        The newly created array, identical to the one `LineArray.from_AB_coordinates` returns.
+
+    Raises
+    ------
+    ValueError
+        If the batches are of different lengths, a line has the same point A and B
+        or the coefficients of integer coordinates do not fit in the int64 range.
+    """
+    points_A = points_A if isinstance(points_A, PointArray) else PointArray.from_points(points_A)
+    points_B = points_B if isinstance(points_B, PointArray) else PointArray.from_points(points_B)
+    if len(points_A) != len(points_B):
+        raise ValueError(f"Expected the same number of points A and B, but got {len(points_A)} and {len(points_B)}")
+
+    typecode = "q" if points_A.typecode == points_B.typecode == "q" else "d"
+    points_A, points_B = _as_point_array(points_A, typecode), _as_point_array(points_B, typecode)
+
+    a, b, c, slopes, lengths, mid_xs, mid_ys = _execute(
+        "lines", (points_A.xs, points_A.ys, points_B.xs, points_B.ys), typecode * 3 + "dddd", workers, chunk_size, executor,
+    )
+    return LineArray._from_columns(a, b, c, points_A, points_B, slopes, lengths, PointArray(mid_xs, mid_ys, "d"))
+
+def parallel_classify_triangles(
+    A: Union[PointArray, Iterable[Point]],
+    B: Union[PointArray, Iterable[Point]],
+    C: Union[PointArray, Iterable[Point]],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> TriangleArray:
+    """Does the same as `TriangleArray.from_vertices` with the classification flags calculated up front across worker processes.
+
+    Parameters
+    ----------
+    A : Union[:class:`.PointArray`, Iterable[:class:`.Point`]]
+        The first vertex of every triangle.
+    B : Union[:class:`.PointArray`, Iterable[:class:`.Point`]]
+        The second vertex of every triangle.
+    C : Union[:class:`.PointArray`, Iterable[:class:`.Point`]]
+        The third vertex of every triangle.
+    workers : Optional[:class:`int`]
+        The number of worker processes to start, by default one per CPU. Ignored when an ``executor`` is passed in.
+    chunk_size : Optional[:class:`int`]
+        The number of triangles each task processes. By default the batch is split in about four tasks per worker.
+    executor : Optional[:class:`concurrent.futures.Executor`]
+        A process pool to reuse instead of starting a new one for every call.
+
+    Returns
+    -------
+    :class:`.TriangleArray`
+        The newly created array with `TriangleArray.is_isoceles`, `TriangleArray.is_equilateral`,
+        `TriangleArray.is_right_angled` and `TriangleArray.is_scalene` already calculated.
+
+    Raises
+    ------
+    ValueError
+        If the batches are of different lengths or any of the vertices do not form a proper triangle.
+    """
+    A, B, C = (P if isinstance(P, PointArray) else PointArray.from_points(P) for P in (A, B, C))
+    if not len(A) == len(B) == len(C):
+        raise ValueError(f"Expected the same number of vertices A, B and C, but got {len(A)}, {len(B)} and {len(C)}")
+
+    typecode = "q" if A.typecode == B.typecode == C.typecode == "q" else "d"
+    A, B, C = (_as_point_array(P, typecode) for P in (A, B, C))
+
+    det, isoceles, equilateral, right_angled = _execute(
+        "triangles", (A.xs, A.ys, B.xs, B.ys, C.xs, C.ys), typecode + "bbb", workers, chunk_size, executor,
+    )
+    triangles = TriangleArray._from_columns(A, B, C, det)
+    triangles._cached_is_isoceles = isoceles
+    triangles._cached_is_equilateral = equilateral
+    triangles._cached_is_right_angled = right_angled
+    return triangles
+
+def parallel_line_intersections(
+    lines: Union[LineArray, Sequence[Line]],
+    others: Union[LineArray, Sequence[Line]],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> PointArray:
+    """Finds the point where every line intersects with the line at the same index of another batch,
+    as `Line.intersects_with_line_on_point` does, with the work spread across worker processes.
+
+    Parameters
+    ----------
+    lines : Union[:class:`.LineArray`, Sequence[:class:`.Line`]]
+        The first line of every pair.
+    others : Union[:class:`.LineArray`, Sequence[:class:`.Line`]]
+        The second line of every pair.
+    workers : Optional[:class:`int`]
+        The number of worker processes to start, by default one per CPU. Ignored when an ``executor`` is passed in.
+    chunk_size : Optional[:class:`int`]
+        The number of pairs each task processes. By default the batch is split in about four tasks per worker.
+    executor : Optional[:class:`concurrent.futures.Executor`]
+        A process pool to reuse instead of starting a new one for every call.
+
+    Returns
+    -------
+    :class:`.PointArray`
+        A float64 array of the intersection points, with NaN coordinates for pairs of parallel lines.
+
+    Raises
+    ------
+    ValueError
+        If the batches are of different lengths.
+    """
+    first, second = _coefficient_columns(lines), _coefficient_columns(others)
+    if len(first[0]) != len(second[0]):
+        raise ValueError(f"Expected the same number of lines in both batches, but got {len(first[0])} and {len(second[0])}")
+
+    if first[0].typecode != second[0].typecode:
+        first, second = (tuple(array("d", map(float, column)) for column in columns) for columns in (first, second))
+
+    xs, ys = _execute("intersections", (*first, *second), "dd", workers, chunk_size, executor)
+    return PointArray(xs, ys, "d")
@@ -0,0 +1,129 @@
+from array import array
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+from models.point import Point
+from models.point_array import PointArray
+from models.predicates import orient
+from models.triangle import Triangle
+from models.triangle_array import TriangleArray
+from algorithms._grid import _UniformGrid
+from algorithms.delaunay import Triangulation
+
+_Vertices = Tuple[Union[int, float], Union[int, float], Union[int, float], Union[int, float], Union[int, float], Union[int, float]]
+
+def _vertices_from(triangles: Union[Sequence[Triangle], TriangleArray, Triangulation]) -> List[_Vertices]:
+    if isinstance(triangles, TriangleArray):
+        A, B, C = triangles.vertices_A, triangles.vertices_B, triangles.vertices_C
+        return list(zip(A.xs, A.ys, B.xs, B.ys, C.xs, C.ys))
+
+    if isinstance(triangles, Triangulation):
+        xs, ys = triangles.points.xs, triangles.points.ys
+        return [(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c]) for a, b, c in triangles.triples()]
+
+    return [
+        (t.vertex_A.x, t.vertex_A.y, t.vertex_B.x, t.vertex_B.y, t.vertex_C.x, t.vertex_C.y)
+        for t in triangles
+    ]
+
+class TriangleIndex:
+    """A point location structure answering which triangle contains a point.
+
+    The bounding box of every triangle is registered in a uniform grid,
+    so a query only tests the few triangles in the grid cell of the point, which takes near constant time
+    for triangles of similar sizes such as the ones of a mesh.
+
+    .. container:: operations
+
+        .. describe:: len(x)
+
+            Returns the number of indexed triangles.
+
+    Parameters
+    ----------
+    triangles : Union[Sequence[:class:`.Triangle`], :class:`.TriangleArray`, :class:`.Triangulation`]
+        The triangles to index. Query results refer to them by their position in this sequence.
+    cell_size : Optional[Union[:class:`int`, :class:`float`]]
+        The width and height of a grid cell. By default this is picked from the size of the triangles and how spread out they are.
+    """
+
+    __slots__ = ("_triangles", "_grid")
+
+    def __init__(self, triangles: Union[Sequence[Triangle], TriangleArray, Triangulation], cell_size: Optional[Union[int, float]] = None):
+        self._triangles = vertices = _vertices_from(triangles)
+        if not vertices:
+            raise ValueError("Expected at least one triangle to index.")
+
+        self._grid = _UniformGrid(
+            [(min(ax, bx, cx), min(ay, by, cy), max(ax, bx, cx), max(ay, by, cy)) for ax, ay, bx, by, cx, cy in vertices],
+            cell_size,
+        )
+
+    def __len__(self) -> int:
+        return len(self._triangles)
+
+    def __repr__(self) -> str:
+        return f"<TriangleIndex len={len(self)} {self._grid!r}>"
+
+    def _contains(self, i: int, x, y) -> bool:
+        # the point is inside (or on an edge) if it's on the same side of all three edges as the triangle itself.
+        ax, ay, bx, by, cx, cy = self._triangles[i]
+        d1 = orient(ax, ay, bx, by, x, y)
+        d2 = orient(bx, by, cx, cy, x, y)
+        d3 = orient(cx, cy, ax, ay, x, y)
+        return not ((d1 < 0 or d2 < 0 or d3 < 0) and (d1 > 0 or d2 > 0 or d3 > 0))
+
+    def locate(self, point: Point) -> Optional[int]:
+        """Returns the triangle containing a point.
+
+        Parameters
+        ----------
+        point : :class:`.Point`
+            The point to find.
+
+        Returns
+        -------
+        Optional[:class:`int`]
+            The index of the containing triangle or None if no triangle contains the point.
+            If more than one does (the point is on a shared edge or the triangles overlap), the lowest index is returned.
+        """
+        x, y = point.x, point.y
+        found = [i for i in self._grid.at(x, y) if self._contains(i, x, y)]
+        return min(found) if found else None
+
+    def locate_all(self, point: Point) -> List[int]:
+        """Returns every triangle containing a point.
+
+        Parameters
+        ----------
+        point : :class:`.Point`
+            The point to find.
+
+        Returns
+        -------
+        List[:class:`int`]
+            The sorted indices of the triangles containing the point, edges included.
+        """
+        x, y = point.x, point.y
+        return sorted(i for i in self._grid.at(x, y) if self._contains(i, x, y))
+
+    def locate_many(self, points: Union[PointArray, Iterable[Point]]) -> array:
+        """Locates a whole batch of points.
+
+        Parameters
+        ----------
+        points : Union[:class:`.PointArray`, Iterable[:class:`.Point`]]
+            The points to find.
+
+        Returns
+        -------
+        :class:`array.array`
+            An int64 buffer holding the index of the containing triangle for every point, as returned by `TriangleIndex.locate`,
+            with -1 for points outside every triangle.
+        """
+        points = points if isinstance(points, PointArray) else PointArray.from_points(points)
+        at, contains = self._grid.at, self._contains
+        result = array("q")
+        for x, y in zip(points.xs, points.ys):
+            found = [i for i in at(x, y) if contains(i, x, y)]
+            result.append(min(found) if found else -1)
+
+        return result
@@ -1,3 +1,10 @@
-from .line import Line, Point
+from .line import Line, LineInternTable, Point
+from .line_array import LineArray
+from .parallelogram import Parallelogram
+from .point_array import PointArray
+from .polygon import Polygon
 from .triangle import Triangle
-from .infinity import INFINITY
\ No newline at end of file
+from .transform import AffineTransform
+from .triangle_array import TriangleArray
+from .infinity import INFINITY
+from . import instrumentation, kernels, predicates
\ No newline at end of file
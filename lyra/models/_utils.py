@@ -0,0 +1,31 @@
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+class cached_slot_property(Generic[T]):
+    """A read only property that is computed once per instance and then cached.
+
+    This works the same as :func:`functools.cached_property` but stores the value in a slot
+    named ``_cached_<name>`` instead of the instance ``__dict__``, so it can be used on immutable classes defining `__slots__`.
+    The owner class must list that slot in its `__slots__`.
+    """
+
+    def __init__(self, func: Callable[[Any], T]):
+        self.func = func
+        self.__doc__ = func.__doc__
+        self.slot = f"_cached_{func.__name__}"
+
+    def __set_name__(self, owner: type, name: str):
+        self.slot = f"_cached_{name}"
+
+    def __get__(self, instance: Optional[object], owner: Optional[type] = None):
+        if instance is None:
+            return self
+
+        try:
+            return getattr(instance, self.slot)
+
+        except AttributeError: # empty slots raise AttributeError until they are set
+            value = self.func(instance)
+            object.__setattr__(instance, self.slot, value)
+            return value
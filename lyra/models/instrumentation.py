@@ -0,0 +1,239 @@
+"""Opt-in counters and timers for the hot paths of `Point`, `Line` and `Triangle`.
+
+Nothing is recorded (or even wrapped) unless a measurement is running:
+
+    from models import instrumentation
+
+    with instrumentation.measure() as metrics:
+        ...
+
+    print(metrics.report())
+    send_to_metrics_backend(metrics.as_dict())
+
+While a measurement is running the public methods and properties of the models are swapped with timed wrappers,
+and the originals are put back as soon as the last measurement stops. When disabled, the only leftover cost
+is a falsy check in front of the few internal events that are counted (such as `ZeroDivisionError` fallbacks).
+"""
+import functools
+import json
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from models._utils import cached_slot_property
+
+# the metrics currently recording. the models only check this list for truthiness
+# so it must never be rebound, only mutated in place.
+_recording: List["Metrics"] = []
+
+# (owner, attribute name, original value) for every attribute currently swapped with a timed wrapper.
+_patched: List[Tuple[type, str, Any]] = []
+
+# the methods and properties timed while a measurement is running.
+# missing attributes are skipped, so this can list more than what is available on a class.
+_TIMED = {
+    "Point": ("__init__", "__add__", "__sub__"),
+    "Line": (
+        "__init__", "__eq__",
+        "from_AB_coordinates", "from_coefficients", "from_slope_and_point", "from_intercepts", "_resolve_anchors",
+        "slope", "x_intercept", "y_intercept", "length", "midpoint",
+        "points_on_line", "count_points_on_line",
+        "angle_with_line", "is_parallel_to", "is_perpendicular_to", "intersects_with_line_on_point", "contains_point",
+        "find_point_from_ratio", "find_ratio_of_division_on_point",
+    ),
+    "Triangle": (
+        "__init__", "from_vertices", "from_sides", "area",
+        "angle_AB", "angle_BC", "angle_AC", "is_isoceles", "is_equilateral", "is_right_angled", "is_scalene",
+    ),
+}
+
+class Metrics:
+    """The counters and timers recorded during a measurement.
+
+    Attributes
+    ----------
+    counters : Dict[:class:`str`, :class:`int`]
+        How many times each internal event happened, such as ``"Line.zero_division_fallback"``.
+    timers : Dict[:class:`str`, List[:class:`int`]]
+        The number of calls, total time and longest call (both in nanoseconds) of each timed method, such as ``"Line.from_AB_coordinates"``.
+        Times are inclusive, so a method calling another timed method includes its time as well.
+    """
+
+    __slots__ = ("counters", "timers")
+
+    def __init__(self):
+        self.counters: Dict[str, int] = {}
+        self.timers: Dict[str, List[int]] = {}
+
+    def __repr__(self) -> str:
+        return f"<Metrics counters={len(self.counters)} timers={len(self.timers)}>"
+
+    def reset(self):
+        """Clears everything recorded so far."""
+        self.counters.clear()
+        self.timers.clear()
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the recorded metrics as plain dictionaries, ready to be exported.
+
+        Returns
+        -------
+        Dict[:class:`str`, Dict[:class:`str`, Any]]
+            A dictionary with a ``"counters"`` key mapping event names to their counts
+            and a ``"timers"`` key mapping method names to their ``calls``, ``total_ns``, ``mean_ns`` and ``max_ns``.
+        """
+        return {
+            "counters": dict(self.counters),
+            "timers": {
+                name: {"calls": calls, "total_ns": total, "mean_ns": total / calls, "max_ns": longest}
+                for name, (calls, total, longest) in self.timers.items()
+            },
+        }
+
+    def to_json(self, **kwargs) -> str:
+        """Returns `Metrics.as_dict` as a JSON string. Keyword arguments are passed on to :func:`json.dumps`."""
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def report(self) -> str:
+        """Returns a human readable table of the recorded metrics, the slowest methods in total first."""
+        lines = []
+        if self.timers:
+            width = max(map(len, self.timers))
+            lines.append(f"{'method':<{width}}  {'calls':>10}  {'total (ms)':>12}  {'mean (us)':>10}  {'max (us)':>10}")
+            for name, (calls, total, longest) in sorted(self.timers.items(), key=lambda item: -item[1][1]):
+                lines.append(f"{name:<{width}}  {calls:>10}  {total / 1e6:>12.3f}  {total / calls / 1e3:>10.3f}  {longest / 1e3:>10.3f}")
+
+        if self.counters:
+            if lines:
+                lines.append("")
+
+            width = max(map(len, self.counters))
+            lines.append(f"{'event':<{width}}  {'count':>10}")
+            for name, count in sorted(self.counters.items()):
+                lines.append(f"{name:<{width}}  {count:>10}")
+
+        return "\n".join(lines) or "Nothing recorded."
+
+def _count(name: str, amount: int = 1):
+    # only called by the models behind an `if _recording:` check.
+    for metrics in _recording:
+        counters = metrics.counters
+        counters[name] = counters.get(name, 0) + amount
+
+def _time(name: str, elapsed: int):
+    for metrics in _recording:
+        timer = metrics.timers.get(name)
+        if timer is None:
+            metrics.timers[name] = [1, elapsed, elapsed]
+        else:
+            timer[0] += 1
+            timer[1] += elapsed
+            if elapsed > timer[2]:
+                timer[2] = elapsed
+
+def _timed(name: str, func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _time(name, perf_counter_ns() - start)
+
+    return wrapper
+
+def _wrap(name: str, attribute: Any) -> Any:
+    if isinstance(attribute, classmethod):
+        return classmethod(_timed(name, attribute.__func__))
+
+    if isinstance(attribute, staticmethod):
+        return staticmethod(_timed(name, attribute.__func__))
+
+    if isinstance(attribute, property):
+        return property(_timed(name, attribute.fget), attribute.fset, attribute.fdel, attribute.__doc__)
+
+    if isinstance(attribute, cached_slot_property):
+        # only the computation is timed, cached reads are left alone.
+        wrapped = cached_slot_property(_timed(name, attribute.func))
+        wrapped.slot = attribute.slot
+        return wrapped
+
+    return _timed(name, attribute)
+
+def _patch():
+    # imported here since the models import this module.
+    from models.point import Point
+    from models.line import Line
+    from models.triangle import Triangle
+
+    for owner in (Point, Line, Triangle):
+        for attr in _TIMED[owner.__name__]:
+            original = owner.__dict__.get(attr)
+            if original is None:
+                continue
+
+            _patched.append((owner, attr, original))
+            setattr(owner, attr, _wrap(f"{owner.__name__}.{attr}", original))
+
+def _unpatch():
+    while _patched:
+        owner, attr, original = _patched.pop()
+        setattr(owner, attr, original)
+
+def enable(metrics: Optional[Metrics] = None) -> Metrics:
+    """Starts recording into a `Metrics` object until `disable` is called with it.
+
+    Any number of measurements can run at the same time, every one of them records everything.
+
+    Parameters
+    ----------
+    metrics : Optional[`Metrics`]
+        The object to record into, a new one is created by default.
+
+    Returns
+    -------
+    `Metrics`
+        The object being recorded into.
+    """
+    metrics = Metrics() if metrics is None else metrics
+    if not _recording:
+        _patch()
+
+    _recording.append(metrics)
+    return metrics
+
+def disable(metrics: Metrics):
+    """Stops recording into a `Metrics` object started with `enable`.
+
+    Raises
+    ------
+    ValueError
+        If the metrics are not being recorded into.
+    """
+    _recording.remove(metrics)
+    if not _recording:
+        _unpatch()
+
+def is_enabled() -> bool:
+    """Returns whether any measurement is currently running."""
+    return bool(_recording)
+
+@contextmanager
+def measure(metrics: Optional[Metrics] = None) -> Iterator[Metrics]:
+    """A context manager recording everything that happens inside of it.
+
+    Parameters
+    ----------
+    metrics : Optional[`Metrics`]
+        The object to record into, a new one is created by default.
+        Passing the same object again keeps adding to what it already holds.
+
+    Yields
+    ------
+    `Metrics`
+        The object being recorded into.
+    """
+    metrics = enable(metrics)
+    try:
+        yield metrics
+    finally:
+        disable(metrics)
@@ -0,0 +1,91 @@
+"""Small numeric kernels over raw coordinates.
+
+The scalar kernels take the coordinates of two (or three) points as plain numbers and return plain numbers or tuples,
+so nothing is allocated besides the result. Every one of them has a vectorized counterpart taking the coordinate
+columns of two batches of points (such as the ``xs`` and ``ys`` of two :class:`.PointArray`) and returning an :class:`array.array`.
+
+    from models import kernels
+
+    kernels.distance(0, 0, 3, 4) # 5.0
+    kernels.distances(A.xs, A.ys, B.xs, B.ys) # array('d', [...])
+
+The points given to a kernel are expected to be different, no validation is done.
+"""
+from array import array
+from fractions import Fraction
+import math
+import operator
+from numbers import Rational
+from typing import Sequence, Tuple, Union
+from models.infinity import INFINITY
+from models.point_array import PointArray
+from models.predicates import orient
+
+_Number = Union[int, float]
+
+def distance(x1: _Number, y1: _Number, x2: _Number, y2: _Number) -> float:
+    """Returns the distance between the points (x1, y1) and (x2, y2)."""
+    return math.hypot(x2 - x1, y2 - y1)
+
+def squared_distance(x1: _Number, y1: _Number, x2: _Number, y2: _Number) -> _Number:
+    """Returns the squared distance between the points (x1, y1) and (x2, y2), which is exact for integer coordinates."""
+    dx, dy = x2 - x1, y2 - y1
+    return dx * dx + dy * dy
+
+def slope(x1: _Number, y1: _Number, x2: _Number, y2: _Number) -> float:
+    """Returns the slope of the line going through the points (x1, y1) and (x2, y2).
+
+    Returns the special `.INFINITY` object if the line is vertical, the same as `Line.slope`.
+    """
+    dx = x2 - x1
+    if dx == 0:
+        return INFINITY
+
+    return (y2 - y1) / dx
+
+def midpoint(x1: _Number, y1: _Number, x2: _Number, y2: _Number) -> Tuple[float, float]:
+    """Returns the coordinates of the midpoint between the points (x1, y1) and (x2, y2)."""
+    return (x1 + x2) / 2, (y1 + y2) / 2
+
+def division_ratio(x1: _Number, y1: _Number, x2: _Number, y2: _Number, x: _Number, y: _Number) -> Tuple[int, int]:
+    """Returns the ratio in which the point (x, y) divides the segment from (x1, y1) to (x2, y2),
+    the same as `Line.find_ratio_of_division_on_point`.
+
+    Points on the line divide it internally, any other point is treated as dividing it externally.
+    The ratio is approximated by a fraction with a denominator of at most 1000.
+    """
+    if orient(x1, y1, x2, y2, x, y) == 0:
+        num, den = x - x1, x2 - x
+    else:
+        num, den = x1 + x, x + x2
+
+    # integer and fraction coordinates give the exact ratio, without a float in between.
+    ratio = Fraction(num, den) if isinstance(num, Rational) and isinstance(den, Rational) else Fraction(num / den)
+    return ratio.limit_denominator(1000).as_integer_ratio()
+
+def distances(xs1: Sequence[_Number], ys1: Sequence[_Number], xs2: Sequence[_Number], ys2: Sequence[_Number]) -> array:
+    """Vectorized `distance`, the distance between every pair of points as float64 values."""
+    return array("d", map(math.hypot, map(operator.sub, xs2, xs1), map(operator.sub, ys2, ys1)))
+
+def squared_distances(xs1: Sequence[_Number], ys1: Sequence[_Number], xs2: Sequence[_Number], ys2: Sequence[_Number]) -> array:
+    """Vectorized `squared_distance`, int64 values if all coordinates are int64 and float64 values otherwise."""
+    typecode = "q" if all(getattr(column, "typecode", "d") == "q" for column in (xs1, ys1, xs2, ys2)) else "d"
+    dx = map(operator.sub, xs2, xs1)
+    dy = map(operator.sub, ys2, ys1)
+    return array(typecode, (u * u + v * v for u, v in zip(dx, dy)))
+
+def slopes(xs1: Sequence[_Number], ys1: Sequence[_Number], xs2: Sequence[_Number], ys2: Sequence[_Number]) -> array:
+    """Vectorized `slope` as float64 values. Vertical lines have a slope of :data:`math.inf`,
+    since the `.INFINITY` object can not be stored in a float64 buffer.
+    """
+    dx = map(operator.sub, xs2, xs1)
+    dy = map(operator.sub, ys2, ys1)
+    return array("d", (v / u if u else math.inf for u, v in zip(dx, dy)))
+
+def midpoints(xs1: Sequence[_Number], ys1: Sequence[_Number], xs2: Sequence[_Number], ys2: Sequence[_Number]) -> PointArray:
+    """Vectorized `midpoint`, the midpoints of every pair of points as a float64 :class:`.PointArray`."""
+    return PointArray(
+        array("d", (v / 2 for v in map(operator.add, xs1, xs2))),
+        array("d", (v / 2 for v in map(operator.add, ys1, ys2))),
+        "d",
+    )
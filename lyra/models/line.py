@@ -1,12 +1,33 @@
 from models.infinity import INFINITY
 from models.point import Point
+from models._utils import cached_slot_property
+from models.instrumentation import _recording, _count
+from models.predicates import cross_sign, dot_sign, line_side, orient
+from models import kernels
 import math
-from typing import Literal, Optional, Tuple, Union
+from numbers import Rational
+from typing import Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Union
 from fractions import Fraction
 import logging
 
 log = logging.getLogger(__name__)
 
+def _extended_gcd(a: int, b: int) -> Tuple[int, int, int]:
+    # returns (g, s, t) such that `a*s + b*t == g` where g is the non negative gcd of a and b
+    old_r, r = a, b
+    old_s, s = 1, 0
+    old_t, t = 0, 1
+    while r:
+        q = old_r // r
+        old_r, r = r, old_r - q*r
+        old_s, s = s, old_s - q*s
+        old_t, t = t, old_t - q*t
+    
+    if old_r < 0:
+        return -old_r, -old_s, -old_t
+    
+    return old_r, old_s, old_t
+
 # if you see some weirdly done calcualtions, it's probably because i dont wanna be dealing with floats
 # so im trying my best to make it work with ints
 
@@ -27,12 +48,17 @@ class Line:
 
         .. describe:: x == y
 
-            Checks if the line is equal to another line.
+            Checks if the line is equal to another line, 
+            which is the case when their equations describe the same line (see `Line.canonical_coefficients`).
 
         .. describe:: x != y
 
             Checks if the line is not equal to another line.
             
+        .. describe:: hash(x)
+
+            Returns the hash of the line, equal lines have the same hash.
+            
         .. describe:: x + y
 
             Adds the coefficients of the two lines.
@@ -40,22 +66,51 @@ class Line:
         .. describe:: x - y
 
             Subtracts the coefficients of the two lines.
+    
+    Lines are immutable. Derived properties such as `Line.slope` or `Line.length` 
+    are only calculated on first access and then cached.
     """
     
-    # below variables are defined to just typehint, they get set in any of the classmethods avalable
-    # incase the classmethods are not called, these won't be set and cause errors in most of the 
-    # methods and proeprties of the class.
-    _rng : bool
-    _A : Point
-    _B : Point
+    __slots__ = (
+        "_x", "_y", "_c", "_rng", "_A", "_B",
+        "_cached_slope", "_cached_x_intercept", "_cached_y_intercept", "_cached_length", "_cached_midpoint",
+        "_cached_canonical_coefficients",
+    )
     
-    def __init__(self, x_coefficient: Union[int, float], y_coefficient: Union[int, float], constant: Union[int, float]):
-        self._x = x_coefficient
-        self._y = y_coefficient
-        self._c = constant
+    _rng : bool
+    _A : Optional[Point]
+    _B : Optional[Point]
+    
+    def __init__(self, x_coefficient: Union[int, float], y_coefficient: Union[int, float], constant: Union[int, float], point_A: Optional[Point] = None, point_B: Optional[Point] = None):
+        # the line is immutable so object.__setattr__ has to be used to set anything on it.
+        # missing points are only resolved when `Line.point_A` or `Line.point_B` is first accessed.
+        object.__setattr__(self, "_x", x_coefficient)
+        object.__setattr__(self, "_y", y_coefficient)
+        object.__setattr__(self, "_c", constant)
+        object.__setattr__(self, "_rng", point_A is None or point_B is None)
+        object.__setattr__(self, "_A", point_A)
+        object.__setattr__(self, "_B", point_B)
         
     def __new__(cls, *args, **kwargs):
         raise RuntimeError(f"This class should not be instantiated manually. Use the provided class methods to create a new {cls.__name__} object.")
+    
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} objects are immutable.")
+    
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} objects are immutable.")
+    
+    def __reduce__(self):
+        # only the coefficients and anchors are pickled, cached properties are calculated again when needed.
+        return self._unpickle, (self._x, self._y, self._c, self._A, self._B, self._rng)
+    
+    @classmethod
+    def _unpickle(cls, x_coefficient, y_coefficient, constant, point_A: Optional[Point], point_B: Optional[Point], rng: bool) -> "Line":
+        self = super().__new__(cls)
+        self.__init__(x_coefficient, y_coefficient, constant, point_A, point_B)
+        # anchors resolved on access still count as generated ones, which keeps `Line.slope` calculated the same way.
+        object.__setattr__(self, "_rng", rng)
+        return self
         
     def __str__(self) -> str:
         x, y, c = self.x_coefficient, self.y_coefficient, self.constant
@@ -71,7 +126,10 @@ class Line:
         if not isinstance(other, Line):
             return NotImplemented
         
-        return all(getattr(self, attr) == getattr(other, attr) for attr in ["slope", "y_intercept", "x_intercept"])
+        return self.canonical_coefficients == other.canonical_coefficients
+    
+    def __hash__(self) -> int:
+        return hash(self.canonical_coefficients)
     
     def __add__(self, other: object):
         if not isinstance(other, Line):
@@ -106,62 +164,88 @@ class Line:
     def point_A(self) -> Point:
         """:class:`.Point`: Point A on the line. 
         
-        This is automatically generated if not passed in the `Line.from_AB_coordinates` or `Line.from_coefficients` class method.
+        This is automatically generated on first access if not passed in the `Line.from_AB_coordinates` or `Line.from_coefficients` class method.
         """
+        if self._A is None:
+            self._resolve_anchors()
+        
         return self._A
     
     @property
     def point_B(self) -> Point:
         """:class:`.Point`: Point B on the line. 
         
-        This is automatically generated if not passed in the `Line.from_AB_coordinates` or `Line.from_coefficients` class method.
+        This is automatically generated on first access if not passed in the `Line.from_AB_coordinates` or `Line.from_coefficients` class method.
         """
+        if self._B is None:
+            self._resolve_anchors()
+        
         return self._B
     
-    @property
+    @cached_slot_property
+    def canonical_coefficients(self) -> Tuple[int, int, int]:
+        """Tuple[:class:`int`, :class:`int`, :class:`int`]: The coefficients of x, y and the constant in their canonical form.
+        
+        Every equation of the same line has the same canonical form, the coefficients scaled to integers exactly
+        (float coefficients included, no rounding is done), divided by their gcd and with a negative y coefficient
+        (or a positive x coefficient for vertical lines), the same as `Line.from_AB_coordinates` creates for integer points.
+        """
+        a, b, c = self._integer_coefficients()
+        g = math.gcd(a, b, c)
+        if b > 0 or (b == 0 and a < 0):
+            g = -g
+        
+        return a // g, b // g, c // g
+    
+    @cached_slot_property
     def slope(self):
         """:class:`float`: The slope of the line.
         
         Returns a special `.INFINITY` object (subclass of float) if the line is vertical (AKA `Line.y_coefficient` is 0).
         """
-        try:
-            if self._rng:
-                slope = -self.x_coefficient / self.y_coefficient
-                
-            else:
-                slope = (self.point_B.y - self.point_A.y) / (self.point_B.x - self.point_A.x)
-        
-        except ZeroDivisionError: # incase the line is vertical, when slope is infinity
-            slope = INFINITY
+        if self._rng:
+            try:
+                return -self.x_coefficient / self.y_coefficient
             
+            except ZeroDivisionError: # incase the line is vertical, when slope is infinity
+                if _recording:
+                    _count("Line.zero_division_fallback")
+                return INFINITY
         
-        return slope
+        A, B = self.point_A, self.point_B
+        return kernels.slope(A.x, A.y, B.x, B.y)
     
-    @property
+    @cached_slot_property
     def x_intercept(self):
         """:class:`.Point`: The coordiantes of the x-intercept of the line."""
         try:
             return Point(-self.constant / self.x_coefficient, 0)
         except ZeroDivisionError:
+            if _recording:
+                _count("Line.zero_division_fallback")
             return Point(INFINITY, 0)
     
-    @property
+    @cached_slot_property
     def y_intercept(self):
         """:class:`.Point`: The coordiantes of the y-intercept of the line."""
         try:
             return Point(0, -(self.constant / self.y_coefficient))
         except ZeroDivisionError:
+            if _recording:
+                _count("Line.zero_division_fallback")
             return Point(0, INFINITY)
     
-    @property
+    @cached_slot_property
     def length(self):
         """:class:`float`: The length of the line from point A to point B."""
-        return math.sqrt(((self.point_B.x - self.point_A.x)**2) + ((self.point_B.y - self.point_A.y)**2))
+        A, B = self.point_A, self.point_B
+        return kernels.distance(A.x, A.y, B.x, B.y)
     
-    @property
+    @cached_slot_property
     def midpoint(self):
         """:class:`.Point`: The midpoint of the lne from point A to point B."""
-        return Point((self.point_A.x + self.point_B.x)/2, (self.point_A.y+self.point_B.y)/2)
+        A, B = self.point_A, self.point_B
+        return Point(*kernels.midpoint(A.x, A.y, B.x, B.y))
     
     @property
     def equation(self):
@@ -196,6 +280,9 @@ class Line:
     @classmethod
     def from_AB_coordinates(cls, point_A: Point, point_B: Point, /) -> 'Line':
         """Create a line from two points present on the line which will be it's start and end point
+        
+        If both points have integer or rational (:class:`fractions.Fraction`) coordinates, 
+        the coefficients are calculated exactly and reduced to the smallest integers possible.
 
         Parameters
         ----------
@@ -212,34 +299,55 @@ class Line:
         if point_A == point_B:
             raise ValueError("Expected different coordinates from point A and B, but got the same coordinates {}".format(point_A))
         
-        try:
-            slope = (point_B.y - point_A.y) / (point_B.x - point_A.x)
+        coefficients = cls._exact_coefficients(point_A, point_B)
+        if coefficients is not None:
+            self = cls.from_coefficients(*coefficients, point_A, point_B)
+            # the exact coefficients are already in their canonical form.
+            object.__setattr__(self, "_cached_canonical_coefficients", coefficients)
+            return self
         
-        except ZeroDivisionError:
-            slope = INFINITY
+        return cls.from_coefficients(*cls._float_coefficients(point_A, point_B), point_A, point_B)
+    
+    @classmethod
+    def _float_coefficients(cls, point_A: Point, point_B: Point) -> Tuple[int, int, int]:
+        # the coefficients of the line through points with float coordinates, which `LineArray` shares.
+        if point_A.x == point_B.x:
+            # vertical lines have no slope, `x = p/q` is written as `qx - p = 0` straight away.
+            # the float is converted exactly, there is no division that could have rounded it.
+            p, q = Fraction(point_A.x).as_integer_ratio()
+            return q, 0, -p
+        
+        slope = (point_B.y - point_A.y) / (point_B.x - point_A.x)
+        return cls._slope_and_point_coefficients(slope, point_A)
+    
+    @staticmethod
+    def _exact_coefficients(point_A: Point, point_B: Point) -> Optional[Tuple[int, int, int]]:
+        # for integer or rational coordinates, the coefficients can be found directly from the two point form:
+        # `a = y2 - y1`, `b = x1 - x2` and `c = x2*y1 - x1*y2`
+        # which are then reduced by their gcd, so no floats or limit_denominator() guesswork is involved.
+        # returns None for float coordinates so the caller can fall back to the slope based calculation.
+        x1, y1, x2, y2 = point_A.x, point_A.y, point_B.x, point_B.y
+        if not all(isinstance(v, Rational) for v in (x1, y1, x2, y2)):
+            return None
         
-        self = cls.from_slope_and_point(slope, point_A)
-        self._rng = False
-        self._B = point_B
+        a = y2 - y1
+        b = x1 - x2
+        c = x2*y1 - x1*y2
         
-        return self
+        den = math.lcm(a.denominator, b.denominator, c.denominator)
+        if den != 1: # only ever the case for Fraction coordinates
+            a, b, c = int(a * den), int(b * den), int(c * den)
+        
+        # keep the same sign as the slope based calculation,
+        # y coefficient negative or x coefficient positive for vertical lines.
+        g = math.gcd(a, b, c)
+        if b > 0 or (b == 0 and a < 0):
+            g = -g
+        
+        return a // g, b // g, c // g
     
-    @classmethod
-    def from_slope_and_point(cls, slope: Union[float, int], point: Point) -> 'Line':
-        """Create a line from it's slope and a point on the line.
-
-        Parameters
-        ----------
-        slope : Union[:class:`float`, :class:`int`]
-            The slope of the line.
-        point : :class:`.Point`
-            A point present on the line.
-
-        Returns
-        -------
-        :class:`.Line`
-            The newly created line object
-        """
+    @staticmethod
+    def _slope_and_point_coefficients(slope: Union[float, int], point: Point) -> Tuple[int, int, int]:
         # the below might be confusing but to put it in simple words
         # I'm trying to keep integers in the equation only isntead of floats.
         # so the following just uses the integer ratio of the floats
@@ -252,15 +360,38 @@ class Line:
         # `(q*s)y = (p*s)x + (q*r)b` ( can be written as `(p*s)x - (q*s)y + (q*r)b = 0`)
         # this partially ensures that we only have integer values available and not floats.
         
+        intercept = point.y - (slope * point.x)
+        if _recording:
+            _count("Line.limit_denominator", isinstance(slope, float) + (not isinstance(intercept, int)))
+        
         p, q = Fraction(slope).limit_denominator(1000).as_integer_ratio() if isinstance(slope, float) else (slope, 1)
         # to limit the emission of huge af integers that just don't make sense.
-        r, s = Fraction((point.y - (slope * point.x))).limit_denominator(1000).as_integer_ratio()
+        # integer intercepts (an integer slope through an integer point) need no Fraction at all.
+        r, s = (intercept, 1) if isinstance(intercept, int) else Fraction(intercept).limit_denominator(1000).as_integer_ratio()
         
         x = p * s
         y = -(q*s)
         c = q*r
         
-        return cls.from_coefficients(x, y, c, point)
+        return x, y, c
+    
+    @classmethod
+    def from_slope_and_point(cls, slope: Union[float, int], point: Point) -> 'Line':
+        """Create a line from it's slope and a point on the line.
+
+        Parameters
+        ----------
+        slope : Union[:class:`float`, :class:`int`]
+            The slope of the line.
+        point : :class:`.Point`
+            A point present on the line.
+
+        Returns
+        -------
+        :class:`.Line`
+            The newly created line object
+        """
+        return cls.from_coefficients(*cls._slope_and_point_coefficients(slope, point), point)
     
     @classmethod
     def from_coefficients(cls, x_coefficient: Union[int, float], y_coefficient: Union[int, float], constant: Union[int, float], point_A: Optional[Point] = None, point_B: Optional[Point] = None):
@@ -282,36 +413,54 @@ class Line:
         Raises
         ------
         ValueError
-            If all coefficients provided are equal to zero.
+            If all coefficients provided are equal to zero,
+            or the x and y coefficients are both zero (which is not the equation of a line).
         """
         if all(v == 0 for v in [x_coefficient, y_coefficient, constant]):
             raise ValueError("Cannot create line with all values equal to 0.")
         
+        if x_coefficient == 0 and y_coefficient == 0:
+            raise ValueError(f"Cannot create line with both x and y coefficients equal to 0, got the constant {constant} only.")
+        
         self = super().__new__(cls)
-        self.__init__(x_coefficient, y_coefficient, constant)
-        
-        if not point_A or not point_B:
-            self._rng = True
-            if self.x_coefficient == 0:
-                self._A = point_A or Point(0, -self.constant)
-                self._B = point_B or Point(0, 0)
-                
-            elif self.y_coefficient == 0:
-                self._A = point_A or Point(-self.constant, 0)
-                self._B = point_B or Point(0, 0)
-                
-            else:
-                gen = self.points_on_line()
-                self._A = point_A or next(gen)
-                self._B = point_B or next(gen)
-                gen.close()
-                
-        else:
-            self._A = point_A
-            self._B = point_B
+        self.__init__(x_coefficient, y_coefficient, constant, point_A, point_B)
             
         return self
     
+    def _default_anchors(self) -> Tuple[Point, Point]:
+        # two distinct points on the line found in O(1) (well, O(log) for the gcd)
+        a, b, c = self.canonical_coefficients
+        g, s, t = _extended_gcd(a, b)
+        if c % g == 0:
+            # the first two integer points with a non negative x-coordinate (or y-coordinate for vertical lines).
+            # see `Line._lattice_parameters` for the maths behind this.
+            x0, y0 = s * (-c // g), t * (-c // g)
+            dx, dy = b // g, -a // g
+            if dx < 0 or (dx == 0 and dy < 0):
+                dx, dy = -dx, -dy
+            
+            start, step = (x0, dx) if dx else (y0, dy)
+            k = -(start // step) # ceil(-start / step)
+            x, y = x0 + k*dx, y0 + k*dy
+            return Point(x, y), Point(x + dx, y + dy)
+        
+        # no integer points on the line at all, so just use where it crosses an axis 
+        # and move along the direction of the line from there.
+        # Fractions keep these points exactly on the line.
+        A = Point(0, Fraction(-c, b)) if b else Point(Fraction(-c, a), 0)
+        if b < 0 or (b == 0 and a > 0):
+            a, b = -a, -b
+        
+        return A, Point(A.x + b, A.y - a)
+    
+    def _resolve_anchors(self):
+        A, B = self._default_anchors()
+        if self._A is None:
+            object.__setattr__(self, "_A", A if self._B != A else B)
+        
+        if self._B is None:
+            object.__setattr__(self, "_B", B if self._A != B else A)
+    
     
     
     def angle_with_line(self, line: "Line"):
@@ -325,33 +474,85 @@ class Line:
         Returns
         -------
         :class:`float`
-            The angle in degrees between the lines.
+            The angle in degrees between the lines, from 0 to 90.
         """
+        a1, b1 = self.x_coefficient, self.y_coefficient
+        a2, b2 = line.x_coefficient, line.y_coefficient
         
-        if self.is_parallel_to(line):
+        # eliminating known cases pre calculation, exactly so they come out as whole 0 and 90.
+        if cross_sign(a1, b1, a2, b2) == 0:
             return 0
         
-        elif self.is_perpendicular_to(line):
+        if dot_sign(a1, b1, a2, b2) == 0:
             return 90
         
-        # eliminating known cases pre calculation
+        # the angle between the lines is the one between their normal vectors (a, b),
+        # whose tangent is cross/dot. abs()-ing both keeps it between 0 and 90 no matter which way the normals point.
+        # no slopes are involved, so vertical lines need no special case.
+        return math.degrees(math.atan2(abs(a1*b2 - a2*b1), abs(a1*a2 + b1*b2)))
+    
+    def _integer_coefficients(self) -> Tuple[int, int, int]:
+        # the coefficients scaled up to integers.
+        # floats are converted exactly (no limit_denominator()) so the scaled line is the same line.
+        a, b, c = self.x_coefficient, self.y_coefficient, self.constant
+        if isinstance(a, int) and isinstance(b, int) and isinstance(c, int):
+            return a, b, c
+        
+        if _recording:
+            _count("Line.fraction_conversion")
+        
+        a, b, c = Fraction(a), Fraction(b), Fraction(c)
+        den = math.lcm(a.denominator, b.denominator, c.denominator)
+        return int(a * den), int(b * den), int(c * den)
+    
+    def _lattice_parameters(self, range_: int, x_range: Optional[Tuple[int, int]], y_range: Optional[Tuple[int, int]]) -> Optional[Tuple[int, int, int, int, int, int]]:
+        # every integer point on `ax + by + c = 0` is `(x0 + k*dx, y0 + k*dy)` for some integer k
+        # where (x0, y0) is a particular solution found using the extended euclidean algorithm
+        # and (dx, dy) = (b/g, -a/g) with g = gcd(a, b).
+        # the window then just bounds k from both sides, so no candidate ever has to be checked.
+        # returns (x0, y0, dx, dy, k_min, k_max) or None if no integer point lies in the window.
+        a, b, c = self.canonical_coefficients
+        g, s, t = _extended_gcd(a, b)
+        if c % g != 0:
+            return None
         
-        slope_prod = self.slope * line.slope
-        slope_diff = self.slope - line.slope
-        try:
-            val = slope_diff/(1+slope_prod)
-        except ZeroDivisionError:
-            val = INFINITY
+        x0, y0 = s * (-c // g), t * (-c // g)
+        dx, dy = b // g, -a // g
+        
+        # the x window bounds k unless the line is vertical, which is then bounded by the y window instead.
+        x_range = x_range or (0, range_ or 100)
+        if dx == 0 and y_range is None:
+            y_range = (0, range_ or 100)
+        
+        k_min, k_max = -math.inf, math.inf
+        for start, step, window in ((x0, dx, x_range), (y0, dy, y_range)):
+            if window is None:
+                continue
             
-        angle = abs(math.degrees(math.atan(val)))
+            lo, hi = window[0], window[1] - 1 # windows are half open, like range()
+            if step == 0:
+                if not lo <= start <= hi:
+                    return None
+                continue
+            
+            if step > 0:
+                lower, upper = -((start - lo) // step), (hi - start) // step
+            else:
+                lower, upper = -((start - hi) // step), (lo - start) // step
+            
+            k_min, k_max = max(k_min, lower), min(k_max, upper)
+        
+        if k_min > k_max:
+            return None
         
-        return angle
-        # abs since angles are supposed to be positive and math.atan only return between pi/2 and -pi/2
-        # thus abs()-ing the result allows us to get accurate angles
+        return x0, y0, dx, dy, k_min, k_max
     
-    def points_on_line(self, range_: int = 100):
+    def points_on_line(self, range_: int = 100, *, x_range: Optional[Tuple[int, int]] = None, y_range: Optional[Tuple[int, int]] = None):
         """Returns a Generator yielding points that are present on the line.
         
+        The points are found in closed form using the extended euclidean algorithm over the coefficients of the line,
+        so every point costs O(1) no matter how sparse the points are in the window.
+        
         .. note::
             This method only returns absolute points on the line.
             Which means that the coordinates will only be integers and not floats.
@@ -360,16 +561,54 @@ class Line:
         Parameters
         ----------
         range_ : :class:`int`
-            An optional range int to check upto for points, by default 100
+            An optional range int to check upto for points, by default 100. 
+            This is the same as passing ``x_range=(0, range_)``.
+        x_range : Optional[Tuple[:class:`int`, :class:`int`]]
+            The half open window ``[start, stop)`` the x-coordinates of the points must lie in. 
+            Takes precedence over ``range_``.
+        y_range : Optional[Tuple[:class:`int`, :class:`int`]]
+            The half open window ``[start, stop)`` the y-coordinates of the points must lie in. 
+            Unbounded by default, except for vertical lines which use ``(0, range_)``.
 
         Returns
         -------
         :class:`Generator`
-            a Generator object yielding :class:`.Point` objects.
+            a Generator object yielding :class:`.Point` objects ordered by their x-coordinate (or y-coordinate for vertical lines).
+        """
+        params = self._lattice_parameters(range_, x_range, y_range)
+        if params is None:
+            return iter(())
+        
+        x0, y0, dx, dy, k_min, k_max = params
+        if _recording:
+            _count("Line.lattice_points", k_max - k_min + 1)
+        
+        ks = range(k_min, k_max + 1) if dx > 0 or (dx == 0 and dy > 0) else range(k_max, k_min - 1, -1)
+        return (Point(x0 + k*dx, y0 + k*dy) for k in ks)
+    
+    def count_points_on_line(self, range_: int = 100, *, x_range: Optional[Tuple[int, int]] = None, y_range: Optional[Tuple[int, int]] = None) -> int:
+        """Returns the number of points `Line.points_on_line` would yield with the same arguments without creating any of them.
+
+        Parameters
+        ----------
+        range_ : :class:`int`
+            An optional range int to check upto for points, by default 100.
+        x_range : Optional[Tuple[:class:`int`, :class:`int`]]
+            The half open window ``[start, stop)`` the x-coordinates of the points must lie in.
+        y_range : Optional[Tuple[:class:`int`, :class:`int`]]
+            The half open window ``[start, stop)`` the y-coordinates of the points must lie in.
+            Unbounded by default, except for vertical lines which use ``(0, range_)``.
+
+        Returns
+        -------
+        :class:`int`
+            The number of integer points on the line in the window.
         """
-        r = range_ or 100
-        return (p for i in range(r) if self.contains_point((p:=Point(i, (0 if self.slope is INFINITY else (self.slope*i + self.y_intercept.y))))))
+        params = self._lattice_parameters(range_, x_range, y_range)
+        if params is None:
+            return 0
         
+        return params[5] - params[4] + 1
     
     def find_point_from_ratio(self, ratio: Tuple[int, int], in_or_ex: Literal["internally", "externally"] = "internally"):
         """Returns a point that divides the line in the given ratio.
@@ -396,9 +635,8 @@ class Line:
         if in_or_ex == "internally":
             x = ((m1*x2) + (m2*x1)) / (m1 + m2)
             y = ((m1*y2) + (m2*y1)) / (m1 + m2)
-            point = Point(x, y)
-            if self.contains_point(point): # just a safety check
-                return Point(x, y)
+            # the point is on the line by construction, checking it would only fail on the rounding of the division.
+            return Point(x, y)
         
         x = ((m1*x2) - (m2*x1)) / (m1 - m2)
         y = ((m1*y2) - (m2*y1)) / (m1 - m2)
@@ -419,15 +657,10 @@ class Line:
         """
         a = self.point_A
         b = self.point_B
-        c = point
+        if _recording:
+            _count("Line.limit_denominator")
         
-        if self.contains_point(c):
-            ratio = ((c.x - a.x) / (b.x - c.x))
-            return Fraction(ratio).limit_denominator(1000).as_integer_ratio()
-            
-        else:
-            ratio = ((a.x + c.x) / (c.x + b.x))
-            return Fraction(ratio).limit_denominator(1000).as_integer_ratio()
+        return kernels.division_ratio(a.x, a.y, b.x, b.y, point.x, point.y)
     
     def is_parallel_to(self, line: "Line"):
         """Checks if the line is parallel to another line
@@ -442,7 +675,8 @@ class Line:
         :class:`bool`
             A boolean value indicating whether the lines are parallel or not
         """
-        return (self.slope == line.slope and self.angle_with_line(line) == 0)
+        # the lines are parallel when their normal vectors (a, b) are, checked exactly even for float coefficients.
+        return cross_sign(self.x_coefficient, self.y_coefficient, line.x_coefficient, line.y_coefficient) == 0
     
     def is_perpendicular_to(self, line: "Line"):
         """Checks if the line is perpendicular to another line
@@ -455,13 +689,10 @@ class Line:
         Returns
         -------
         :class:`bool`
-            A boolean value indicating whether the lines are parallel or not
+            A boolean value indicating whether the lines are perpendicular or not
         """
-        try:
-            return self.slope == (-1/line.slope)
-    
-        except ZeroDivisionError:
-            return (self.slope == 0 and line.slope is INFINITY) or (self.slope is INFINITY and line.slope == 0)
+        # the lines are perpendicular when their normal vectors (a, b) are.
+        return dot_sign(self.x_coefficient, self.y_coefficient, line.x_coefficient, line.y_coefficient) == 0
     
     def intersects_with_line_on_point(self, line: "Line"):
         """Get the point at which the line intersects with another line
@@ -476,9 +707,6 @@ class Line:
         Optional[:class:`.Point`]
             A :class:`.Point` object representing the coordinates at which the lines intersect or None if they are parallel. 
         """
-        if self.is_parallel_to(line):
-            return None
-        
         a1 = self.x_coefficient
         a2 = line.x_coefficient
         
@@ -488,6 +716,9 @@ class Line:
         c1 = self.constant
         c2 = line.constant
         
+        if cross_sign(a1, b1, a2, b2) == 0:
+            return None
+        
         x = (((b1*c2) - (b2*c1))/((a1*b2) - (a2*b1)))
         y = (((c1*a2) - (c2*a1))/((a1*b2) - (a2*b1)))
         
@@ -498,6 +729,10 @@ class Line:
     
     def contains_point(self, Point: Point):
         """Check whether the line contains the given point.
+        
+        The check is exact, even for float coordinates (see `models.predicates`). 
+        For a line created from two points, the point has to be collinear with them,
+        otherwise it has to satisfy the line's equation.
 
         Parameters
         ----------
@@ -509,4 +744,82 @@ class Line:
         :class:`bool`
             A boolean value indicating whether the point is present on the line or not.
         """
-        return ((self.x_coefficient * Point.x) + (self.y_coefficient * Point.y) + (self.constant)) == 0
\ No newline at end of file
+        A, B = self._A, self._B
+        if not self._rng and A != B:
+            # the two points define the line exactly, while the coefficients found for float points are rounded.
+            return orient(A.x, A.y, B.x, B.y, Point.x, Point.y) == 0
+        
+        return line_side(self.x_coefficient, self.y_coefficient, self.constant, Point.x, Point.y) == 0
+
+class LineInternTable:
+    """A table deduplicating lines, so every distinct line is only kept once.
+    
+    Lines are looked up by their `Line.canonical_coefficients`, so interning a line costs a single hash lookup
+    and lines with different equations of the same line (such as ``x + y = 0`` and ``2x + 2y = 0``) share the same entry.
+    
+    .. container:: operations
+    
+        .. describe:: len(x)
+        
+            Returns the number of distinct lines in the table.
+            
+        .. describe:: line in x
+        
+            Checks if the table holds a line equal to the given line.
+            
+        .. describe:: iter(x)
+        
+            Iterates over the distinct lines in the order they were first interned.
+    """
+    
+    __slots__ = ("_lines",)
+    
+    def __init__(self):
+        self._lines: Dict[Tuple[int, int, int], Line] = {}
+    
+    def __len__(self) -> int:
+        return len(self._lines)
+    
+    def __contains__(self, line: object) -> bool:
+        return isinstance(line, Line) and line.canonical_coefficients in self._lines
+    
+    def __iter__(self) -> Iterator[Line]:
+        return iter(self._lines.values())
+    
+    def __repr__(self) -> str:
+        return f"<LineInternTable len={len(self)}>"
+    
+    def intern(self, line: Line) -> Line:
+        """Returns the line of the table equal to the given line, adding it to the table if there is none.
+
+        Parameters
+        ----------
+        line : :class:`Line`
+            The line to intern.
+
+        Returns
+        -------
+        :class:`Line`
+            The first interned line equal to the given line, which may be the line itself.
+        """
+        return self._lines.setdefault(line.canonical_coefficients, line)
+    
+    def intern_many(self, lines: Iterable[Line]) -> List[Line]:
+        """Interns every line of an iterable.
+
+        Parameters
+        ----------
+        lines : Iterable[:class:`Line`]
+            The lines to intern.
+
+        Returns
+        -------
+        List[:class:`Line`]
+            The interned line of every given line, in the same order.
+        """
+        setdefault = self._lines.setdefault
+        return [setdefault(line.canonical_coefficients, line) for line in lines]
+    
+    def clear(self):
+        """Removes every line from the table."""
+        self._lines.clear()
@@ -0,0 +1,198 @@
+from array import array
+import math
+import operator
+from typing import Iterable, Iterator, List, Union, overload
+from models.line import Line
+from models.point import Point
+from models.point_array import PointArray, _INT64_MIN, _INT64_MAX
+from models import kernels
+
+class LineArray:
+    """A columnar container holding many lines, each bounded by a point A and a point B.
+
+    The coefficients of every line's general equation `ax + by + c = 0` are stored in contiguous buffers
+    alongside the anchor points, slopes, lengths and midpoints of the whole batch.
+    Individual :class:`.Line` objects are only created when asked for.
+
+    .. note::
+        This class should not be manually instantiated.
+        Instead, use the provided class methods to create a new LineArray object.
+
+    .. container:: operations
+
+        .. describe:: len(x)
+
+            Returns the number of lines in the array.
+
+        .. describe:: x[i]
+
+            Returns the line at index i as a :class:`.Line`.
+            If a slice is passed in, a new :class:`.LineArray` is returned.
+
+        .. describe:: iter(x)
+
+            Iterates over the lines as :class:`.Line` objects.
+    """
+
+    __slots__ = ("_a", "_b", "_c", "_A", "_B", "_slopes", "_lengths", "_midpoints")
+
+    def __init__(self, x_coefficients: array, y_coefficients: array, constants: array, points_A: PointArray, points_B: PointArray, slopes: array, lengths: array, midpoints: PointArray):
+        self._a = x_coefficients
+        self._b = y_coefficients
+        self._c = constants
+        self._A = points_A
+        self._B = points_B
+        self._slopes = slopes
+        self._lengths = lengths
+        self._midpoints = midpoints
+
+    def __new__(cls, *args, **kwargs):
+        raise RuntimeError(f"This class should not be instantiated manually. Use the provided class methods to create a new {cls.__name__} object.")
+
+    def __len__(self) -> int:
+        return len(self._a)
+
+    def __reduce__(self):
+        return self._from_columns, (self._a, self._b, self._c, self._A, self._B, self._slopes, self._lengths, self._midpoints)
+
+    @classmethod
+    def _from_columns(cls, x_coefficients: array, y_coefficients: array, constants: array, points_A: PointArray, points_B: PointArray, slopes: array, lengths: array, midpoints: PointArray) -> "LineArray":
+        self = super().__new__(cls)
+        self.__init__(x_coefficients, y_coefficients, constants, points_A, points_B, slopes, lengths, midpoints)
+        return self
+
+    @overload
+    def __getitem__(self, index: int) -> Line:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "LineArray":
+        ...
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return self._from_columns(*(buffer[index] for buffer in (self._a, self._b, self._c, self._A, self._B, self._slopes, self._lengths, self._midpoints)))
+
+        return Line.from_coefficients(self._a[index], self._b[index], self._c[index], self._A[index], self._B[index])
+
+    def __iter__(self) -> Iterator[Line]:
+        return map(self.__getitem__, range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"<LineArray len={len(self)}>"
+
+    @property
+    def x_coefficients(self) -> array:
+        """:class:`array.array`: The coefficients of x of every line's equation."""
+        return self._a
+
+    @property
+    def y_coefficients(self) -> array:
+        """:class:`array.array`: The coefficients of y of every line's equation."""
+        return self._b
+
+    @property
+    def constants(self) -> array:
+        """:class:`array.array`: The constants of every line's equation."""
+        return self._c
+
+    @property
+    def points_A(self) -> PointArray:
+        """:class:`.PointArray`: The points A of every line."""
+        return self._A
+
+    @property
+    def points_B(self) -> PointArray:
+        """:class:`.PointArray`: The points B of every line."""
+        return self._B
+
+    @property
+    def slopes(self) -> array:
+        """:class:`array.array`: The slopes of every line.
+
+        Vertical lines have a slope of :data:`math.inf` since the `.INFINITY` object can not be stored in a float64 buffer.
+        """
+        return self._slopes
+
+    @property
+    def lengths(self) -> array:
+        """:class:`array.array`: The length of every line from point A to point B."""
+        return self._lengths
+
+    @property
+    def midpoints(self) -> PointArray:
+        """:class:`.PointArray`: The midpoint of every line from point A to point B."""
+        return self._midpoints
+
+    @classmethod
+    def from_AB_coordinates(cls, points_A: Union[PointArray, Iterable[Point]], points_B: Union[PointArray, Iterable[Point]], /) -> "LineArray":
+        """Create many lines at once from two batches of points which will be their start and end points.
+
+        The i-th line goes from ``points_A[i]`` to ``points_B[i]``.
+        The coefficients come from the two point form of every line,
+        gcd-reduced for integer coordinates and as they are for float coordinates.
+
+        Parameters
+        ----------
+        points_A : Union[:class:`.PointArray`, Iterable[:class:`.Point`]]
+            The points from which the lines start.
+        points_B : Union[:class:`.PointArray`, Iterable[:class:`.Point`]]
+            The points where the lines end.
+
+        Returns
+        -------
+        :class:`.LineArray`
+            The newly created array.
+
+        Raises
+        ------
+        ValueError
+            If the batches are of different lengths, a line has the same point A and B
+            or the coefficients of integer coordinates do not fit in the int64 range.
+        """
+        points_A = points_A if isinstance(points_A, PointArray) else PointArray.from_points(points_A)
+        points_B = points_B if isinstance(points_B, PointArray) else PointArray.from_points(points_B)
+
+        if len(points_A) != len(points_B):
+            raise ValueError(f"Expected the same number of points A and B, but got {len(points_A)} and {len(points_B)}")
+
+        typecode = "q" if points_A.typecode == points_B.typecode == "q" else "d"
+        x1, y1, x2, y2 = points_A.xs, points_A.ys, points_B.xs, points_B.ys
+
+        # two point form, a = y2 - y1, b = x1 - x2, c = x2*y1 - x1*y2
+        a = list(map(operator.sub, y2, y1))
+        b = list(map(operator.sub, x1, x2))
+        c = list(map(operator.sub, map(operator.mul, x2, y1), map(operator.mul, x1, y2)))
+
+        for i, (u, v) in enumerate(zip(a, b)):
+            if u == 0 and v == 0:
+                raise ValueError("Expected different coordinates from point A and B, but got the same coordinates {} at index {}".format(points_A[i], i))
+
+        # same sign convention as Line: y coefficient negative, or x coefficient positive for vertical lines.
+        signs = [-1 if v > 0 or (v == 0 and u < 0) else 1 for u, v in zip(a, b)]
+        if typecode == "q":
+            if not all(_INT64_MIN <= min(buffer, default=0) and max(buffer, default=0) <= _INT64_MAX for buffer in (a, b, c)):
+                raise ValueError(
+                    f"Expected coordinates whose differences and cross products x2*y1 - x1*y2 fit the int64 range [{_INT64_MIN}, {_INT64_MAX}], "
+                    "use float coordinates for larger values"
+                )
+            divisors = list(map(operator.mul, map(math.gcd, a, b, c), signs))
+            a, b, c = (array(typecode, map(operator.floordiv, buffer, divisors)) for buffer in (a, b, c))
+        else:
+            a, b, c = (array(typecode, map(operator.mul, buffer, signs)) for buffer in (a, b, c))
+
+        slopes = kernels.slopes(x1, y1, x2, y2)
+        lengths = kernels.distances(x1, y1, x2, y2)
+        midpoints = kernels.midpoints(x1, y1, x2, y2)
+
+        return cls._from_columns(a, b, c, points_A, points_B, slopes, lengths, midpoints)
+
+    def to_lines(self) -> List[Line]:
+        """Returns the lines of this array as a list of :class:`.Line` objects.
+
+        Returns
+        -------
+        List[:class:`.Line`]
+            The list of lines.
+        """
+        return list(self)
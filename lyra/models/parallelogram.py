@@ -1,8 +1,14 @@
+from numbers import Rational
 from models.point import Point
 from models.line import Line
-from models._base_shape import _GeometricalShapeWithVertices
+from models.polygon import Polygon
 
-class Parallelogram(_GeometricalShapeWithVertices):
+class Parallelogram(Polygon):
+    """Represents a parallelogram in 2d space.
+
+    .. note::
+        This class should not be directly instantiated but instead should be created using the provided class methods.
+    """
 
     #                               1
     #                   A      (side AB)       B
@@ -14,26 +20,119 @@ class Parallelogram(_GeometricalShapeWithVertices):
     #               ---------------------
     #              C     (side CD)       D
     #                        3
+    #
+    # the vertices are stored as the polygon A, B, D, C.
+
+    __slots__ = ()
+
+    @property
+    def vertex_A(self) -> Point:
+        """:class:`.Point`: The first vertex of the parallelogram."""
+        return self[0]
+
+    @property
+    def vertex_B(self) -> Point:
+        """:class:`.Point`: The vertex next to vertex A, opposite to vertex C."""
+        return self[1]
+
+    @property
+    def vertex_C(self) -> Point:
+        """:class:`.Point`: The vertex next to vertex A, opposite to vertex B."""
+        return self[3]
+
+    @property
+    def vertex_D(self) -> Point:
+        """:class:`.Point`: The vertex opposite to vertex A."""
+        return self[2]
+
+    @property
+    def side_AB(self) -> Line:
+        """:class:`.Line`: The side from vertex A to vertex B."""
+        return self.sides[0]
+
+    @property
+    def side_BD(self) -> Line:
+        """:class:`.Line`: The side from vertex B to vertex D."""
+        return self.sides[1]
+
+    @property
+    def side_CD(self) -> Line:
+        """:class:`.Line`: The side from vertex D to vertex C."""
+        return self.sides[2]
+
+    @property
+    def side_AC(self) -> Line:
+        """:class:`.Line`: The side from vertex C to vertex A."""
+        return self.sides[3]
 
-    def __init__(self, side_1: Line, side_2: Line, side_3: Line, side_4: Line) -> None:
-        self._AB = side_1
-        self._AC = side_2
-        self._CD = side_3
-        self._BD = side_4
-        
     @staticmethod
-    def _verify_sides():
-        pass
-        
+    def _verify_vertices(A: Point, B: Point, C: Point, D: Point) -> bool:
+        # the diagonals of a parallelogram bisect each other, so A + D == B + C.
+        sums = (A.x + D.x, B.x + C.x, A.y + D.y, B.y + C.y)
+        if all(isinstance(v, Rational) for v in sums):
+            return sums[0] == sums[1] and sums[2] == sums[3]
+
+        scale = max(map(abs, sums)) or 1
+        return abs(sums[0] - sums[1]) <= 1e-9 * scale and abs(sums[2] - sums[3]) <= 1e-9 * scale
+
     @classmethod
-    def from_vertices(cls, point_A: Point, point_B: Point, point_C: Point, point_D: Point):
-        side_1 = Line.from_AB_coordinates(point_B, point_A)
-        side_2 = Line.from_AB_coordinates(point_A, point_C)
-        side_3 = Line.from_AB_coordinates(point_C, point_D)
-        side_4 = Line.from_AB_coordinates(point_D, point_B)
-        
-        return cls.from_sides(side_1, side_2, side_3, side_4)
-        
+    def from_vertices(cls, point_A: Point, point_B: Point, point_C: Point, point_D: Point) -> "Parallelogram":
+        """Creates a parallelogram from its four vertices.
+
+        Parameters
+        ----------
+        point_A : :class:`.Point`
+            The first vertex.
+        point_B : :class:`.Point`
+            The vertex next to A, opposite to C.
+        point_C : :class:`.Point`
+            The vertex next to A, opposite to B.
+        point_D : :class:`.Point`
+            The vertex opposite to A.
+
+        Returns
+        -------
+        :class:`.Parallelogram`
+            The newly created Parallelogram object
+
+        Raises
+        ------
+        ValueError
+            If the points do not form a parallelogram or integer coordinates do not fit in the int64 range.
+        """
+        if not cls._verify_vertices(point_A, point_B, point_C, point_D):
+            raise ValueError("Points do not form a parallelogram.")
+
+        return cls._from_coordinates(cls._flatten([point_A, point_B, point_D, point_C]))
+
     @classmethod
-    def from_sides(cls, AB: Line, AC: Line, CD: Line, BD: Line):
-        pass
\ No newline at end of file
+    def from_sides(cls, AB: Line, AC: Line, CD: Line, BD: Line) -> "Parallelogram":
+        """Creates a parallelogram from the lines its four sides lie on.
+
+        Parameters
+        ----------
+        AB : :class:`.Line`
+            The side between vertex A and B.
+        AC : :class:`.Line`
+            The side between vertex A and C.
+        CD : :class:`.Line`
+            The side between vertex C and D, parallel to AB.
+        BD : :class:`.Line`
+            The side between vertex B and D, parallel to AC.
+
+        Returns
+        -------
+        :class:`.Parallelogram`
+            The newly created Parallelogram object
+
+        Raises
+        ------
+        ValueError
+            If the opposite sides are not parallel or the sides do not form a parallelogram.
+        """
+        for side_1, side_2 in ((AB, CD), (AC, BD)):
+            if side_1.x_coefficient * side_2.y_coefficient != side_2.x_coefficient * side_1.y_coefficient:
+                raise ValueError(f"Expected opposite sides to be parallel, but {side_1} and {side_2} are not.")
+
+        corner = cls._corner
+        return cls.from_vertices(corner(AB, AC), corner(AB, BD), corner(AC, CD), corner(CD, BD))
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Union
 
-@dataclass
+@dataclass(frozen=True)
 class Point:
     """A dataclass representing Cartesian Coordinates in a 2D plane.
     
@@ -35,7 +35,11 @@ class Point:
         
     y: Union[:class:`int`, :class:`float`]
         The y-coordinate of the point. Also known as the vertical coordinate or the ordinate.
+    
+    Points are immutable and don't have a `__dict__` to keep them as small as possible.
     """
+    __slots__ = ("x", "y")
+    
     x: Union[int, float]
     y: Union[int, float]
     
@@ -48,6 +52,10 @@ class Point:
     def __hash__(self) -> int:
         return hash((self.x, self.y))
     
+    def __reduce__(self):
+        # the default pickling of frozen dataclasses with slots tries to set the fields on the new object and fails.
+        return type(self), (self.x, self.y)
+    
     def __add__(self, other: object):
         if not isinstance(other, Point):
             return NotImplemented
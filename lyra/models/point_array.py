@@ -0,0 +1,189 @@
+from array import array
+import operator
+from typing import Iterable, Iterator, List, Literal, Optional, Sequence, Union, overload
+from models.point import Point
+
+# contiguous buffers of machine floats/ints instead of a list of Point objects.
+# "d" is a C double (float64) and "q" is a C long long (int64).
+_TYPECODES = ("d", "q")
+
+# the integers an int64 buffer can hold.
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+class PointArray:
+    """A columnar container holding many cartesian coordinates in two contiguous buffers.
+
+    The x and y coordinates are stored in separate :class:`array.array` buffers
+    of either float64 (``"d"``) or int64 (``"q"``) values, so no per-point Python objects are created
+    unless a single point is asked for.
+
+    .. container:: operations
+
+        .. describe:: len(x)
+
+            Returns the number of points in the array.
+
+        .. describe:: x[i]
+
+            Returns the point at index i as a :class:`.Point`.
+            If a slice is passed in, a new :class:`.PointArray` is returned.
+
+        .. describe:: iter(x)
+
+            Iterates over the points as :class:`.Point` objects.
+
+        .. describe:: x == y
+
+            Checks if the array is equal to another array.
+
+        .. describe:: x + y
+
+            Adds the abscissa and ordinate of two arrays element wise.
+            If y is a :class:`.Point`, it is added to every point of the array.
+            Sums of int64 arrays outside the int64 range give a float64 array.
+
+        .. describe:: x - y
+
+            Subtracts the abscissa and ordinate of two arrays element wise.
+            If y is a :class:`.Point`, it is subtracted from every point of the array.
+            Differences of int64 arrays outside the int64 range give a float64 array.
+    """
+
+    __slots__ = ("_xs", "_ys")
+
+    def __init__(self, xs: Iterable[Union[int, float]] = (), ys: Iterable[Union[int, float]] = (), typecode: Optional[Literal["d", "q"]] = None):
+        if typecode is None:
+            xs, ys = list(xs), list(ys)
+            # integers too large for int64 are stored as float64, the same as any other non integer coordinate.
+            typecode = "q" if all(isinstance(v, int) and _INT64_MIN <= v <= _INT64_MAX for v in xs + ys) else "d"
+
+        elif typecode not in _TYPECODES:
+            raise ValueError(f"Expected one of {_TYPECODES} as the typecode, but got {typecode!r}")
+
+        try:
+            self._xs = xs if isinstance(xs, array) and xs.typecode == typecode else array(typecode, xs)
+            self._ys = ys if isinstance(ys, array) and ys.typecode == typecode else array(typecode, ys)
+        except OverflowError:
+            raise ValueError(f"Expected coordinates in the int64 range [{_INT64_MIN}, {_INT64_MAX}] for the typecode 'q'") from None
+
+        if len(self._xs) != len(self._ys):
+            raise ValueError(f"Expected the same number of x and y coordinates, but got {len(self._xs)} and {len(self._ys)}")
+
+    def __len__(self) -> int:
+        return len(self._xs)
+
+    def __reduce__(self):
+        return type(self), (self._xs, self._ys, self._xs.typecode)
+
+    @overload
+    def __getitem__(self, index: int) -> Point:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PointArray":
+        ...
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return PointArray(self._xs[index], self._ys[index], self.typecode)
+
+        return Point(self._xs[index], self._ys[index])
+
+    def __iter__(self) -> Iterator[Point]:
+        return map(Point, self._xs, self._ys)
+
+    def __str__(self) -> str:
+        return f"[{', '.join(map(str, self))}]"
+
+    def __repr__(self) -> str:
+        return f"<PointArray typecode={self.typecode!r} len={len(self)}>"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PointArray):
+            return NotImplemented
+
+        return self._xs == other._xs and self._ys == other._ys
+
+    def _binary_op(self, other: object, op):
+        if isinstance(other, Point):
+            xs = [op(v, other.x) for v in self._xs]
+            ys = [op(v, other.y) for v in self._ys]
+            typecode = "q" if self.typecode == "q" and isinstance(other.x, int) and isinstance(other.y, int) else "d"
+
+        elif isinstance(other, PointArray):
+            if len(self) != len(other):
+                raise ValueError(f"Expected arrays of the same length, but got {len(self)} and {len(other)}")
+
+            xs = list(map(op, self._xs, other._xs))
+            ys = list(map(op, self._ys, other._ys))
+            typecode = "q" if self.typecode == other.typecode == "q" else "d"
+
+        else:
+            return NotImplemented
+
+        if typecode == "q":
+            try:
+                return PointArray(array(typecode, xs), array(typecode, ys), typecode)
+            except OverflowError:
+                # results too large for int64 are stored as float64, the same as the typecode inference does.
+                typecode = "d"
+
+        return PointArray(array(typecode, xs), array(typecode, ys), typecode)
+
+    def __add__(self, other: object):
+        return self._binary_op(other, operator.add)
+
+    def __sub__(self, other: object):
+        return self._binary_op(other, operator.sub)
+
+    @property
+    def typecode(self) -> str:
+        """:class:`str`: The typecode of the underlying buffers. Either ``"d"`` (float64) or ``"q"`` (int64)."""
+        return self._xs.typecode
+
+    @property
+    def xs(self) -> array:
+        """:class:`array.array`: The buffer holding the x-coordinates of the points."""
+        return self._xs
+
+    @property
+    def ys(self) -> array:
+        """:class:`array.array`: The buffer holding the y-coordinates of the points."""
+        return self._ys
+
+    @classmethod
+    def from_points(cls, points: Iterable[Point], typecode: Optional[Literal["d", "q"]] = None) -> "PointArray":
+        """Create a new array from an iterable of :class:`.Point` objects.
+
+        Parameters
+        ----------
+        points : Iterable[:class:`.Point`]
+            The points to store in the array.
+        typecode : Optional[Literal[&quot;d&quot;, &quot;q&quot;]]
+            The typecode of the buffers. If not passed in, int64 is used when all coordinates are integers
+            in the int64 range and float64 otherwise.
+
+        Returns
+        -------
+        :class:`.PointArray`
+            The newly created array.
+
+        Raises
+        ------
+        ValueError
+            If the typecode is int64 and a coordinate is out of its range.
+        """
+        points = points if isinstance(points, Sequence) else list(points)
+        xs = [p.x for p in points]
+        ys = [p.y for p in points]
+        return cls(xs, ys, typecode)
+
+    def to_points(self) -> List[Point]:
+        """Returns the points of this array as a list of :class:`.Point` objects.
+
+        Returns
+        -------
+        List[:class:`.Point`]
+            The list of points.
+        """
+        return list(self)
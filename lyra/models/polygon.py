@@ -0,0 +1,310 @@
+from array import array
+from bisect import bisect_right
+from fractions import Fraction
+import math
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+from models.line import Line
+from models.point import Point
+from models.point_array import PointArray, _INT64_MIN, _INT64_MAX
+from models.predicates import orient
+from models._base_shape import _GeometricalShapeWithVertices
+from models._utils import cached_slot_property
+
+class Polygon(_GeometricalShapeWithVertices):
+    """Represents a simple polygon in 2d space.
+
+    The vertices are stored in a single flat buffer ``x0, y0, x1, y1, ...`` of int64 values if they are all integers
+    and float64 values otherwise. The sides go from every vertex to the next one, and from the last vertex back to the first.
+
+    .. note::
+        This class should not be directly instantiated but instead should be created using the provided class methods.
+
+    .. note::
+        The polygon is expected to be simple (its sides don't cross each other), which is not verified.
+
+    .. container:: operations
+
+        .. describe:: len(x)
+
+            Returns the number of vertices of the polygon.
+
+        .. describe:: x[i]
+
+            Returns the i-th vertex as a :class:`.Point`.
+
+        .. describe:: iter(x)
+
+            Iterates over the vertices as :class:`.Point` objects.
+
+        .. describe:: point in x
+
+            Same as `Polygon.contains_point`.
+    """
+
+    __slots__ = ("_coords", "_cached__measurements", "_cached_sides", "_cached__slabs")
+
+    def __init__(self, coordinates: array):
+        self._coords = coordinates
+
+    def __len__(self) -> int:
+        return len(self._coords) // 2
+
+    def __getitem__(self, index: int) -> Point:
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError(f"{type(self).__name__} index out of range")
+
+        return Point(self._coords[2*index], self._coords[2*index + 1])
+
+    def __iter__(self) -> Iterator[Point]:
+        return map(Point, self._coords[0::2], self._coords[1::2])
+
+    def __contains__(self, point: object) -> bool:
+        return isinstance(point, Point) and self.contains_point(point)
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}({', '.join(map(str, self))})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    def __reduce__(self):
+        return self._from_coordinates, (self._coords,)
+
+    @property
+    def vertices(self) -> PointArray:
+        """:class:`.PointArray`: The vertices of the polygon in order."""
+        return PointArray(self._coords[0::2], self._coords[1::2], self._coords.typecode)
+
+    @cached_slot_property
+    def sides(self) -> Tuple[Line, ...]:
+        """Tuple[:class:`.Line`, ...]: The sides of the polygon, the i-th one going from the i-th vertex to the next one."""
+        vertices = list(self)
+        return tuple(Line.from_AB_coordinates(A, B) for A, B in zip(vertices, vertices[1:] + vertices[:1]))
+
+    @cached_slot_property
+    def _measurements(self) -> Tuple[Union[int, float], float, Point]:
+        # the shoelace formula for the area, the perimeter and the centroid, all in a single pass over the edges.
+        coords = self._coords
+        xs, ys = coords[0::2], coords[1::2]
+        twice_area = cx = cy = 0
+        perimeter = 0.0
+        for x1, y1, x2, y2 in zip(xs, ys, xs[1:] + xs[:1], ys[1:] + ys[:1]):
+            cross = x1 * y2 - x2 * y1
+            twice_area += cross
+            cx += (x1 + x2) * cross
+            cy += (y1 + y2) * cross
+            perimeter += math.hypot(x2 - x1, y2 - y1)
+
+        return twice_area, perimeter, Point(cx / (3 * twice_area), cy / (3 * twice_area))
+
+    @property
+    def signed_area(self) -> Union[int, float]:
+        """Union[:class:`int`, :class:`float`]: The area of the polygon,
+        positive if the vertices are in counter clockwise order and negative otherwise."""
+        twice_area = self._measurements[0]
+        return twice_area // 2 if isinstance(twice_area, int) and twice_area % 2 == 0 else twice_area / 2
+
+    @property
+    def area(self) -> Union[int, float]:
+        """Union[:class:`int`, :class:`float`]: The area of the polygon."""
+        return abs(self.signed_area)
+
+    @property
+    def perimeter(self) -> float:
+        """:class:`float`: The sum of the lengths of the sides of the polygon."""
+        return self._measurements[1]
+
+    @property
+    def centroid(self) -> Point:
+        """:class:`.Point`: The center of mass of the polygon."""
+        return self._measurements[2]
+
+    @cached_slot_property
+    def _slabs(self):
+        # a slab decomposition for point location. the distinct y-coordinates of the vertices cut the plane into
+        # horizontal slabs, and the edges crossing a slab never cross each other inside of it (the polygon is simple),
+        # so they are kept sorted from left to right and a point is located with two binary searches.
+        # slab k is the half open band `ys[k] <= y < ys[k + 1]`, holding the edges with `min y <= ys[k]` and `max y >= ys[k + 1]`.
+        # that's exactly the set of edges the crossing number rule counts for any y in the band.
+        coords = self._coords
+        vertices = list(zip(coords[0::2], coords[1::2]))
+        levels = sorted({y for _, y in vertices})
+        exact = coords.typecode == "q"
+
+        edges: List[Tuple] = []
+        horizontal: Dict[Union[int, float], List[Tuple]] = {}
+        slabs: List[List[int]] = [[] for _ in range(len(levels) - 1)]
+        for (x1, y1), (x2, y2) in zip(vertices, vertices[1:] + vertices[:1]):
+            if y1 == y2:
+                horizontal.setdefault(y1, []).append((min(x1, x2), max(x1, x2)))
+                continue
+
+            if y1 > y2: # every edge goes upwards
+                x1, y1, x2, y2 = x2, y2, x1, y1
+
+            i = len(edges)
+            edges.append((x1, y1, x2, y2))
+            for k in range(bisect_right(levels, y1) - 1, bisect_right(levels, y2) - 1):
+                slabs[k].append(i)
+
+        def sorted_edges(k: int, indices: List[int]) -> List[Tuple]:
+            mid = Fraction(levels[k] + levels[k + 1], 2) if exact else (levels[k] + levels[k + 1]) / 2
+            def x_at_mid(i: int):
+                x1, y1, x2, y2 = edges[i]
+                return x1 + (mid - y1) * (x2 - x1) / (y2 - y1)
+
+            return [edges[i] for i in sorted(indices, key=x_at_mid)]
+
+        return levels, [sorted_edges(k, indices) for k, indices in enumerate(slabs)], horizontal, set(vertices)
+
+    def contains_point(self, point: Point) -> bool:
+        """Checks whether a point is inside the polygon. Points on the sides count as inside.
+
+        The first call builds a slab decomposition of the polygon, after which every check takes O(log n) time.
+
+        Parameters
+        ----------
+        point : :class:`.Point`
+            The point to check.
+
+        Returns
+        -------
+        :class:`bool`
+            A boolean indicating whether the point is inside the polygon or on one of its sides.
+        """
+        return self._locate(point.x, point.y, *self._slabs)
+
+    @staticmethod
+    def _locate(x, y, levels, slabs, horizontal, vertices) -> bool:
+        if (x, y) in vertices:
+            return True
+
+        for x_min, x_max in horizontal.get(y, ()):
+            if x_min <= x <= x_max:
+                return True
+
+        k = bisect_right(levels, y) - 1
+        if k < 0 or k >= len(slabs):
+            return False
+
+        # binary search for the first edge the point is not to the right of.
+        edges = slabs[k]
+        lo, hi = 0, len(edges)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            x1, y1, x2, y2 = edges[mid]
+            if orient(x1, y1, x2, y2, x, y) < 0:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        if lo < len(edges):
+            x1, y1, x2, y2 = edges[lo]
+            if orient(x1, y1, x2, y2, x, y) == 0:
+                return True
+
+        # the number of edges to the left of the point is odd when it's inside.
+        return lo % 2 == 1
+
+    def contains_points(self, points: Union[PointArray, Iterable[Point]]) -> array:
+        """Checks a whole batch of points at once, as `Polygon.contains_point` does.
+
+        Parameters
+        ----------
+        points : Union[:class:`.PointArray`, Iterable[:class:`.Point`]]
+            The points to check.
+
+        Returns
+        -------
+        :class:`array.array`
+            Whether every point is inside the polygon or on one of its sides, as 0 or 1.
+        """
+        points = points if isinstance(points, PointArray) else PointArray.from_points(points)
+        locate, slabs = self._locate, self._slabs
+        return array("b", (locate(x, y, *slabs) for x, y in zip(points.xs, points.ys)))
+
+    @classmethod
+    def _from_coordinates(cls, coordinates: array) -> "Polygon":
+        self = super(_GeometricalShapeWithVertices, cls).__new__(cls)
+        self.__init__(coordinates)
+        return self
+
+    @staticmethod
+    def _flatten(vertices: List[Point]) -> array:
+        # raises a ValueError if the vertices don't form a proper polygon or their integer coordinates don't fit in int64.
+        if len(vertices) < 3:
+            raise ValueError(f"Expected at least 3 vertices, but got {len(vertices)}")
+
+        for i, (A, B) in enumerate(zip(vertices, vertices[1:] + vertices[:1])):
+            if A == B:
+                raise ValueError(f"Expected different consecutive vertices, but got {A} twice at index {i}")
+
+        values = [v for point in vertices for v in (point.x, point.y)]
+        try:
+            coordinates = array("q" if all(isinstance(v, int) for v in values) else "d", values)
+        except OverflowError:
+            raise ValueError(f"Expected integer coordinates in the int64 range [{_INT64_MIN}, {_INT64_MAX}]") from None
+
+        xs, ys = coordinates[0::2], coordinates[1::2]
+        if sum(x1 * y2 - x2 * y1 for x1, y1, x2, y2 in zip(xs, ys, xs[1:] + xs[:1], ys[1:] + ys[:1])) == 0:
+            raise ValueError("Points do not form a polygon.")
+
+        return coordinates
+
+    @classmethod
+    def from_vertices(cls, *vertices: Point) -> "Polygon":
+        """Creates a polygon from its vertices in order.
+
+        Parameters
+        ----------
+        *vertices : :class:`.Point`
+            The vertices of the polygon, in clockwise or counter clockwise order.
+
+        Returns
+        -------
+        :class:`.Polygon`
+            The newly created Polygon object
+
+        Raises
+        ------
+        ValueError
+            If there are less than 3 vertices, two consecutive vertices are the same, the polygon has no area
+            or integer coordinates do not fit in the int64 range.
+        """
+        return cls._from_coordinates(cls._flatten(list(vertices)))
+
+    @staticmethod
+    def _corner(side_1: Line, side_2: Line) -> Point:
+        a1, b1 = side_1.x_coefficient, side_1.y_coefficient
+        a2, b2 = side_2.x_coefficient, side_2.y_coefficient
+        if a1 * b2 - a2 * b1 == 0:
+            raise ValueError(f"Consecutive sides {side_1} and {side_2} are parallel.")
+
+        return side_1.intersects_with_line_on_point(side_2)
+
+    @classmethod
+    def from_sides(cls, *sides: Line) -> "Polygon":
+        """Creates a polygon from the lines its sides lie on, in order.
+
+        The i-th vertex is where the i-th side meets the previous one (the last side for the first vertex).
+
+        Parameters
+        ----------
+        *sides : :class:`.Line`
+            The sides of the polygon.
+
+        Returns
+        -------
+        :class:`.Polygon`
+            The newly created Polygon object
+
+        Raises
+        ------
+        ValueError
+            If two consecutive sides are parallel or the sides do not form a polygon.
+        """
+        sides = list(sides)
+        return cls.from_vertices(*(cls._corner(sides[i - 1], sides[i]) for i in range(len(sides))))
@@ -0,0 +1,211 @@
+"""Robust geometric predicates on raw coordinates.
+
+Every predicate returns the exact sign of a determinant (or a boolean made from such signs) for the coordinates as given,
+no matter how close to 0 the determinant is. Integer and fraction coordinates are always calculated exactly.
+Float coordinates are first calculated with plain floats and the result is kept when it is further away from 0
+than the largest rounding error the calculation could have made, which is almost always the case.
+Only the ambiguous cases are calculated again exactly with :class:`fractions.Fraction`.
+
+The error bounds are the ones from Shewchuk's "Adaptive Precision Floating-Point Arithmetic and Fast Robust Geometric Predicates".
+They only hold for finite coordinates.
+"""
+from fractions import Fraction
+from typing import Union
+
+_Number = Union[int, float, Fraction]
+
+_EPSILON = 2.0 ** -53
+
+# the rounding error of `a*d - b*c` (and the other sums of two or three products) is below this times the sum of the absolute products.
+_PRODUCTS_BOUND = (3.0 + 16.0 * _EPSILON) * _EPSILON
+_ORIENT_BOUND = (3.0 + 16.0 * _EPSILON) * _EPSILON
+_INCIRCLE_BOUND = (10.0 + 96.0 * _EPSILON) * _EPSILON
+
+# integers past this can't be converted to floats exactly, so the float bounds don't hold for them.
+_MAX_EXACT_INT = 2 ** 53
+
+def _filterable(*values: _Number) -> bool:
+    # whether every value is a float or an integer a float holds exactly.
+    # the predicates check the common case of all floats inline before calling this.
+    for v in values:
+        t = type(v)
+        if t is not float and (t is not int or not -_MAX_EXACT_INT <= v <= _MAX_EXACT_INT):
+            return False
+
+    return True
+
+def _sign(value: _Number) -> int:
+    return (value > 0) - (value < 0)
+
+def _difference_sign(left: float, right: float) -> int:
+    # the sign of `left - right` when it can be told from the signs alone (rounding never changes the sign of a product),
+    # otherwise 2.
+    if left > 0:
+        return 1 if right <= 0 else 2
+    if left < 0:
+        return -1 if right >= 0 else 2
+    return -_sign(right)
+
+def _filtered(value: float, bound: float) -> int:
+    # the sign of a float result if it can be trusted, otherwise 2.
+    if value > bound:
+        return 1
+    if value < -bound:
+        return -1
+    return 2
+
+def orient(ax: _Number, ay: _Number, bx: _Number, by: _Number, cx: _Number, cy: _Number) -> int:
+    """Returns the orientation of three points.
+
+    Returns
+    -------
+    :class:`int`
+        1 if the points a, b and c are in counter clockwise order, -1 if they are in clockwise order and 0 if they are collinear.
+    """
+    left = (bx - ax) * (cy - ay)
+    right = (by - ay) * (cx - ax)
+    det = left - right
+    if type(det) is not float:
+        return _sign(det)
+
+    if type(ax) is type(ay) is type(bx) is type(by) is type(cx) is type(cy) is float or _filterable(ax, ay, bx, by, cx, cy):
+        sign = _difference_sign(left, right)
+        if sign == 2:
+            sign = _filtered(det, _ORIENT_BOUND * (abs(left) + abs(right)))
+        if sign != 2:
+            return sign
+
+    ax, ay, bx, by, cx, cy = map(Fraction, (ax, ay, bx, by, cx, cy))
+    return _sign((bx - ax) * (cy - ay) - (by - ay) * (cx - ax))
+
+def incircle(ax: _Number, ay: _Number, bx: _Number, by: _Number, cx: _Number, cy: _Number, dx: _Number, dy: _Number) -> int:
+    """Returns where a point d lies compared to the circle through the points a, b and c.
+
+    Returns
+    -------
+    :class:`int`
+        1 if d is inside the circle, -1 if it's outside and 0 if it's on the circle when a, b and c are in counter clockwise order.
+        The signs are the other way around when they are in clockwise order.
+    """
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+
+    bdxcdy, cdxbdy = bdx * cdy, cdx * bdy
+    cdxady, adxcdy = cdx * ady, adx * cdy
+    adxbdy, bdxady = adx * bdy, bdx * ady
+    alift = adx * adx + ady * ady
+    blift = bdx * bdx + bdy * bdy
+    clift = cdx * cdx + cdy * cdy
+
+    det = alift * (bdxcdy - cdxbdy) + blift * (cdxady - adxcdy) + clift * (adxbdy - bdxady)
+    if type(det) is not float:
+        return _sign(det)
+
+    if type(ax) is type(ay) is type(bx) is type(by) is type(cx) is type(cy) is type(dx) is type(dy) is float or _filterable(ax, ay, bx, by, cx, cy, dx, dy):
+        permanent = (
+            (abs(bdxcdy) + abs(cdxbdy)) * alift
+            + (abs(cdxady) + abs(adxcdy)) * blift
+            + (abs(adxbdy) + abs(bdxady)) * clift
+        )
+        sign = _filtered(det, _INCIRCLE_BOUND * permanent)
+        if sign != 2:
+            return sign
+
+    adx, ady, bdx, bdy, cdx, cdy = (Fraction(v) - Fraction(w) for v, w in ((ax, dx), (ay, dy), (bx, dx), (by, dy), (cx, dx), (cy, dy)))
+    return _sign(
+        (adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+        + (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy)
+        + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady)
+    )
+
+def cross_sign(ux: _Number, uy: _Number, vx: _Number, vy: _Number) -> int:
+    """Returns the sign of the cross product of two vectors, ``ux*vy - uy*vx``.
+
+    This is 0 exactly when the vectors are parallel, which is how parallel lines are found from their coefficients.
+    """
+    left, right = ux * vy, uy * vx
+    det = left - right
+    if type(det) is not float:
+        return _sign(det)
+
+    if type(ux) is type(uy) is type(vx) is type(vy) is float or _filterable(ux, uy, vx, vy):
+        sign = _difference_sign(left, right)
+        if sign == 2:
+            sign = _filtered(det, _PRODUCTS_BOUND * (abs(left) + abs(right)))
+        if sign != 2:
+            return sign
+
+    return _sign(Fraction(ux) * Fraction(vy) - Fraction(uy) * Fraction(vx))
+
+def dot_sign(ux: _Number, uy: _Number, vx: _Number, vy: _Number) -> int:
+    """Returns the sign of the dot product of two vectors, ``ux*vx + uy*vy``.
+
+    This is 0 exactly when the vectors are perpendicular.
+    """
+    left, right = ux * vx, uy * vy
+    dot = left + right
+    if type(dot) is not float:
+        return _sign(dot)
+
+    if type(ux) is type(uy) is type(vx) is type(vy) is float or _filterable(ux, uy, vx, vy):
+        sign = _difference_sign(left, -right)
+        if sign == 2:
+            sign = _filtered(dot, _PRODUCTS_BOUND * (abs(left) + abs(right)))
+        if sign != 2:
+            return sign
+
+    return _sign(Fraction(ux) * Fraction(vx) + Fraction(uy) * Fraction(vy))
+
+def line_side(a: _Number, b: _Number, c: _Number, x: _Number, y: _Number) -> int:
+    """Returns the side of the line ``ax + by + c = 0`` a point is on.
+
+    Returns
+    -------
+    :class:`int`
+        The sign of ``ax + by + c``, which is 0 if the point is on the line.
+    """
+    ax, by = a * x, b * y
+    value = ax + by + c
+    if type(value) is not float:
+        return _sign(value)
+
+    if type(a) is type(b) is type(c) is type(x) is type(y) is float or _filterable(a, b, c, x, y):
+        sign = _filtered(value, _PRODUCTS_BOUND * (abs(ax) + abs(by) + abs(c)))
+        if sign != 2:
+            return sign
+
+    return _sign(Fraction(a) * Fraction(x) + Fraction(b) * Fraction(y) + Fraction(c))
+
+def point_on_line(a: _Number, b: _Number, c: _Number, x: _Number, y: _Number) -> bool:
+    """Checks whether a point is on the line ``ax + by + c = 0``, same as ``line_side(a, b, c, x, y) == 0``."""
+    return line_side(a, b, c, x, y) == 0
+
+def _between(px: _Number, py: _Number, qx: _Number, qy: _Number, x: _Number, y: _Number) -> bool:
+    # whether a point collinear with the segment pq is inside its bounding box.
+    return min(px, qx) <= x <= max(px, qx) and min(py, qy) <= y <= max(py, qy)
+
+def segments_intersect(
+    ax: _Number, ay: _Number, bx: _Number, by: _Number,
+    cx: _Number, cy: _Number, dx: _Number, dy: _Number,
+) -> bool:
+    """Checks whether the segments ab and cd have any point in common, including their ends.
+
+    Returns
+    -------
+    :class:`bool`
+        True if the segments cross each other, touch or overlap.
+    """
+    o1 = orient(ax, ay, bx, by, cx, cy)
+    o2 = orient(ax, ay, bx, by, dx, dy)
+    o3 = orient(cx, cy, dx, dy, ax, ay)
+    o4 = orient(cx, cy, dx, dy, bx, by)
+    if o1 * o2 < 0 and o3 * o4 < 0:
+        return True
+
+    return (
+        (o1 == 0 and _between(ax, ay, bx, by, cx, cy))
+        or (o2 == 0 and _between(ax, ay, bx, by, dx, dy))
+        or (o3 == 0 and _between(cx, cy, dx, dy, ax, ay))
+        or (o4 == 0 and _between(cx, cy, dx, dy, bx, by))
+    )
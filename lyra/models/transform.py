@@ -0,0 +1,410 @@
+from array import array
+from fractions import Fraction
+import math
+import operator
+from numbers import Rational
+from typing import List, Optional, Tuple, TypeVar, Union
+from models.line import Line
+from models.line_array import LineArray
+from models.point import Point
+from models.point_array import PointArray, _INT64_MIN, _INT64_MAX
+from models.polygon import Polygon
+from models.triangle import Triangle
+from models.triangle_array import TriangleArray
+from models._utils import cached_slot_property
+
+_Number = Union[int, float, Fraction]
+# the buffers of a batch paired with their new values.
+_Updates = List[Tuple[array, list]]
+_Transformable = TypeVar("_Transformable", Point, Line, Triangle, Polygon, PointArray, LineArray, TriangleArray)
+
+def _floats(buffer: array) -> array:
+    return buffer if buffer.typecode == "d" else array("d", buffer)
+
+def _fit(updates: _Updates) -> bool:
+    # whether the new values of the int64 buffers stay in the int64 range.
+    return all(
+        buffer.typecode != "q" or (_INT64_MIN <= min(values, default=0) and max(values, default=0) <= _INT64_MAX)
+        for buffer, values in updates
+    )
+
+def _write(updates: _Updates):
+    for buffer, values in updates:
+        buffer[:] = array(buffer.typecode, values)
+
+def _exact(value: _Number) -> _Number:
+    # keeps exact results as plain ints whenever possible.
+    return value.numerator if isinstance(value, Fraction) and value.denominator == 1 else value
+
+class AffineTransform:
+    """An affine transformation of the 2D plane, such as a rotation, scaling, shear or translation.
+
+    The transformation is the 3x3 matrix::
+
+        | a  b  c |
+        | d  e  f |
+        | 0  0  1 |
+
+    which maps a point ``(x, y)`` to ``(a*x + b*y + c, d*x + e*y + f)``.
+    Integer and :class:`fractions.Fraction` entries are kept exact, so are the inverses of such transforms.
+
+    .. container:: operations
+
+        .. describe:: x(y)
+
+            Returns the transformed shape, same as `AffineTransform.apply`.
+
+        .. describe:: x @ y
+
+            Returns the composition of the two transforms, applying y first and then x.
+
+        .. describe:: x == y
+
+            Checks if the transform has the same matrix as another transform.
+
+        .. describe:: hash(x)
+
+            Returns the hash of the transform.
+    """
+
+    __slots__ = ("_m", "_cached__inverse")
+
+    def __init__(self, a: _Number, b: _Number, c: _Number, d: _Number, e: _Number, f: _Number):
+        self._m = (a, b, c, d, e, f)
+
+    def __repr__(self) -> str:
+        a, b, c, d, e, f = self._m
+        return f"AffineTransform(({a}, {b}, {c}), ({d}, {e}, {f}), (0, 0, 1))"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AffineTransform):
+            return NotImplemented
+
+        return self._m == other._m
+
+    def __hash__(self) -> int:
+        return hash(self._m)
+
+    def __matmul__(self, other: object) -> "AffineTransform":
+        if not isinstance(other, AffineTransform):
+            return NotImplemented
+
+        a1, b1, c1, d1, e1, f1 = self._m
+        a2, b2, c2, d2, e2, f2 = other._m
+        return AffineTransform(
+            a1*a2 + b1*d2, a1*b2 + b1*e2, a1*c2 + b1*f2 + c1,
+            d1*a2 + e1*d2, d1*b2 + e1*e2, d1*c2 + e1*f2 + f1,
+        )
+
+    def __call__(self, shape: _Transformable) -> _Transformable:
+        return self.apply(shape)
+
+    @property
+    def matrix(self) -> Tuple[Tuple[_Number, _Number, _Number], Tuple[_Number, _Number, _Number], Tuple[int, int, int]]:
+        """Tuple[Tuple[Union[:class:`int`, :class:`float`], ...], ...]: The rows of the 3x3 matrix of the transform."""
+        a, b, c, d, e, f = self._m
+        return (a, b, c), (d, e, f), (0, 0, 1)
+
+    @property
+    def determinant(self) -> _Number:
+        """Union[:class:`int`, :class:`float`]: The determinant of the matrix, the factor areas are scaled by.
+        It's negative if the transform mirrors shapes."""
+        a, b, _, d, e, _ = self._m
+        return a*e - b*d
+
+    @property
+    def _integral(self) -> bool:
+        return all(isinstance(v, int) for v in self._m)
+
+    @classmethod
+    def identity(cls) -> "AffineTransform":
+        """Returns the transform that leaves everything as is."""
+        return cls(1, 0, 0, 0, 1, 0)
+
+    @classmethod
+    def translation(cls, dx: _Number, dy: _Number) -> "AffineTransform":
+        """Returns a transform moving everything by ``dx`` horizontally and ``dy`` vertically."""
+        return cls(1, 0, dx, 0, 1, dy)
+
+    @classmethod
+    def scaling(cls, sx: _Number, sy: Optional[_Number] = None, center: Optional[Point] = None) -> "AffineTransform":
+        """Returns a transform scaling everything by ``sx`` horizontally and ``sy`` vertically (``sx`` by default) around a center point (the origin by default)."""
+        sy = sx if sy is None else sy
+        transform = cls(sx, 0, 0, 0, sy, 0)
+        return transform if center is None else transform._around(center)
+
+    @classmethod
+    def rotation(cls, angle: _Number, center: Optional[Point] = None) -> "AffineTransform":
+        """Returns a transform rotating everything counter clockwise by an angle in degrees around a center point (the origin by default).
+
+        Rotations by multiples of 90 degrees are exact.
+        """
+        if angle % 90 == 0:
+            cos, sin = ((1, 0), (0, 1), (-1, 0), (0, -1))[int(angle // 90) % 4]
+        else:
+            radians = math.radians(angle)
+            cos, sin = math.cos(radians), math.sin(radians)
+
+        transform = cls(cos, -sin, 0, sin, cos, 0)
+        return transform if center is None else transform._around(center)
+
+    @classmethod
+    def shear(cls, shx: _Number, shy: _Number = 0) -> "AffineTransform":
+        """Returns a transform shearing everything, moving x by ``shx * y`` and y by ``shy * x``."""
+        return cls(1, shx, 0, shy, 1, 0)
+
+    @classmethod
+    def from_matrix(cls, matrix) -> "AffineTransform":
+        """Creates a transform from the rows of its 3x3 matrix, or just the first two rows.
+
+        Raises
+        ------
+        ValueError
+            If the last row of a 3x3 matrix is not ``(0, 0, 1)``.
+        """
+        rows = [tuple(row) for row in matrix]
+        if len(rows) == 3 and rows[2] != (0, 0, 1):
+            raise ValueError(f"Expected (0, 0, 1) as the last row of an affine transform, but got {rows[2]}")
+
+        (a, b, c), (d, e, f) = rows[:2]
+        return cls(a, b, c, d, e, f)
+
+    def _around(self, center: Point) -> "AffineTransform":
+        return AffineTransform.translation(center.x, center.y) @ self @ AffineTransform.translation(-center.x, -center.y)
+
+    def then(self, other: "AffineTransform") -> "AffineTransform":
+        """Returns the transform applying this transform first and then another one, the same as ``other @ self``."""
+        return other @ self
+
+    def inverse(self) -> "AffineTransform":
+        """Returns the transform undoing this transform.
+
+        Raises
+        ------
+        ValueError
+            If the transform collapses the plane onto a line or point (its determinant is 0) and can't be undone.
+        """
+        return self._inverse
+
+    @cached_slot_property
+    def _inverse(self) -> "AffineTransform":
+        a, b, c, d, e, f = self._m
+        det = self.determinant
+        if det == 0:
+            raise ValueError(f"{self} is not invertible.")
+
+        if all(isinstance(v, Rational) for v in self._m):
+            det = Fraction(det)
+
+        ia, ib, id_, ie = e / det, -b / det, -d / det, a / det
+        return AffineTransform(*map(_exact, (ia, ib, -(ia*c + ib*f), id_, ie, -(id_*c + ie*f))))
+
+    def _point(self, x: _Number, y: _Number) -> Tuple[_Number, _Number]:
+        a, b, c, d, e, f = self._m
+        return a*x + b*y + c, d*x + e*y + f
+
+    def _line_coefficients(self, x_coefficient: _Number, y_coefficient: _Number, constant: _Number) -> Tuple[_Number, _Number, _Number]:
+        # a point p is on the line when `(a, b, c) . p == 0`, so its image M p is on the line `(a, b, c) M^-1`,
+        # which is multiplying the coefficients by the inverse transpose.
+        ia, ib, ic, id_, ie, if_ = self.inverse()._m
+        return (
+            _exact(x_coefficient*ia + y_coefficient*id_),
+            _exact(x_coefficient*ib + y_coefficient*ie),
+            _exact(x_coefficient*ic + y_coefficient*if_ + constant),
+        )
+
+    def _line(self, line: Line) -> Line:
+        coefficients = self._line_coefficients(line.x_coefficient, line.y_coefficient, line.constant)
+        if all(isinstance(v, Rational) for v in coefficients):
+            coefficients = Line.from_coefficients(*coefficients).canonical_coefficients
+
+        # anchors that were never accessed are left to be generated for the new line.
+        A, B = line._A, line._B
+        return Line.from_coefficients(
+            *coefficients,
+            None if A is None else Point(*self._point(A.x, A.y)),
+            None if B is None else Point(*self._point(B.x, B.y)),
+        )
+
+    def apply(self, shape: _Transformable) -> _Transformable:
+        """Returns a transformed copy of a shape.
+
+        Lines are transformed directly through their coefficients (with the inverse transpose of the matrix)
+        along with their anchor points, so nothing is calculated again from the points.
+        Columnar batches of int64 values whose results leave the int64 range are returned as float64 batches.
+
+        Parameters
+        ----------
+        shape : Union[:class:`.Point`, :class:`.Line`, :class:`.Triangle`, :class:`.Polygon`, :class:`.PointArray`, :class:`.LineArray`, :class:`.TriangleArray`]
+            The shape to transform.
+
+        Returns
+        -------
+        Union[:class:`.Point`, :class:`.Line`, :class:`.Triangle`, :class:`.Polygon`, :class:`.PointArray`, :class:`.LineArray`, :class:`.TriangleArray`]
+            The transformed shape, of the same type.
+
+        Raises
+        ------
+        ValueError
+            If the transform is not invertible and the shape is not a point or :class:`.PointArray`.
+        TypeError
+            If the shape can't be transformed.
+        """
+        if isinstance(shape, Point):
+            return Point(*self._point(shape.x, shape.y))
+
+        if isinstance(shape, Line):
+            return self._line(shape)
+
+        if isinstance(shape, Triangle):
+            return Triangle._from_verified_sides(self._line(shape.side_A), self._line(shape.side_B), self._line(shape.side_C))
+
+        if isinstance(shape, Polygon):
+            if self.determinant == 0:
+                raise ValueError(f"{self} collapses polygons.")
+
+            return type(shape)._from_coordinates(type(shape)._flatten([self.apply(vertex) for vertex in shape]))
+
+        if isinstance(shape, (PointArray, LineArray, TriangleArray)):
+            copy = shape[:] if self._integral else self._as_float(shape)
+            updates = self._updates(copy)
+            if not _fit(updates):
+                # int64 results that leave the int64 range are kept as float64 instead.
+                copy = self._as_float(shape)
+                updates = self._updates(copy)
+
+            _write(updates)
+            return copy
+
+        raise TypeError(f"Can not transform {type(shape).__name__} objects.")
+
+    @staticmethod
+    def _as_float(shape: Union[PointArray, LineArray, TriangleArray]) -> Union[PointArray, LineArray, TriangleArray]:
+        # a float64 copy of a batch, since int64 buffers can only hold the results of integer transforms.
+        def points(P: PointArray) -> PointArray:
+            return PointArray(_floats(P.xs), _floats(P.ys), "d")
+
+        if isinstance(shape, PointArray):
+            return points(shape)
+
+        if isinstance(shape, LineArray):
+            return LineArray._from_columns(
+                _floats(shape.x_coefficients), _floats(shape.y_coefficients), _floats(shape.constants),
+                points(shape.points_A), points(shape.points_B), shape.slopes[:], shape.lengths[:], points(shape.midpoints),
+            )
+
+        if isinstance(shape, TriangleArray):
+            return TriangleArray._from_columns(points(shape.vertices_A), points(shape.vertices_B), points(shape.vertices_C), _floats(shape._det))
+
+        return shape
+
+    def _point_updates(self, points: PointArray) -> _Updates:
+        a, b, c, d, e, f = self._m
+        xs, ys = points.xs, points.ys
+        return [
+            (xs, [a*x + b*y + c for x, y in zip(xs, ys)]),
+            (ys, [d*x + e*y + f for x, y in zip(xs, ys)]),
+        ]
+
+    def _updates(self, shapes: Union[PointArray, LineArray, TriangleArray]) -> _Updates:
+        # the new values of every buffer of a batch, calculated before anything is overwritten
+        # so a batch is never left half transformed.
+        if isinstance(shapes, PointArray):
+            if shapes.typecode == "q" and not self._integral:
+                raise ValueError("Can not transform int64 points in place with a non integer transform.")
+
+            return self._point_updates(shapes)
+
+        if isinstance(shapes, LineArray):
+            return self._line_updates(shapes)
+
+        if isinstance(shapes, TriangleArray):
+            det = self.determinant
+            if det == 0:
+                raise ValueError(f"{self} collapses triangles.")
+
+            if shapes._det.typecode == "q" and not self._integral:
+                raise ValueError("Can not transform int64 triangles in place with a non integer transform.")
+
+            updates = [update for P in (shapes.vertices_A, shapes.vertices_B, shapes.vertices_C) for update in self._point_updates(P)]
+            updates.append((shapes._det, [v * det for v in shapes._det]))
+            return updates
+
+        raise TypeError(f"Can not transform {type(shapes).__name__} objects in place.")
+
+    def apply_in_place(self, shapes: Union[PointArray, LineArray, TriangleArray]) -> Union[PointArray, LineArray, TriangleArray]:
+        """Transforms a columnar batch of shapes by overwriting its buffers, without allocating a new batch.
+
+        Every derived buffer (such as the slopes and lengths of a :class:`.LineArray`) is updated as well
+        and the cached values of a :class:`.TriangleArray` are cleared.
+        The batch is left unchanged if any of the checks below fail.
+
+        Parameters
+        ----------
+        shapes : Union[:class:`.PointArray`, :class:`.LineArray`, :class:`.TriangleArray`]
+            The batch to transform.
+
+        Returns
+        -------
+        Union[:class:`.PointArray`, :class:`.LineArray`, :class:`.TriangleArray`]
+            The same batch, for convenience.
+
+        Raises
+        ------
+        ValueError
+            If the batch holds int64 values and the transform has non integer entries or moves them out of the int64 range,
+            or the batch holds lines or triangles and the transform is not invertible.
+        TypeError
+            If the batch can't be transformed.
+        """
+        updates = self._updates(shapes)
+        if not _fit(updates):
+            raise ValueError(f"Can not transform int64 values in place when the results leave the int64 range [{_INT64_MIN}, {_INT64_MAX}].")
+
+        _write(updates)
+        if isinstance(shapes, TriangleArray):
+            shapes._clear_cache()
+
+        return shapes
+
+    def _line_updates(self, lines: LineArray) -> _Updates:
+        A, B, mid = lines.points_A, lines.points_B, lines.midpoints
+        a_, b_, c_ = lines.x_coefficients, lines.y_coefficients, lines.constants
+        exact = a_.typecode == "q"
+        inverse = self.inverse()
+        if (exact or "q" in (A.typecode, B.typecode)) and not self._integral:
+            raise ValueError("Can not transform int64 lines in place with a non integer transform.")
+
+        if exact:
+            # the coefficients are homogeneous, so any multiple of the inverse works as well.
+            # the adjugate (determinant times the inverse, constant included) of an integer transform is always integral,
+            # and the gcd reduction below removes the extra factor again.
+            a, b, c, d, e, f = self._m
+            ia, ib, ic, id_, ie, if_, scale = e, -b, b*f - c*e, -d, a, c*d - a*f, self.determinant
+        else:
+            ia, ib, ic, id_, ie, if_ = inverse._m
+            scale = 1
+
+        updates = [update for P in (A, B, mid) for update in self._point_updates(P)]
+
+        coefficients = []
+        for a, b, c in zip(a_, b_, c_):
+            a, b, c = a*ia + b*id_, a*ib + b*ie, a*ic + b*if_ + c*scale
+            # keep the normalization of `LineArray.from_AB_coordinates`, gcd-reduced for int64 lines
+            # and with a negative y coefficient (or positive x coefficient for vertical lines).
+            g = math.gcd(a, b, c) if exact else 1
+            if b > 0 or (b == 0 and a < 0):
+                g = -g
+
+            coefficients.append((a // g, b // g, c // g) if exact else (a / g, b / g, c / g))
+
+        updates.extend(zip((a_, b_, c_), map(list, zip(*coefficients)) if coefficients else ([], [], [])))
+
+        (_, x1), (_, y1), (_, x2), (_, y2) = updates[:4]
+        slopes, lengths = [], []
+        for dx, dy in zip(map(operator.sub, x2, x1), map(operator.sub, y2, y1)):
+            slopes.append(dy / dx if dx else math.inf)
+            lengths.append(math.hypot(dx, dy))
+
+        updates.extend(((lines.slopes, slopes), (lines.lengths, lengths)))
+        return updates
@@ -1,6 +1,8 @@
 from models.line import Line
 from models.point import Point
 from models._base_shape import _GeometricalShapeWithVertices
+from models.instrumentation import _recording, _count
+from models.predicates import orient
 
 class Triangle(_GeometricalShapeWithVertices):
     """Represents a triangle in 2d space.
@@ -32,6 +34,9 @@ class Triangle(_GeometricalShapeWithVertices):
         
     def __str__(self) -> str:
         return f"{self.side_A}\n{self.side_B}\n{self.side_C}"
+    
+    def __reduce__(self):
+        return self._from_verified_sides, (self._A, self._B, self._C)
         
     @property
     def side_A(self):
@@ -66,12 +71,15 @@ class Triangle(_GeometricalShapeWithVertices):
     
     @property
     def area(self):
+        """Union[:class:`int`, :class:`float`]: The area of the triangle, the same as `TriangleArray.areas` gives for it."""
         A, B, C = self.vertex_A, self.vertex_B, self.vertex_C
         x1, y1 = A.x, A.y
         x2, y2 = B.x, B.y
         x3, y3 = C.x, C.y
         
-        return (x1 * (y2 - y3)) - (x2 * (y1 - y3)) + (x3 * (y1 - y2))
+        # the determinant is twice the signed area, halved the same way as `Polygon.signed_area`.
+        twice_area = abs((x1 * (y2 - y3)) - (x2 * (y1 - y3)) + (x3 * (y1 - y2)))
+        return twice_area // 2 if isinstance(twice_area, int) and twice_area % 2 == 0 else twice_area / 2
     
     def is_isoceles(self):
         """Checks if the triangle is an isoceles triangle.
@@ -142,20 +150,23 @@ class Triangle(_GeometricalShapeWithVertices):
     
     @staticmethod
     def _verify_sides(side_a: Line, side_b: Line, side_c: Line):
-        angle1 = side_a.angle_with_line(side_b)
-        angle2 = side_a.angle_with_line(side_c)
-        angle3 = side_b.angle_with_line(side_c)
-        condition1 = sum([angle1, angle2, angle3]) == 180
-        
-        a_len = side_a.length
-        b_len = side_b.length
-        c_len = side_c.length
-        condition2 = all([a_len + b_len > c_len, a_len + c_len > b_len, b_len + c_len > a_len])
-        
-        points = [side_a.point_A, side_a.point_B, side_b.point_A, side_b.point_B, side_c.point_A, side_c.point_B]
-        condition3 = len(set(points)) == 3 # enforcing that all 3 three lines have atleast 1 point in common (i.e. they are not collinear)
+        # the sides have to join three points pairwise, each side between a different pair of them,
+        # and those points must not be collinear, which is checked exactly with the orientation test.
+        # this is all the angle sum and triangle inequality checks would tell, without any float comparisons.
+        pairs = {frozenset((side.point_A, side.point_B)) for side in (side_a, side_b, side_c)}
+        points = set().union(*pairs)
+        if len(pairs) != 3 or len(points) != 3:
+            return False
         
-        return all([condition1, condition2, condition3])
+        A, B, C = points
+        return orient(A.x, A.y, B.x, B.y, C.x, C.y) != 0
+    
+    @staticmethod
+    def _verify_vertices(A: Point, B: Point, C: Point):
+        # three points form a triangle as long as they are not collinear,
+        # which is the case when the cross product of AB and AC is not 0 (also known as the orientation test).
+        # this also covers any two of the points being the same.
+        return orient(A.x, A.y, B.x, B.y, C.x, C.y) != 0
     
     @classmethod
     def from_sides(cls, side_a: Line, side_b: Line, side_c: Line) -> "Triangle":
@@ -181,12 +192,16 @@ class Triangle(_GeometricalShapeWithVertices):
             If given sides do not form a triangle.
         """
         if not cls._verify_sides(side_a, side_b, side_c):
+            if _recording:
+                _count("Triangle.rejected_sides")
             raise ValueError("Sides do not form a triangle.")
         
+        return cls._from_verified_sides(side_a, side_b, side_c)
+    
+    @classmethod
+    def _from_verified_sides(cls, side_a: Line, side_b: Line, side_c: Line) -> "Triangle":
         self = super(_GeometricalShapeWithVertices, cls).__new__(cls)
-        
         self.__init__(side_a, side_b, side_c)
-        
         return self
     
     @classmethod
@@ -212,7 +227,14 @@ class Triangle(_GeometricalShapeWithVertices):
         ValueError
             If the points do not form a proper triangle.
         """
+        if not cls._verify_vertices(A, B, C):
+            if _recording:
+                _count("Triangle.rejected_vertices")
+            raise ValueError("Points do not form a triangle.")
+        
         side_a = Line.from_AB_coordinates(B, C)
         side_b = Line.from_AB_coordinates(A, C)
         side_c = Line.from_AB_coordinates(A, B)
-        return cls.from_sides(side_a, side_b, side_c)
\ No newline at end of file
+        
+        # the vertices are already known to form a triangle, so `Triangle._verify_sides` can be skipped.
+        return cls._from_verified_sides(side_a, side_b, side_c)
\ No newline at end of file
@@ -0,0 +1,266 @@
+from array import array
+from fractions import Fraction
+import math
+import operator
+from typing import Iterable, Iterator, List, Sequence, Union, overload
+from models.point import Point
+from models.point_array import PointArray
+from models.predicates import orient
+from models.triangle import Triangle
+from models._utils import cached_slot_property
+
+_Column = Sequence[Union[int, float]]
+
+def _determinants(ax: _Column, ay: _Column, bx: _Column, by: _Column, cx: _Column, cy: _Column, typecode: str, offset: int = 0) -> array:
+    # twice the signed area of every triangle, (B - A) x (C - A).
+    # degenerate vertices raise ValueError (reported at index `offset` + row), decided like `Triangle.from_vertices` does:
+    # exactly for int64 columns and with `predicates.orient` for float64 ones,
+    # since the rounded float determinant can be 0 (or have the wrong sign) for points that aren't collinear and the other way around.
+    rows = list(zip(ax, ay, bx, by, cx, cy))
+    det = array(typecode, ((bx_ - ax_) * (cy_ - ay_) - (by_ - ay_) * (cx_ - ax_) for ax_, ay_, bx_, by_, cx_, cy_ in rows))
+    if typecode == "q":
+        signs = ((v > 0) - (v < 0) for v in det)
+    else:
+        signs = (orient(*row) for row in rows)
+    for i, (sign, v) in enumerate(zip(signs, det)):
+        if sign == 0:
+            raise ValueError(f"Vertices {Point(ax[i], ay[i])}, {Point(bx[i], by[i])} and {Point(cx[i], cy[i])} at index {offset + i} do not form a triangle.")
+        if (v > 0) - (v < 0) != sign:
+            # the float determinant was rounded to 0 or across it, the exact value keeps the orientation.
+            ax_, ay_, bx_, by_, cx_, cy_ = map(Fraction, rows[i])
+            det[i] = float((bx_ - ax_) * (cy_ - ay_) - (by_ - ay_) * (cx_ - ax_))
+
+    return det
+
+class TriangleArray:
+    """A columnar container holding many triangles as three arrays of vertices.
+
+    Areas, side lengths, angles and the classification flags of the whole batch
+    are calculated in a single pass over the vertex buffers the first time they are accessed and then cached.
+    Individual :class:`.Triangle` objects are only created when asked for.
+
+    The vertices and sides follow the same naming as :class:`.Triangle`,
+    side A is opposite to vertex A (from vertex B to vertex C) and so on.
+
+    .. note::
+        This class should not be manually instantiated.
+        Instead, use the provided class methods to create a new TriangleArray object.
+
+    .. note::
+        Flags are calculated exactly for integer coordinates.
+        For float coordinates, values within a relative tolerance of 1e-9 are considered equal.
+
+    .. container:: operations
+
+        .. describe:: len(x)
+
+            Returns the number of triangles in the array.
+
+        .. describe:: x[i]
+
+            Returns the triangle at index i as a :class:`.Triangle`.
+            If a slice is passed in, a new :class:`.TriangleArray` is returned.
+
+        .. describe:: iter(x)
+
+            Iterates over the triangles as :class:`.Triangle` objects.
+    """
+
+    __slots__ = (
+        "_A", "_B", "_C", "_det",
+        "_cached__squared_sides", "_cached__dots",
+        "_cached_signed_areas", "_cached_areas", "_cached_side_lengths", "_cached_angles",
+        "_cached_is_isoceles", "_cached_is_equilateral", "_cached_is_right_angled", "_cached_is_scalene",
+    )
+
+    def __init__(self, vertices_A: PointArray, vertices_B: PointArray, vertices_C: PointArray, det: array):
+        self._A = vertices_A
+        self._B = vertices_B
+        self._C = vertices_C
+        self._det = det
+
+    def __new__(cls, *args, **kwargs):
+        raise RuntimeError(f"This class should not be instantiated manually. Use the provided class methods to create a new {cls.__name__} object.")
+
+    def __len__(self) -> int:
+        return len(self._A)
+
+    def __reduce__(self):
+        # cached values are left out, they are calculated again when needed.
+        return self._from_columns, (self._A, self._B, self._C, self._det)
+
+    @classmethod
+    def _from_columns(cls, vertices_A: PointArray, vertices_B: PointArray, vertices_C: PointArray, det: array) -> "TriangleArray":
+        self = super().__new__(cls)
+        self.__init__(vertices_A, vertices_B, vertices_C, det)
+        return self
+
+    @overload
+    def __getitem__(self, index: int) -> Triangle:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "TriangleArray":
+        ...
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return self._from_columns(self._A[index], self._B[index], self._C[index], self._det[index])
+
+        return Triangle.from_vertices(self._A[index], self._B[index], self._C[index])
+
+    def __iter__(self) -> Iterator[Triangle]:
+        return map(self.__getitem__, range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"<TriangleArray len={len(self)}>"
+
+    def _clear_cache(self):
+        # has to be called after the vertices are changed in place.
+        for slot in self.__slots__:
+            if slot.startswith("_cached_") and hasattr(self, slot):
+                delattr(self, slot)
+
+    @property
+    def vertices_A(self) -> PointArray:
+        """:class:`.PointArray`: The first vertex of every triangle."""
+        return self._A
+
+    @property
+    def vertices_B(self) -> PointArray:
+        """:class:`.PointArray`: The second vertex of every triangle."""
+        return self._B
+
+    @property
+    def vertices_C(self) -> PointArray:
+        """:class:`.PointArray`: The third vertex of every triangle."""
+        return self._C
+
+    @property
+    def _exact(self) -> bool:
+        return self._det.typecode == "q"
+
+    def _equal(self, u, v) -> bool:
+        return u == v if self._exact else math.isclose(u, v, rel_tol=1e-9)
+
+    @cached_slot_property
+    def _squared_sides(self):
+        # squared lengths of side A (BC), side B (AC) and side C (AB).
+        # these stay integers for integer coordinates so they can be compared exactly.
+        A, B, C = self._A, self._B, self._C
+        def squared(P: PointArray, Q: PointArray):
+            dx = map(operator.sub, Q.xs, P.xs)
+            dy = map(operator.sub, Q.ys, P.ys)
+            return [u*u + v*v for u, v in zip(dx, dy)]
+
+        return squared(B, C), squared(A, C), squared(A, B)
+
+    @cached_slot_property
+    def _dots(self):
+        # dot products of the two sides meeting at vertex A, B and C.
+        A, B, C = self._A, self._B, self._C
+        def dot(P: PointArray, Q: PointArray, R: PointArray):
+            # (Q - P) . (R - P)
+            return [
+                (qx - px) * (rx - px) + (qy - py) * (ry - py)
+                for px, py, qx, qy, rx, ry in zip(P.xs, P.ys, Q.xs, Q.ys, R.xs, R.ys)
+            ]
+
+        return dot(A, B, C), dot(B, A, C), dot(C, A, B)
+
+    @cached_slot_property
+    def signed_areas(self) -> array:
+        """:class:`array.array`: The signed area of every triangle.
+
+        The area is positive if the vertices A, B and C are in counter clockwise order and negative otherwise.
+        """
+        return array("d", (v / 2 for v in self._det))
+
+    @cached_slot_property
+    def areas(self) -> array:
+        """:class:`array.array`: The area of every triangle."""
+        return array("d", map(abs, self.signed_areas))
+
+    @cached_slot_property
+    def side_lengths(self):
+        """Tuple[:class:`array.array`, :class:`array.array`, :class:`array.array`]: The lengths of side A, B and C of every triangle."""
+        return tuple(array("d", map(math.sqrt, sides)) for sides in self._squared_sides)
+
+    @cached_slot_property
+    def angles(self):
+        """Tuple[:class:`array.array`, :class:`array.array`, :class:`array.array`]: The interior angles in degrees at vertex A, B and C of every triangle."""
+        cross = list(map(abs, self._det))
+        return tuple(array("d", (math.degrees(math.atan2(c, d)) for c, d in zip(cross, dots))) for dots in self._dots)
+
+    @cached_slot_property
+    def is_isoceles(self) -> array:
+        """:class:`array.array`: Whether every triangle has at least two sides of the same length, as 0 or 1."""
+        eq = self._equal
+        return array("b", (eq(a, b) or eq(b, c) or eq(a, c) for a, b, c in zip(*self._squared_sides)))
+
+    @cached_slot_property
+    def is_equilateral(self) -> array:
+        """:class:`array.array`: Whether every triangle has all sides of the same length, as 0 or 1."""
+        eq = self._equal
+        return array("b", (eq(a, b) and eq(b, c) for a, b, c in zip(*self._squared_sides)))
+
+    @cached_slot_property
+    def is_right_angled(self) -> array:
+        """:class:`array.array`: Whether every triangle has a right angle, as 0 or 1."""
+        if self._exact:
+            return array("b", (0 in dots for dots in zip(*self._dots)))
+
+        # the dot product has to be compared with the size of the sides meeting at the vertex
+        sa, sb, sc = self._squared_sides
+        return array("b", (
+            abs(da) <= 1e-9 * math.sqrt(b * c) or abs(db) <= 1e-9 * math.sqrt(a * c) or abs(dc) <= 1e-9 * math.sqrt(a * b)
+            for da, db, dc, a, b, c in zip(*self._dots, sa, sb, sc)
+        ))
+
+    @cached_slot_property
+    def is_scalene(self) -> array:
+        """:class:`array.array`: Whether every triangle has sides of different lengths, as 0 or 1."""
+        return array("b", (not v for v in self.is_isoceles))
+
+    @classmethod
+    def from_vertices(cls, A: Union[PointArray, Iterable[Point]], B: Union[PointArray, Iterable[Point]], C: Union[PointArray, Iterable[Point]]) -> "TriangleArray":
+        """Create many triangles at once from three batches of vertices.
+
+        The i-th triangle has the vertices ``A[i]``, ``B[i]`` and ``C[i]``.
+
+        Parameters
+        ----------
+        A : Union[:class:`.PointArray`, Iterable[:class:`.Point`]]
+            The first vertex of every triangle.
+        B : Union[:class:`.PointArray`, Iterable[:class:`.Point`]]
+            The second vertex of every triangle.
+        C : Union[:class:`.PointArray`, Iterable[:class:`.Point`]]
+            The third vertex of every triangle.
+
+        Returns
+        -------
+        :class:`.TriangleArray`
+            The newly created array.
+
+        Raises
+        ------
+        ValueError
+            If the batches are of different lengths or any of the vertices do not form a proper triangle.
+        """
+        A, B, C = (P if isinstance(P, PointArray) else PointArray.from_points(P) for P in (A, B, C))
+        if not len(A) == len(B) == len(C):
+            raise ValueError(f"Expected the same number of vertices A, B and C, but got {len(A)}, {len(B)} and {len(C)}")
+
+        typecode = "q" if A.typecode == B.typecode == C.typecode == "q" else "d"
+        det = _determinants(A.xs, A.ys, B.xs, B.ys, C.xs, C.ys, typecode)
+        return cls._from_columns(A, B, C, det)
+
+    def to_triangles(self) -> List[Triangle]:
+        """Returns the triangles of this array as a list of :class:`.Triangle` objects.
+
+        Returns
+        -------
+        List[:class:`.Triangle`]
+            The list of triangles.
+        """
+        return list(self)
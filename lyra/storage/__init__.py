@@ -0,0 +1,2 @@
+from .streaming import mapped_coordinates, stream_binary, stream_csv, stream_lines, stream_triangles
+from .columnar import FORMAT_VERSION, GeometryFile, load_geometry, open_geometry, save_geometry
\ No newline at end of file
@@ -0,0 +1,357 @@
+"""A versioned columnar binary format for collections of points, lines and triangles.
+
+A file starts with a 16 byte header followed by the columns of the collection one after the other,
+each holding one 8 byte little-endian value (float64 or int64) per record::
+
+    magic    4 bytes   b"LYRA"
+    version  uint16    FORMAT_VERSION
+    kind     uint8     1 for points, 2 for lines and 3 for triangles
+    typecode 1 byte    b"d" or b"q", the type of the coordinate columns
+    count    uint64    the number of records
+
+Derived values such as the slopes and lengths of lines are stored as well,
+so opening a file never calculates anything and the columns are read straight from a memory map.
+"""
+from array import array
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
+from models.line import Line
+from models.line_array import LineArray
+from models.point import Point
+from models.point_array import PointArray
+from models.triangle import Triangle
+from models.triangle_array import TriangleArray
+
+FORMAT_VERSION = 1
+
+_MAGIC = b"LYRA"
+_HEADER = struct.Struct("<4sHBcQ")
+
+_POINTS, _LINES, _TRIANGLES = 1, 2, 3
+
+# the names of the columns of every kind of collection and whether they have the typecode of the file or are always float64.
+_COLUMNS: Dict[int, Tuple[Tuple[str, bool], ...]] = {
+    _POINTS: (("x", True), ("y", True)),
+    _LINES: (
+        ("x_coefficient", True), ("y_coefficient", True), ("constant", True),
+        ("point_A.x", True), ("point_A.y", True), ("point_B.x", True), ("point_B.y", True),
+        ("slope", False), ("length", False), ("midpoint.x", False), ("midpoint.y", False),
+    ),
+    _TRIANGLES: (
+        ("vertex_A.x", True), ("vertex_A.y", True), ("vertex_B.x", True), ("vertex_B.y", True),
+        ("vertex_C.x", True), ("vertex_C.y", True), ("det", True),
+    ),
+}
+
+_KIND_NAMES = {_POINTS: "points", _LINES: "lines", _TRIANGLES: "triangles"}
+
+_Collection = Union[PointArray, LineArray, TriangleArray, Sequence[Point], Sequence[Line], Sequence[Triangle]]
+
+def _typecode_of(values: Sequence) -> str:
+    return "q" if all(isinstance(v, int) for v in values) else "d"
+
+def _column(typecode: str, values) -> array:
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+
+    return array(typecode, map(int if typecode == "q" else float, values))
+
+def _point_columns(points: PointArray, typecode: str) -> List[array]:
+    return [_column(typecode, points.xs), _column(typecode, points.ys)]
+
+def _columns_of(collection: _Collection) -> Tuple[int, str, List[array]]:
+    # returns the kind, the typecode and the columns in the order of `_COLUMNS`.
+    if isinstance(collection, PointArray):
+        return _POINTS, collection.typecode, _point_columns(collection, collection.typecode)
+
+    if isinstance(collection, LineArray):
+        coefficients = (collection.x_coefficients, collection.y_coefficients, collection.constants)
+        typecodes = {c.typecode for c in coefficients} | {collection.points_A.typecode, collection.points_B.typecode}
+        typecode = "q" if typecodes == {"q"} else "d"
+        return _LINES, typecode, [
+            *(_column(typecode, c) for c in coefficients),
+            *_point_columns(collection.points_A, typecode),
+            *_point_columns(collection.points_B, typecode),
+            collection.slopes, collection.lengths, collection.midpoints.xs, collection.midpoints.ys,
+        ]
+
+    if isinstance(collection, TriangleArray):
+        typecode = collection._det.typecode
+        return _TRIANGLES, typecode, [
+            *_point_columns(collection.vertices_A, typecode),
+            *_point_columns(collection.vertices_B, typecode),
+            *_point_columns(collection.vertices_C, typecode),
+            collection._det,
+        ]
+
+    items = list(collection)
+    if not items or isinstance(items[0], Point):
+        return _columns_of(PointArray.from_points(items))
+
+    if isinstance(items[0], Line):
+        rows = [
+            (line.x_coefficient, line.y_coefficient, line.constant, line.point_A.x, line.point_A.y, line.point_B.x, line.point_B.y)
+            for line in items
+        ]
+        typecode = _typecode_of([v for row in rows for v in row])
+        columns = [_column(typecode, (row[i] for row in rows)) for i in range(7)]
+        columns.append(array("d", (float(line.slope) for line in items)))
+        columns.append(array("d", (line.length for line in items)))
+        columns.append(array("d", (float(line.midpoint.x) for line in items)))
+        columns.append(array("d", (float(line.midpoint.y) for line in items)))
+        return _LINES, typecode, columns
+
+    if isinstance(items[0], Triangle):
+        vertices = [_triangle_vertices(t) for t in items]
+        return _columns_of(TriangleArray.from_vertices(*([v[i] for v in vertices] for i in range(3))))
+
+    raise TypeError(f"Expected a collection of points, lines or triangles, but got {type(items[0]).__name__}")
+
+def _triangle_vertices(triangle: Triangle) -> Tuple[Point, Point, Point]:
+    # every vertex is where the two sides other than the opposite one meet,
+    # which doesn't depend on which end of its sides a point is, so it works for `Triangle.from_sides` as well.
+    # for `Triangle.from_vertices(A, B, C)` this gives back A, B and C.
+    a, b, c = ({side.point_A, side.point_B} for side in (triangle.side_A, triangle.side_B, triangle.side_C))
+    (A,), (B,), (C,) = b & c, a & c, a & b
+    return A, B, C
+
+def save_geometry(path: Union[str, os.PathLike], collection: _Collection):
+    """Saves a collection of points, lines or triangles to a file.
+
+    Parameters
+    ----------
+    path : Union[:class:`str`, :class:`os.PathLike`]
+        The path of the file to write, it is overwritten if it already exists.
+    collection : Union[:class:`.PointArray`, :class:`.LineArray`, :class:`.TriangleArray`, Sequence[:class:`.Point`], Sequence[:class:`.Line`], Sequence[:class:`.Triangle`]]
+        The collection to save. Coordinates that are not all integers are saved as float64,
+        so :class:`fractions.Fraction` values are rounded.
+
+    Raises
+    ------
+    TypeError
+        If the collection does not hold points, lines or triangles.
+    """
+    kind, typecode, columns = _columns_of(collection)
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(_MAGIC, FORMAT_VERSION, kind, typecode.encode(), len(columns[0])))
+        for column in columns:
+            if sys.byteorder == "big":
+                column = array(column.typecode, column)
+                column.byteswap()
+
+            column.tofile(file)
+
+class GeometryFile:
+    """A collection of points, lines or triangles memory mapped from a file written by `save_geometry`.
+
+    Nothing is read or copied when the file is opened, the columns are views straight into the memory map.
+    Use it as a context manager or call `GeometryFile.close` once done with it.
+
+    .. container:: operations
+
+        .. describe:: len(x)
+
+            Returns the number of records in the file.
+
+        .. describe:: x[i]
+
+            Returns the record at index i as a :class:`.Point`, :class:`.Line` or :class:`.Triangle`.
+
+        .. describe:: iter(x)
+
+            Iterates over the records.
+
+    Parameters
+    ----------
+    path : Union[:class:`str`, :class:`os.PathLike`]
+        The path of the file.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a geometry file, is truncated or was written by a newer version of the format.
+    """
+
+    __slots__ = ("_mmap", "_views", "_kind", "_typecode", "_length", "_version")
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        with open(path, "rb") as file:
+            header = file.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError(f"{path} is not a geometry file.")
+
+            magic, version, kind, typecode, length = _HEADER.unpack(header)
+            if magic != _MAGIC or kind not in _COLUMNS or typecode not in (b"d", b"q"):
+                raise ValueError(f"{path} is not a geometry file.")
+
+            if version > FORMAT_VERSION:
+                raise ValueError(f"{path} uses version {version} of the format, but only versions up to {FORMAT_VERSION} are supported.")
+
+            columns = _COLUMNS[kind]
+            expected = _HEADER.size + 8 * length * len(columns)
+            size = os.fstat(file.fileno()).st_size
+            if size < expected:
+                raise ValueError(f"{path} is truncated, expected {expected} bytes but got {size} bytes.")
+
+            # the mapping stays valid after the file is closed.
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._kind = kind
+        self._typecode = typecode.decode()
+        self._length = length
+        self._version = version
+
+        buffer = memoryview(self._mmap)
+        self._views = {}
+        offset = _HEADER.size
+        for name, native in columns:
+            self._views[name] = buffer[offset:offset + 8 * length].cast(self._typecode if native else "d")
+            offset += 8 * length
+
+        buffer.release()
+
+    def __enter__(self) -> "GeometryFile":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return f"<GeometryFile kind={self.kind!r} typecode={self._typecode!r} len={len(self)}>"
+
+    def __getitem__(self, index: int) -> Union[Point, Line, Triangle]:
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError("GeometryFile index out of range")
+
+        values = [view[index] for view in self._views.values()]
+        if self._kind == _POINTS:
+            return Point(*values)
+
+        if self._kind == _LINES:
+            a, b, c, ax, ay, bx, by = values[:7]
+            return Line.from_coefficients(a, b, c, Point(ax, ay), Point(bx, by))
+
+        ax, ay, bx, by, cx, cy = values[:6]
+        return Triangle.from_vertices(Point(ax, ay), Point(bx, by), Point(cx, cy))
+
+    def __iter__(self) -> Iterator[Union[Point, Line, Triangle]]:
+        return map(self.__getitem__, range(self._length))
+
+    @property
+    def kind(self) -> str:
+        """:class:`str`: What the file holds, ``"points"``, ``"lines"`` or ``"triangles"``."""
+        return _KIND_NAMES[self._kind]
+
+    @property
+    def typecode(self) -> str:
+        """:class:`str`: The typecode of the coordinate columns. Either ``"d"`` (float64) or ``"q"`` (int64)."""
+        return self._typecode
+
+    @property
+    def version(self) -> int:
+        """:class:`int`: The version of the format the file was written with."""
+        return self._version
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """Tuple[:class:`str`, ...]: The names of the columns in the file, such as ``"x"`` and ``"y"`` for points."""
+        return tuple(self._views)
+
+    def column(self, name: str) -> memoryview:
+        """Returns a zero copy view of a column.
+
+        The values are little-endian, which only matches the machine on little-endian ones.
+        The view is only valid until the file is closed.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The name of the column, one of `GeometryFile.columns`.
+
+        Returns
+        -------
+        :class:`memoryview`
+            A view of the column with one value per record.
+        """
+        return self._views[name]
+
+    def _array(self, name: str) -> array:
+        view = self._views[name]
+        column = array(view.format)
+        with view.cast("B") as raw:
+            column.frombytes(raw)
+
+        if sys.byteorder == "big":
+            column.byteswap()
+
+        return column
+
+    def to_array(self) -> Union[PointArray, LineArray, TriangleArray]:
+        """Copies the file into a :class:`.PointArray`, :class:`.LineArray` or :class:`.TriangleArray`.
+
+        Every column is copied with a single memory copy, nothing is calculated again.
+
+        Returns
+        -------
+        Union[:class:`.PointArray`, :class:`.LineArray`, :class:`.TriangleArray`]
+            The collection held by the file.
+        """
+        columns = [self._array(name) for name in self._views]
+        typecode = self._typecode
+        if self._kind == _POINTS:
+            return PointArray(*columns, typecode)
+
+        if self._kind == _LINES:
+            a, b, c, ax, ay, bx, by, slopes, lengths, mx, my = columns
+            return LineArray._from_columns(a, b, c, PointArray(ax, ay, typecode), PointArray(bx, by, typecode), slopes, lengths, PointArray(mx, my, "d"))
+
+        ax, ay, bx, by, cx, cy, det = columns
+        return TriangleArray._from_columns(PointArray(ax, ay, typecode), PointArray(bx, by, typecode), PointArray(cx, cy, typecode), det)
+
+    def close(self):
+        """Releases the views of the columns and closes the memory map."""
+        for view in self._views.values():
+            view.release()
+
+        self._views.clear()
+        self._mmap.close()
+
+def open_geometry(path: Union[str, os.PathLike]) -> GeometryFile:
+    """Memory maps a file written by `save_geometry` without reading it.
+
+    Parameters
+    ----------
+    path : Union[:class:`str`, :class:`os.PathLike`]
+        The path of the file.
+
+    Returns
+    -------
+    :class:`GeometryFile`
+        The opened file.
+    """
+    return GeometryFile(path)
+
+def load_geometry(path: Union[str, os.PathLike]) -> Union[PointArray, LineArray, TriangleArray]:
+    """Loads a file written by `save_geometry` into memory.
+
+    Parameters
+    ----------
+    path : Union[:class:`str`, :class:`os.PathLike`]
+        The path of the file.
+
+    Returns
+    -------
+    Union[:class:`.PointArray`, :class:`.LineArray`, :class:`.TriangleArray`]
+        The collection held by the file.
+    """
+    with GeometryFile(path) as file:
+        return file.to_array()
@@ -0,0 +1,241 @@
+"""Streaming readers turning large coordinate files into bounded chunks of columnar geometry.
+
+Each reader yields tuples of :class:`.PointArray` chunks, one array per point of a record
+(a point, the two ends of a segment or the three vertices of a triangle), which can be fed straight into
+`stream_lines` or `stream_triangles`. Only one chunk is ever held in memory, no matter how large the file is:
+
+    for lines in stream_lines(stream_csv("segments.csv", fields=4, header=True)):
+        ...
+"""
+from array import array
+import csv
+from contextlib import contextmanager
+import mmap
+import os
+import sys
+from typing import IO, Iterable, Iterator, List, Literal, Optional, Sequence, Tuple, Union
+from models.line_array import LineArray
+from models.point_array import PointArray, _INT64_MIN, _INT64_MAX
+from models.triangle_array import TriangleArray
+
+DEFAULT_CHUNK_SIZE = 65_536
+
+_Source = Union[str, os.PathLike]
+
+def _number(value: str) -> Union[int, float]:
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+def _split(values: Union[array, List[Union[int, float]]], fields: int, typecode: Optional[str]) -> Tuple[PointArray, ...]:
+    # de-interleaves `x1, y1, x2, y2, ...` records into one PointArray per point.
+    if typecode is None:
+        # inferred once for the whole chunk, so all of its arrays share the same typecode.
+        typecode = "q" if all(isinstance(v, int) and _INT64_MIN <= v <= _INT64_MAX for v in values) else "d"
+
+    return tuple(PointArray(values[i::fields], values[i + 1::fields], typecode) for i in range(0, fields, 2))
+
+def _check_fields(fields: int):
+    if fields < 2 or fields % 2:
+        raise ValueError(f"Expected an even number of fields per record, but got {fields}")
+
+def _check_chunk_size(chunk_size: int):
+    if chunk_size < 1:
+        raise ValueError(f"Expected a chunk size of at least 1, but got {chunk_size}")
+
+def stream_csv(
+    source: Union[_Source, IO[str]],
+    *,
+    fields: int = 2,
+    columns: Optional[Sequence[int]] = None,
+    header: bool = False,
+    delimiter: str = ",",
+    typecode: Optional[Literal["d", "q"]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Tuple[PointArray, ...]]:
+    """Reads coordinates from a CSV file in chunks of at most ``chunk_size`` records.
+
+    Parameters
+    ----------
+    source : Union[:class:`str`, :class:`os.PathLike`, IO[:class:`str`]]
+        The path of the file or an already opened text file.
+    fields : :class:`int`
+        The number of coordinates in a record, 2 for points, 4 for segments and 6 for triangles.
+    columns : Optional[Sequence[:class:`int`]]
+        The indices of the columns holding the coordinates, in ``x1, y1, x2, y2, ...`` order. By default the first ``fields`` columns.
+    header : :class:`bool`
+        Whether the first row is a header to skip.
+    delimiter : :class:`str`
+        The character separating the columns.
+    typecode : Optional[Literal[&quot;d&quot;, &quot;q&quot;]]
+        The typecode of the arrays. By default every chunk uses int64 if all of its coordinates are integers and float64 otherwise.
+    chunk_size : :class:`int`
+        The maximum number of records in a chunk.
+
+    Yields
+    ------
+    Tuple[:class:`.PointArray`, ...]
+        ``fields // 2`` arrays of the same length holding the points of the records in the chunk.
+
+    Raises
+    ------
+    ValueError
+        If a row has too few columns, a coordinate is not a number or the chunk size is less than 1.
+    """
+    _check_fields(fields)
+    _check_chunk_size(chunk_size)
+    columns = tuple(range(fields)) if columns is None else tuple(columns)
+    if len(columns) != fields:
+        raise ValueError(f"Expected {fields} columns, but got {len(columns)}")
+
+    parse = int if typecode == "q" else float if typecode == "d" else _number
+
+    # only close the file if it was opened here.
+    file = open(source, newline="") if isinstance(source, (str, os.PathLike)) else source
+    try:
+        reader = csv.reader(file, delimiter=delimiter)
+        if header:
+            next(reader, None)
+
+        values = []
+        for row in reader:
+            if not row:
+                continue
+
+            try:
+                values.extend(parse(row[i]) for i in columns)
+            except (IndexError, ValueError) as error:
+                raise ValueError(f"Could not read coordinates from line {reader.line_num}: {row!r}") from error
+
+            if len(values) == chunk_size * fields:
+                yield _split(values, fields, typecode)
+                values = []
+
+        if values:
+            yield _split(values, fields, typecode)
+
+    finally:
+        if file is not source:
+            file.close()
+
+@contextmanager
+def mapped_coordinates(source: _Source, typecode: Literal["d", "q"] = "d") -> Iterator[memoryview]:
+    """Memory maps a raw file of little-endian float64 or int64 values without copying it.
+
+    Parameters
+    ----------
+    source : Union[:class:`str`, :class:`os.PathLike`]
+        The path of the file.
+    typecode : Literal[&quot;d&quot;, &quot;q&quot;]
+        The type of the values in the file, float64 (``"d"``) or int64 (``"q"``).
+
+    Yields
+    ------
+    :class:`memoryview`
+        A flat view of the values in the file. It is only valid inside the ``with`` block.
+        The values are in the byte order of the file, which only matches the machine on little-endian ones.
+
+    Raises
+    ------
+    ValueError
+        If the size of the file is not a multiple of the size of a value.
+    """
+    itemsize = array(typecode).itemsize
+    with open(source, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size % itemsize:
+            raise ValueError(f"Expected a file size that is a multiple of {itemsize} bytes, but got {size} bytes")
+
+        if not size: # empty files can't be mapped
+            yield memoryview(b"").cast(typecode)
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped).cast(typecode)
+            try:
+                yield view
+            finally:
+                view.release()
+
+def stream_binary(
+    source: _Source,
+    *,
+    fields: int = 2,
+    typecode: Literal["d", "q"] = "d",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Tuple[PointArray, ...]]:
+    """Reads coordinates from a raw file of little-endian values in chunks of at most ``chunk_size`` records.
+
+    The file holds records of ``fields`` values each, one after the other (``x1, y1, x2, y2, ...``) without any header.
+    It is memory mapped so only the chunk being yielded is ever copied into memory.
+
+    Parameters
+    ----------
+    source : Union[:class:`str`, :class:`os.PathLike`]
+        The path of the file.
+    fields : :class:`int`
+        The number of coordinates in a record, 2 for points, 4 for segments and 6 for triangles.
+    typecode : Literal[&quot;d&quot;, &quot;q&quot;]
+        The type of the values in the file, float64 (``"d"``) or int64 (``"q"``).
+    chunk_size : :class:`int`
+        The maximum number of records in a chunk.
+
+    Yields
+    ------
+    Tuple[:class:`.PointArray`, ...]
+        ``fields // 2`` arrays of the same length holding the points of the records in the chunk.
+
+    Raises
+    ------
+    ValueError
+        If the file does not hold a whole number of records or the chunk size is less than 1.
+    """
+    _check_fields(fields)
+    _check_chunk_size(chunk_size)
+    with mapped_coordinates(source, typecode) as view:
+        if len(view) % fields:
+            raise ValueError(f"Expected records of {fields} values, but the file holds {len(view)} values")
+
+        step = chunk_size * fields
+        for start in range(0, len(view), step):
+            values = array(typecode)
+            with view[start:start + step] as part, part.cast("B") as raw:
+                values.frombytes(raw)
+
+            if sys.byteorder == "big":
+                values.byteswap()
+
+            yield _split(values, fields, typecode)
+
+def stream_lines(chunks: Iterable[Tuple[PointArray, PointArray]]) -> Iterator[LineArray]:
+    """Lazily turns chunks of segments into lines with `LineArray.from_AB_coordinates`.
+
+    Parameters
+    ----------
+    chunks : Iterable[Tuple[:class:`.PointArray`, :class:`.PointArray`]]
+        Chunks of start and end points, such as the ones read with ``fields=4``.
+
+    Yields
+    ------
+    :class:`.LineArray`
+        The lines of every chunk.
+    """
+    for points_A, points_B in chunks:
+        yield LineArray.from_AB_coordinates(points_A, points_B)
+
+def stream_triangles(chunks: Iterable[Tuple[PointArray, PointArray, PointArray]]) -> Iterator[TriangleArray]:
+    """Lazily turns chunks of vertices into triangles with `TriangleArray.from_vertices`.
+
+    Parameters
+    ----------
+    chunks : Iterable[Tuple[:class:`.PointArray`, :class:`.PointArray`, :class:`.PointArray`]]
+        Chunks of the three vertices of every triangle, such as the ones read with ``fields=6``.
+
+    Yields
+    ------
+    :class:`.TriangleArray`
+        The triangles of every chunk.
+    """
+    for A, B, C in chunks:
+        yield TriangleArray.from_vertices(A, B, C)
@@ -0,0 +1,8 @@
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# the packages (models, algorithms, storage) are imported from inside the lyra directory, the same as lyra/__init__.py does.
+# the benchmarks package lives at the repository root.
+sys.path[:0] = [os.path.join(_ROOT, "lyra"), _ROOT]
@@ -0,0 +1,23 @@
+from benchmarks import __main__ as cli, runner
+from benchmarks.cases import CASES
+
+def test_every_case_runs_and_reports_its_memory():
+    for name in CASES:
+        result = runner.run_case(name, 20, repeat=1)
+        assert result["per_op_us"] > 0, name
+        # tracing covers the inputs as well, so the peak is never just the little the operation leaves behind.
+        assert result["peak_kib"] >= result["inputs_kib"] > 1, name
+
+def test_compare_flags_regressions_only():
+    baseline = {"case[small]": {"per_op_us": 10.0, "peak_kib": 100.0}}
+    results = {"case[small]": {"per_op_us": 16.0, "peak_kib": 120.0}, "new[small]": {"per_op_us": 1.0}}
+    regressions = runner.compare(results, baseline, 1.5)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("case[small] per_op_us")
+
+def test_baseline_round_trip(tmp_path, capsys):
+    path = str(tmp_path / "baseline.json")
+    assert cli.main(["-k", "line.from_coefficients", "-s", "small", "-r", "1", "--save-baseline", path]) == 0
+    assert set(runner.load(path)) == {"line.from_coefficients[small]"}
+    assert cli.main(["-k", "line.from_coefficients", "-s", "small", "-r", "1", "--baseline", path, "--tolerance", "1000"]) == 0
+    assert "No regressions" in capsys.readouterr().out
@@ -0,0 +1,51 @@
+import pytest
+
+from models import Line, LineArray, Point, PointArray, Triangle, TriangleArray
+from storage import FORMAT_VERSION, load_geometry, open_geometry, save_geometry
+
+def test_points_round_trip(tmp_path):
+    path = tmp_path / "points.lyra"
+    points = PointArray([1, 2, 3], [4, 5, -6])
+    save_geometry(path, points)
+    assert load_geometry(path) == points
+
+    with open_geometry(path) as file:
+        assert file.kind == "points"
+        assert file.version == FORMAT_VERSION
+        assert len(file) == 3
+        assert file[2] == Point(3, -6)
+        assert list(file.column("x")) == [1, 2, 3]
+
+def test_lines_round_trip(tmp_path):
+    path = tmp_path / "lines.lyra"
+    lines = LineArray.from_AB_coordinates([Point(0, 0), Point(1.5, 2)], [Point(3, 4), Point(1.5, 7)])
+    save_geometry(path, lines)
+    loaded = load_geometry(path)
+    assert loaded.to_lines() == lines.to_lines()
+    assert loaded.points_A == lines.points_A
+    assert loaded.lengths == lines.lengths
+
+def test_triangles_round_trip(tmp_path):
+    path = tmp_path / "triangles.lyra"
+    triangles = TriangleArray.from_vertices([Point(0, 0)], [Point(4, 0)], [Point(0, 3)])
+    save_geometry(path, triangles)
+    loaded = load_geometry(path)
+    assert loaded.vertices_A == triangles.vertices_A
+    assert loaded.areas == triangles.areas
+
+@pytest.mark.parametrize("make", [
+    lambda A, B, C: Triangle.from_vertices(A, B, C),
+    lambda A, B, C: Triangle.from_sides(Line.from_AB_coordinates(C, B), Line.from_AB_coordinates(C, A), Line.from_AB_coordinates(B, A)),
+])
+def test_triangle_objects_round_trip(tmp_path, make):
+    A, B, C = Point(0, 3), Point(0, 0), Point(4, 0)
+    path = tmp_path / "triangle.lyra"
+    save_geometry(path, [make(A, B, C)])
+    loaded = load_geometry(path)
+    assert (loaded.vertices_A[0], loaded.vertices_B[0], loaded.vertices_C[0]) == (A, B, C)
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "garbage.lyra"
+    path.write_bytes(b"not a geometry file at all")
+    with pytest.raises(ValueError):
+        load_geometry(path)
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from algorithms import IncrementalConvexHull, convex_hull, hull_edges
+from models import Point, PointArray
+from models.predicates import orient
+
+def _brute_force_edges(points):
+    # (P, Q) is an edge of the counter clockwise hull when every other point is left of it or strictly inside it.
+    distinct = set(points)
+    edges = set()
+    for P in distinct:
+        for Q in distinct:
+            if P == Q:
+                continue
+            if all(
+                (o := orient(P.x, P.y, Q.x, Q.y, R.x, R.y)) > 0
+                or (o == 0 and (R.x - P.x) * (R.x - Q.x) + (R.y - P.y) * (R.y - Q.y) < 0)
+                for R in distinct if R not in (P, Q)
+            ):
+                edges.add((P, Q))
+    return edges
+
+def _edges_of(hull_points):
+    return {(hull_points[i], hull_points[(i + 1) % len(hull_points)]) for i in range(len(hull_points))}
+
+def _points(n, seed, span=20):
+    rng = random.Random(seed)
+    return [Point(rng.randint(0, span), rng.randint(0, span)) for _ in range(n)]
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_brute_force(seed):
+    points = _points(60, seed)
+    hull = [points[i] for i in convex_hull(points)]
+    assert _edges_of(hull) == _brute_force_edges(points)
+    assert hull[0] == min(points, key=lambda P: (P.x, P.y))
+
+def test_presorted_and_point_array():
+    points = sorted(_points(100, 9), key=lambda P: (P.x, P.y))
+    assert convex_hull(points, presorted=True) == convex_hull(points) == convex_hull(PointArray.from_points(points))
+
+def test_incremental_hull_matches_hull_of_everything():
+    points = _points(300, 3, span=1000)
+    hull = IncrementalConvexHull()
+    for k in range(0, len(points), 37):
+        hull.add(points[k:k + 37])
+
+    assert hull.count == len(points)
+    assert hull.indices == convex_hull(points)
+    assert hull.points == [points[i] for i in hull.indices]
+    assert len(hull.edges()) == len(hull) == len(hull_edges(points, hull.indices))
+
+def test_degenerate_inputs():
+    assert convex_hull([Point(1, 1)]) == [0]
+    line = [Point(i, i) for i in range(5)]
+    assert {line[i] for i in convex_hull(line)} == {Point(0, 0), Point(4, 4)}
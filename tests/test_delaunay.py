@@ -0,0 +1,60 @@
+import random
+from fractions import Fraction
+
+import pytest
+
+from algorithms import convex_hull, delaunay_triangulation
+from models import Point
+
+def _in_circle(a, b, c, d):
+    # exact incircle determinant for counter clockwise a, b, c.
+    rows = [(Fraction(p.x) - Fraction(d.x), Fraction(p.y) - Fraction(d.y)) for p in (a, b, c)]
+    (ax, ay), (bx, by), (cx, cy) = rows
+    return (
+        (ax * ax + ay * ay) * (bx * cy - cx * by)
+        - (bx * bx + by * by) * (ax * cy - cx * ay)
+        + (cx * cx + cy * cy) * (ax * by - bx * ay)
+    )
+
+def _twice_area(A, B, C):
+    return (B.x - A.x) * (C.y - A.y) - (B.y - A.y) * (C.x - A.x)
+
+def _check_delaunay(points):
+    triangulation = delaunay_triangulation(points)
+    points = triangulation.points
+    distinct = [Point(x, y) for x, y in set(zip(points.xs, points.ys))]
+
+    edges = set()
+    for a, b, c in triangulation.triples():
+        A, B, C = points[a], points[b], points[c]
+        assert _twice_area(A, B, C) > 0
+        # no point is strictly inside the circumcircle of any triangle.
+        assert all(_in_circle(A, B, C, P) <= 0 for P in distinct)
+        for edge in ((a, b), (b, c), (c, a)):
+            assert edge not in edges
+            edges.add(edge)
+
+    # the triangles don't overlap and cover the convex hull exactly.
+    hull = [distinct[i] for i in convex_hull(distinct)]
+    hull_area = sum(_twice_area(hull[0], hull[i], hull[i + 1]) for i in range(1, len(hull) - 1))
+    assert sum(_twice_area(points[a], points[b], points[c]) for a, b, c in triangulation.triples()) == pytest.approx(hull_area)
+    return triangulation
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_random_integer_points_are_delaunay(seed):
+    rng = random.Random(seed)
+    points = [Point(rng.randint(0, 30), rng.randint(0, 30)) for _ in range(60)]
+    _check_delaunay(points)
+
+def test_random_float_points_are_delaunay():
+    rng = random.Random(3)
+    _check_delaunay([Point(rng.random(), rng.random()) for _ in range(60)])
+
+def test_grid_with_duplicates_and_cocircular_points():
+    points = [Point(x, y) for x in range(6) for y in range(6)] * 2
+    assert len(_check_delaunay(points)) == 2 * 25
+
+def test_degenerate_inputs():
+    assert len(delaunay_triangulation([Point(0, 0), Point(1, 1)])) == 0
+    assert len(delaunay_triangulation([Point(i, 2 * i) for i in range(10)])) == 0
+    assert len(delaunay_triangulation([Point(0, 0), Point(1, 0), Point(0, 1)])) == 1
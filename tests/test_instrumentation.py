@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+from models import Line, Point, Triangle, instrumentation
+
+def test_measure_counts_events_and_times_methods():
+    original = Line.from_AB_coordinates
+    with instrumentation.measure() as metrics:
+        assert instrumentation.is_enabled()
+        line = Line.from_AB_coordinates(Point(0, 0), Point(3, 3))
+        assert list(line.points_on_line(x_range=(0, 4), y_range=(0, 4))) == [Point(i, i) for i in range(4)]
+        with pytest.raises(ValueError):
+            Triangle.from_vertices(Point(0, 0), Point(1, 1), Point(2, 2))
+
+    assert not instrumentation.is_enabled()
+    # the original methods are put back once the measurement stops.
+    assert Line.from_AB_coordinates == original
+
+    assert metrics.counters["Line.lattice_points"] == 4
+    assert metrics.counters["Triangle.rejected_vertices"] == 1
+    assert metrics.timers["Line.from_AB_coordinates"][0] >= 1
+
+    exported = json.loads(metrics.to_json())
+    assert exported["counters"] == metrics.counters
+    assert exported["timers"]["Line.from_AB_coordinates"]["calls"] == metrics.timers["Line.from_AB_coordinates"][0]
+    assert "Line.from_AB_coordinates" in metrics.report()
+
+    metrics.reset()
+    assert metrics.as_dict() == {"counters": {}, "timers": {}}
+
+def test_nothing_is_recorded_when_disabled():
+    metrics = instrumentation.enable()
+    instrumentation.disable(metrics)
+    Line.from_AB_coordinates(Point(0.5, 0.25), Point(1.5, 2.75))
+    assert metrics.as_dict() == {"counters": {}, "timers": {}}
+    assert metrics.report() == "Nothing recorded."
@@ -0,0 +1,60 @@
+import random
+from fractions import Fraction
+
+from algorithms import iter_segment_intersections, segment_intersections
+from models import Line, LineArray, Point
+from models.predicates import segments_intersect
+
+def _random_segments(n, seed, span=1000):
+    rng = random.Random(seed)
+    lines = []
+    while len(lines) < n:
+        A = Point(rng.randint(0, span), rng.randint(0, span))
+        B = Point(rng.randint(0, span), rng.randint(0, span))
+        if A != B:
+            lines.append(Line.from_AB_coordinates(A, B))
+    return lines
+
+def _brute_force(lines):
+    found = {}
+    for i, first in enumerate(lines):
+        (x1, y1), (x2, y2) = (first.point_A.x, first.point_A.y), (first.point_B.x, first.point_B.y)
+        for j in range(i + 1, len(lines)):
+            second = lines[j]
+            (x3, y3), (x4, y4) = (second.point_A.x, second.point_A.y), (second.point_B.x, second.point_B.y)
+            if not segments_intersect(x1, y1, x2, y2, x3, y3, x4, y4):
+                continue
+
+            den = (x2 - x1) * (y4 - y3) - (y2 - y1) * (x4 - x3)
+            assert den != 0, "the random segments are expected to have no collinear overlaps"
+            t = Fraction((x3 - x1) * (y4 - y3) - (y3 - y1) * (x4 - x3), den)
+            point = (x1 + t * (x2 - x1), y1 + t * (y2 - y1))
+            found.setdefault(point, set()).update((i, j))
+
+    return found
+
+def _as_dict(results):
+    return {(Fraction(P.x), Fraction(P.y)): set(indices) for P, indices in results}
+
+def test_matches_brute_force():
+    for seed in range(3):
+        lines = _random_segments(60, seed)
+        assert _as_dict(segment_intersections(lines)) == _brute_force(lines)
+
+def test_shared_endpoints_and_concurrent_segments():
+    lines = [
+        Line.from_AB_coordinates(Point(0, 0), Point(4, 4)),
+        Line.from_AB_coordinates(Point(0, 4), Point(4, 0)),
+        Line.from_AB_coordinates(Point(2, 0), Point(2, 4)),
+        Line.from_AB_coordinates(Point(4, 4), Point(8, 4)),
+        Line.from_AB_coordinates(Point(10, 10), Point(11, 12)),
+    ]
+    results = segment_intersections(lines)
+    assert _as_dict(results) == _brute_force(lines) == {(2, 2): {0, 1, 2}, (4, 4): {0, 3}}
+    # ordered by x and then y as the sweep passes them.
+    assert [(P.x, P.y) for P, _ in results] == [(2, 2), (4, 4)]
+
+def test_line_array_and_generator():
+    lines = _random_segments(30, 7)
+    array = LineArray.from_AB_coordinates([line.point_A for line in lines], [line.point_B for line in lines])
+    assert _as_dict(iter_segment_intersections(array)) == _as_dict(segment_intersections(lines))
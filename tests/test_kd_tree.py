@@ -0,0 +1,62 @@
+import math
+import random
+
+import pytest
+
+from algorithms import KDTree
+from models import Point, PointArray
+
+def _points(n, seed=0, integers=True):
+    rng = random.Random(seed)
+    if integers:
+        return [Point(rng.randint(-50, 50), rng.randint(-50, 50)) for _ in range(n)]
+    return [Point(rng.uniform(-50, 50), rng.uniform(-50, 50)) for _ in range(n)]
+
+def _squared(P, Q):
+    return (P.x - Q.x) ** 2 + (P.y - Q.y) ** 2
+
+@pytest.mark.parametrize("integers", [True, False])
+@pytest.mark.parametrize("leaf_size", [1, 4, 16])
+def test_nearest_matches_brute_force(integers, leaf_size):
+    points = _points(300, integers=integers)
+    tree = KDTree(points, leaf_size=leaf_size)
+    for query in _points(40, seed=1, integers=integers):
+        expected = sorted(range(len(points)), key=lambda i: (_squared(points[i], query), i))[:5]
+        assert [i for i, _ in tree.nearest(query, 5)] == expected
+
+    indices, distances = tree.nearest_many(_points(10, seed=2, integers=integers), 3)
+    assert len(indices) == len(distances) == 30
+
+@pytest.mark.parametrize("radius", [0, 3, 10.5])
+def test_within_matches_brute_force(radius):
+    points = _points(300)
+    tree = KDTree(PointArray.from_points(points), leaf_size=4)
+    queries = _points(30, seed=3) + points[:10]
+    for query in queries:
+        assert tree.within(query, radius) == [i for i, P in enumerate(points) if _squared(P, query) <= radius * radius]
+
+    assert tree.within_many(queries, radius) == [tree.within(query, radius) for query in queries]
+
+def test_closest_pair_matches_brute_force():
+    points = _points(200, integers=False)
+    i, j, d = KDTree(points, leaf_size=3).closest_pair()
+    expected = min((_squared(points[p], points[q]), p, q) for p in range(len(points)) for q in range(p + 1, len(points)))
+    assert (i, j) == expected[1:]
+    assert d == pytest.approx(math.sqrt(expected[0]))
+
+def test_invalid_arguments():
+    tree = KDTree(_points(10))
+    for k in (0, -1):
+        with pytest.raises(ValueError):
+            tree.nearest(Point(0, 0), k)
+        with pytest.raises(ValueError):
+            tree.nearest_many([Point(0, 0)], k)
+
+    for radius in (-1, -0.5, math.nan):
+        with pytest.raises(ValueError):
+            tree.within(Point(0, 0), radius)
+        with pytest.raises(ValueError):
+            tree.within_many([Point(0, 0)], radius)
+
+    with pytest.raises(ValueError):
+        KDTree([])
@@ -0,0 +1,62 @@
+import math
+import random
+
+import pytest
+
+from models import INFINITY, Line, Point, PointArray, kernels
+
+def _pairs(n, seed, integers=True):
+    rng = random.Random(seed)
+    value = (lambda: rng.randint(-100, 100)) if integers else (lambda: rng.uniform(-100, 100))
+    A = PointArray([value() for _ in range(n)], [value() for _ in range(n)])
+    B = PointArray([value() for _ in range(n)], [value() for _ in range(n)])
+    return A, B
+
+def test_scalar_kernels_match_line():
+    rng = random.Random(0)
+    for _ in range(200):
+        A, B = Point(rng.randint(-50, 50), rng.randint(-50, 50)), Point(rng.randint(-50, 50), rng.randint(-50, 50))
+        if A == B:
+            continue
+
+        line = Line.from_AB_coordinates(A, B)
+        assert kernels.distance(A.x, A.y, B.x, B.y) == pytest.approx(line.length)
+        assert kernels.squared_distance(A.x, A.y, B.x, B.y) == (A.x - B.x) ** 2 + (A.y - B.y) ** 2
+        assert kernels.slope(A.x, A.y, B.x, B.y) == pytest.approx(line.slope) if A.x != B.x else kernels.slope(A.x, A.y, B.x, B.y) is INFINITY
+        assert kernels.midpoint(A.x, A.y, B.x, B.y) == (line.midpoint.x, line.midpoint.y)
+
+        P = Point(rng.randint(-50, 50), rng.randint(-50, 50))
+        try:
+            ratio = kernels.division_ratio(A.x, A.y, B.x, B.y, P.x, P.y)
+        except ZeroDivisionError: # the ratio is undefined for some points, such as point B itself
+            with pytest.raises(ZeroDivisionError):
+                line.find_ratio_of_division_on_point(P)
+        else:
+            assert ratio == line.find_ratio_of_division_on_point(P)
+
+def test_division_ratio():
+    assert kernels.division_ratio(0, 0, 4, 2, 1, 0.5) == (1, 3)
+    assert kernels.division_ratio(0, 0, 4, 2, 2, 1) == (1, 1)
+    # points off the line divide it externally.
+    assert kernels.division_ratio(0, 0, 4, 2, 5, 5) == (5, 9)
+    assert kernels.division_ratio(0.0, 0.0, 4.0, 2.0, 5.0, 5.0) == (5, 9)
+
+@pytest.mark.parametrize("integers", [True, False])
+def test_vectorized_kernels_match_scalar(integers):
+    A, B = _pairs(100, 1, integers)
+    columns = (A.xs, A.ys, B.xs, B.ys)
+    scalars = list(zip(*columns))
+
+    assert list(kernels.distances(*columns)) == [kernels.distance(*v) for v in scalars]
+    squared = kernels.squared_distances(*columns)
+    assert squared.typecode == ("q" if integers else "d")
+    assert list(squared) == [kernels.squared_distance(*v) for v in scalars]
+    slopes = [kernels.slope(*v) for v in scalars]
+    assert list(kernels.slopes(*columns)) == [math.inf if s is INFINITY else s for s in slopes]
+    midpoints = kernels.midpoints(*columns)
+    assert midpoints.typecode == "d"
+    assert list(zip(midpoints.xs, midpoints.ys)) == [kernels.midpoint(*v) for v in scalars]
+
+def test_vertical_slopes():
+    assert kernels.slope(1, 0, 1, 5) is INFINITY
+    assert list(kernels.slopes([1, 0], [0, 0], [1, 2], [5, 1])) == [math.inf, 0.5]
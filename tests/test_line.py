@@ -0,0 +1,116 @@
+import math
+import random
+from fractions import Fraction
+
+import pytest
+
+from models import Line, LineInternTable, Point
+
+@pytest.mark.parametrize("constant", [0, 1, -7])
+def test_from_coefficients_rejects_zero_x_and_y(constant):
+    with pytest.raises(ValueError):
+        Line.from_coefficients(0, 0, constant)
+
+def test_from_coefficients_anchors_are_on_the_line():
+    line = Line.from_coefficients(2, -3, 6)
+    for P in (line.point_A, line.point_B):
+        assert 2 * P.x - 3 * P.y + 6 == 0
+
+def _brute_force_points(a, b, c, x_range, y_range):
+    return [Point(x, y) for x in range(*x_range) for y in range(*y_range) if a * x + b * y + c == 0]
+
+@pytest.mark.parametrize("coefficients", [(2, -3, 6), (4, 6, -10), (3, 6, 1), (1, 0, -3), (0, 5, -10), (-7, 2, 0)])
+def test_points_on_line_matches_brute_force(coefficients):
+    line = Line.from_coefficients(*coefficients)
+    x_range, y_range = (-20, 25), (-15, 30)
+    expected = _brute_force_points(*coefficients, x_range, y_range)
+
+    points = list(line.points_on_line(x_range=x_range, y_range=y_range))
+    assert sorted(points, key=lambda P: (P.x, P.y)) == sorted(expected, key=lambda P: (P.x, P.y))
+    assert line.count_points_on_line(x_range=x_range, y_range=y_range) == len(expected)
+
+def test_points_on_vertical_line_default_to_range_window():
+    line = Line.from_coefficients(1, 0, -3)
+    assert list(line.points_on_line()) == [Point(3, y) for y in range(100)]
+    assert list(line.points_on_line(10)) == [Point(3, y) for y in range(10)]
+    assert line.count_points_on_line(10) == 10
+    assert list(Line.from_coefficients(1, 0, -300).points_on_line()) == []
+
+def test_vertical_float_line_is_exact():
+    line = Line.from_AB_coordinates(Point(0.1234, 0.5), Point(0.1234, 2.5))
+    assert line.y_coefficient == 0
+    assert line.contains_point(Point(0.1234, -7))
+    assert not line.contains_point(Point(0.1235, -7))
+    assert line.is_parallel_to(Line.from_AB_coordinates(Point(3, 0), Point(3, 1)))
+
+@pytest.mark.parametrize("A, B, C, D, angle", [
+    (Point(0, 0), Point(1, 0), Point(0, 0), Point(0, 1), 90),
+    (Point(0, 0), Point(1, 1), Point(0, 5), Point(2, 7), 0),
+    (Point(0, 0), Point(1, 1), Point(0, 0), Point(1, 0), 45),
+    (Point(0, 0), Point(1, 0), Point(3, -2), Point(3, 9), 90),
+    (Point(0.1, 0.2), Point(0.4, 0.8), Point(0.3, 0.0), Point(0.9, -0.3), 90),
+])
+def test_angles_parallel_and_perpendicular(A, B, C, D, angle):
+    first, second = Line.from_AB_coordinates(A, B), Line.from_AB_coordinates(C, D)
+    assert first.angle_with_line(second) == pytest.approx(angle)
+    assert first.is_parallel_to(second) == (angle == 0)
+    assert first.is_perpendicular_to(second) == (angle == 90)
+
+def test_exact_coefficients_match_brute_force():
+    rng = random.Random(0)
+    for _ in range(200):
+        A = Point(rng.randint(-10 ** 12, 10 ** 12), rng.randint(-50, 50))
+        B = Point(rng.randint(-10 ** 12, 10 ** 12), rng.randint(-50, 50))
+        if A == B:
+            continue
+
+        line = Line.from_AB_coordinates(A, B)
+        a, b, c = line.x_coefficient, line.y_coefficient, line.constant
+        assert all(type(v) is int for v in (a, b, c))
+        assert math.gcd(a, b, c) == 1
+        assert b < 0 or (b == 0 and a > 0)
+        assert a * A.x + b * A.y + c == 0
+        assert a * B.x + b * B.y + c == 0
+
+def test_exact_coefficients_for_fractions():
+    line = Line.from_AB_coordinates(Point(Fraction(1, 3), 0), Point(0, Fraction(1, 2)))
+    assert (line.x_coefficient, line.y_coefficient, line.constant) == (-3, -2, 1)
+    assert line.canonical_coefficients == (-3, -2, 1)
+
+@pytest.mark.parametrize("first, second", [
+    ((2, -4, 6), (-1, 2, -3)),
+    ((0.5, -1, 1.5), (1, -2, 3)),
+    ((3, 0, -9), (-1, 0, 3)),
+    ((Fraction(1, 3), Fraction(-2, 3), 1), (1, -2, 3)),
+])
+def test_equal_lines_share_canonical_form_and_hash(first, second):
+    first, second = Line.from_coefficients(*first), Line.from_coefficients(*second)
+    assert first == second
+    assert hash(first) == hash(second)
+    assert first.canonical_coefficients == second.canonical_coefficients
+    assert len({first, second}) == 1
+
+def test_canonical_form_matches_brute_force_reduction():
+    rng = random.Random(4)
+    for _ in range(200):
+        a, b, c = rng.randint(-30, 30), rng.randint(-30, 30), rng.randint(-30, 30)
+        if a == b == 0:
+            continue
+
+        g = math.gcd(a, b, c)
+        sign = -1 if b > 0 or (b == 0 and a < 0) else 1
+        scale = rng.choice([1, 2, -3, 7])
+        assert Line.from_coefficients(a * scale, b * scale, c * scale).canonical_coefficients == (sign * a // g, sign * b // g, sign * c // g)
+
+def test_intern_table():
+    table = LineInternTable()
+    first = Line.from_coefficients(2, -4, 6)
+    assert table.intern(first) is first
+    assert table.intern(Line.from_coefficients(-1, 2, -3)) is first
+    other = Line.from_coefficients(1, -1, 0)
+    assert table.intern_many([other, Line.from_coefficients(3, -6, 9), Line.from_coefficients(2, -2, 0)]) == [other, first, other]
+    assert len(table) == 2
+    assert Line.from_coefficients(4, -8, 12) in table
+    assert list(table) == [first, other]
+    table.clear()
+    assert len(table) == 0
@@ -0,0 +1,49 @@
+import math
+import random
+
+import pytest
+
+from models import Line, LineArray, Point, PointArray
+
+def _float_points(n, seed):
+    rng = random.Random(seed)
+    return [Point(round(rng.uniform(-10, 10), 3), round(rng.uniform(-10, 10), 3)) for _ in range(n)]
+
+def test_integer_coefficients_match_line():
+    points_A, points_B = [Point(0, 0), Point(1, 5), Point(-3, 2), Point(4, 4)], [Point(2, 3), Point(1, -2), Point(6, 2), Point(-8, -8)]
+    lines = LineArray.from_AB_coordinates(points_A, points_B)
+    for i, (A, B) in enumerate(zip(points_A, points_B)):
+        line = Line.from_AB_coordinates(A, B)
+        assert (lines.x_coefficients[i], lines.y_coefficients[i], lines.constants[i]) == (line.x_coefficient, line.y_coefficient, line.constant)
+        assert lines[i] == line
+
+@pytest.mark.parametrize("points_A, points_B", [
+    (_float_points(50, 0), _float_points(50, 1)),
+    ([Point(0.1234, 0.5), Point(0.5, 0.25), Point(1.5, 2.0)], [Point(0.1234, 2.5), Point(1.75, 0.25), Point(-0.5, 2.0)]),
+])
+def test_float_coefficients_describe_the_same_lines(points_A, points_B):
+    # the two point form, which need not equal the rounded coefficients of Line but goes through both points.
+    lines = LineArray.from_AB_coordinates(points_A, points_B)
+    for i, (A, B) in enumerate(zip(points_A, points_B)):
+        a, b, c = lines.x_coefficients[i], lines.y_coefficients[i], lines.constants[i]
+        line = Line.from_AB_coordinates(A, B)
+        assert b < 0 or (b == 0 and a > 0)
+        assert (b == 0) == (line.y_coefficient == 0)
+        for P in (A, B):
+            assert math.isclose(a * P.x + b * P.y + c, 0, abs_tol=1e-12 * (abs(a) + abs(b)) * (1 + abs(P.x) + abs(P.y)))
+
+def test_integer_coefficients_out_of_int64_range():
+    big = 2 ** 62
+    with pytest.raises(ValueError, match="int64"):
+        LineArray.from_AB_coordinates([Point(-big, 0)], [Point(big + 1, 1)])
+    with pytest.raises(ValueError, match="int64"):
+        LineArray.from_AB_coordinates([Point(big, 3)], [Point(3, big)])
+    # the same points as floats are fine.
+    lines = LineArray.from_AB_coordinates(PointArray([-big], [0], "d"), PointArray([big + 1], [1], "d"))
+    assert lines.x_coefficients.typecode == "d"
+
+def test_from_AB_coordinates_validation():
+    with pytest.raises(ValueError):
+        LineArray.from_AB_coordinates([Point(0, 0)], [Point(1, 1), Point(2, 2)])
+    with pytest.raises(ValueError):
+        LineArray.from_AB_coordinates(PointArray([1.5], [2.5]), PointArray([1.5], [2.5]))
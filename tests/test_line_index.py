@@ -0,0 +1,57 @@
+import math
+import random
+
+import pytest
+
+from algorithms import LineIndex
+from models import Line, Point
+
+def _segments(n, seed=0):
+    rng = random.Random(seed)
+    lines = []
+    while len(lines) < n:
+        A = Point(rng.randint(0, 100), rng.randint(0, 100))
+        B = Point(A.x + rng.randint(-10, 10), A.y + rng.randint(-10, 10))
+        if A != B:
+            lines.append(Line.from_AB_coordinates(A, B))
+    return lines
+
+def _distance(line, P):
+    A, B = line.point_A, line.point_B
+    dx, dy = B.x - A.x, B.y - A.y
+    t = min(1, max(0, ((P.x - A.x) * dx + (P.y - A.y) * dy) / (dx * dx + dy * dy)))
+    return math.hypot(P.x - (A.x + t * dx), P.y - (A.y + t * dy))
+
+def test_nearest_matches_brute_force():
+    lines = _segments(200)
+    index = LineIndex(lines)
+    rng = random.Random(1)
+    for _ in range(30):
+        P = Point(rng.uniform(-20, 120), rng.uniform(-20, 120))
+        expected = sorted(_distance(line, P) for line in lines)[:4]
+        assert [d for _, d in index.nearest(P, 4)] == pytest.approx(expected)
+
+@pytest.mark.parametrize("P", [Point(1e6, 50), Point(-1e6, -1e6), Point(50, -3e6), Point(1e9, 1e9)])
+def test_nearest_far_outside_the_grid(P):
+    # the search has to start at the grid instead of walking every empty ring from the point.
+    lines = _segments(100, seed=3)
+    expected = sorted(_distance(line, P) for line in lines)[:3]
+    assert [d for _, d in LineIndex(lines).nearest(P, 3)] == pytest.approx(expected)
+
+def test_lines_through_and_window_match_brute_force():
+    lines = _segments(200, seed=2)
+    index = LineIndex(lines)
+    for line in lines[:20]:
+        P = line.point_A
+        assert index.lines_through(P) == [i for i, l in enumerate(lines) if _distance(l, P) == 0]
+
+    hits = index.query_window(40, 40, 60, 60)
+    for i, line in enumerate(lines):
+        inside = any(40 <= P.x <= 60 and 40 <= P.y <= 60 for P in (line.point_A, line.point_B))
+        if inside:
+            assert i in hits
+
+@pytest.mark.parametrize("k", [0, -3])
+def test_nearest_rejects_k_below_one(k):
+    with pytest.raises(ValueError):
+        LineIndex(_segments(5)).nearest(Point(0, 0), k)
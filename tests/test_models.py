@@ -0,0 +1,42 @@
+import dataclasses
+
+import pytest
+
+from models import Line, Point
+
+def test_point_is_immutable_and_slotted():
+    P = Point(1, 2)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        P.x = 3
+    assert not hasattr(P, "__dict__")
+    assert P + Point(1, 1) == Point(2, 3)
+    assert hash(P) == hash(Point(1, 2))
+
+def test_line_is_immutable_and_slotted():
+    line = Line.from_AB_coordinates(Point(0, 0), Point(2, 1))
+    with pytest.raises(AttributeError):
+        line._x = 5
+    with pytest.raises(AttributeError):
+        del line._A
+    with pytest.raises(AttributeError):
+        line.anything = 1
+    assert not hasattr(line, "__dict__")
+
+def test_line_caches_derived_properties():
+    line = Line.from_AB_coordinates(Point(0, 0), Point(3, 4))
+    assert line.length == 5
+    assert line.length is line.length
+    assert line.midpoint is line.midpoint
+    assert line.midpoint == Point(1.5, 2)
+    assert line.canonical_coefficients is line.canonical_coefficients
+
+    with pytest.raises(RuntimeError):
+        Line(1, 2, 3)
+
+def test_anchors_are_resolved_lazily_on_the_line():
+    line = Line.from_coefficients(3, -5, 7)
+    A, B = line.point_A, line.point_B
+    assert A != B
+    assert line.point_A is A
+    for P in (A, B):
+        assert 3 * P.x - 5 * P.y + 7 == 0
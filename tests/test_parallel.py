@@ -0,0 +1,81 @@
+import math
+import pickle
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from algorithms import parallel_classify_triangles, parallel_line_intersections, parallel_lines_from_AB_coordinates
+from models import Line, LineArray, Point, PointArray, Triangle, TriangleArray
+
+COLUMNS = ("x_coefficients", "y_coefficients", "constants", "points_A", "points_B", "slopes", "lengths", "midpoints")
+
+@pytest.fixture(scope="module")
+def executor():
+    with ProcessPoolExecutor(2) as executor:
+        yield executor
+
+def _points(n, seed):
+    rng = random.Random(seed)
+    return [Point(rng.randint(-100, 100), rng.randint(-100, 100)) for _ in range(n)]
+
+def test_models_round_trip_through_pickle():
+    line = Line.from_AB_coordinates(Point(0, 0), Point(3, 4))
+    line.length # cached values aren't pickled but must not break it either
+    lazy = Line.from_coefficients(2, -3, 6)
+    triangle = Triangle.from_vertices(Point(0, 0), Point(4, 0), Point(0, 3))
+    for value in (Point(1, 2.5), line, lazy, PointArray([1, 2], [3, 4])):
+        assert pickle.loads(pickle.dumps(value)) == value
+
+    copy = pickle.loads(pickle.dumps(lazy))
+    assert (copy.point_A, copy.point_B) == (lazy.point_A, lazy.point_B)
+    copy = pickle.loads(pickle.dumps(triangle))
+    assert (copy.side_A, copy.side_B, copy.side_C) == (triangle.side_A, triangle.side_B, triangle.side_C)
+
+    lines = LineArray.from_AB_coordinates(_points(10, 0), _points(10, 1))
+    copy = pickle.loads(pickle.dumps(lines))
+    for name in COLUMNS:
+        assert getattr(copy, name) == getattr(lines, name), name
+
+    triangles = TriangleArray.from_vertices([Point(0, 0)], [Point(4, 0)], [Point(0, 3)])
+    assert list(pickle.loads(pickle.dumps(triangles)).areas) == [6]
+
+def test_lines_match_serial(executor):
+    A, B = _points(500, 2), _points(500, 3)
+    B = [Q if Q != P else Point(Q.x + 1, Q.y) for P, Q in zip(A, B)]
+    expected = LineArray.from_AB_coordinates(A, B)
+    lines = parallel_lines_from_AB_coordinates(A, B, chunk_size=64, executor=executor)
+    for name in COLUMNS:
+        assert getattr(lines, name) == getattr(expected, name), name
+
+def test_lines_out_of_int64_range_raise(executor):
+    with pytest.raises(ValueError, match="int64"):
+        parallel_lines_from_AB_coordinates([Point(0, 0), Point(2 ** 62, 3)], [Point(1, 1), Point(3, 2 ** 62)], chunk_size=1, executor=executor)
+
+def test_triangles_match_serial(executor):
+    A, B, C = [Point(0, 0)] * 3, [Point(4, 0), Point(2, 0), Point(1, 0)], [Point(0, 3), Point(1, math.sqrt(3)), Point(5, 7)]
+    expected = TriangleArray.from_vertices(A, B, C)
+    triangles = parallel_classify_triangles(A, B, C, chunk_size=1, executor=executor)
+    assert triangles.areas == expected.areas
+    for name in ("is_isoceles", "is_equilateral", "is_right_angled", "is_scalene"):
+        assert list(getattr(triangles, name)) == list(getattr(expected, name)), name
+
+def test_triangles_accept_nearly_collinear_floats(executor):
+    # not collinear, but (B - A) x (C - A) rounds to 0 in float arithmetic.
+    A, B, C = [Point(0, 0), Point(0.021489705265908876, 0.8375779756625729)], [Point(4, 0), Point(0.5564543226524334, 0.6422943629324456)], [Point(0, 3), Point(0.12094297967003403, 0.8012735284294847)]
+    triangles = parallel_classify_triangles(A, B, C, chunk_size=1, executor=executor)
+    assert triangles.areas == TriangleArray.from_vertices(A, B, C).areas
+    assert triangles.areas[1] > 0
+    with pytest.raises(ValueError, match="at index 1"):
+        parallel_classify_triangles(A, [Point(4, 0), Point(0.5, 0.25)], [Point(0, 3), Point(0.5, 0.25)], chunk_size=1, executor=executor)
+
+def test_intersections_match_serial(executor):
+    lines = [Line.from_AB_coordinates(Point(0, 0), Point(2, 2)), Line.from_AB_coordinates(Point(0, 0), Point(2, 2))]
+    others = [Line.from_AB_coordinates(Point(0, 2), Point(2, 0)), Line.from_AB_coordinates(Point(0, 1), Point(2, 3))]
+    points = parallel_line_intersections(lines, others, chunk_size=1, executor=executor)
+    assert points[0] == Point(1.0, 1.0)
+    assert math.isnan(points.xs[1]) and math.isnan(points.ys[1])
+
+def test_mismatched_lengths_raise():
+    with pytest.raises(ValueError):
+        parallel_lines_from_AB_coordinates([Point(0, 0)], [Point(1, 1), Point(2, 2)], workers=1)
@@ -0,0 +1,44 @@
+import pytest
+
+from models import Point, PointArray
+
+def test_typecode_inference():
+    assert PointArray([1, 2], [3, 4]).typecode == "q"
+    assert PointArray([1, 2.5], [3, 4]).typecode == "d"
+    assert PointArray.from_points([Point(1, 2), Point(3, 4)]).typecode == "q"
+
+@pytest.mark.parametrize("value", [2 ** 63, -2 ** 63 - 1, 10 ** 30])
+def test_ints_out_of_int64_range_fall_back_to_float64(value):
+    points = PointArray.from_points([Point(value, 1), Point(2, 3)])
+    assert points.typecode == "d"
+    assert points.xs[0] == float(value)
+
+    with pytest.raises(ValueError):
+        PointArray([value], [0], "q")
+
+def test_int64_bounds_are_kept():
+    points = PointArray([2 ** 63 - 1, -2 ** 63], [0, 0])
+    assert points.typecode == "q"
+    assert list(points.xs) == [2 ** 63 - 1, -2 ** 63]
+
+def test_arithmetic_out_of_int64_range_falls_back_to_float64():
+    big = PointArray([2 ** 62, 1], [0, -2 ** 63])
+    assert (big + big).typecode == "d"
+    assert list((big + big).xs) == [2 ** 63, 2]
+    assert list((big - Point(0, 1)).ys) == [-1, float(-2 ** 63 - 1)]
+    assert (big - Point(0, 1)).typecode == "d"
+    assert (big + Point(0, 1)).typecode == "q"
+
+def test_arithmetic_and_slicing():
+    points = PointArray([1, 2, 3], [4, 5, 6])
+    assert points + Point(1, 1) == PointArray([2, 3, 4], [5, 6, 7])
+    assert (points + Point(0.5, 0)).typecode == "d"
+    assert points - points == PointArray([0, 0, 0], [0, 0, 0])
+    assert points[1:] == PointArray([2, 3], [5, 6])
+    assert points[0] == Point(1, 4)
+    assert list(points) == points.to_points()
+
+    with pytest.raises(ValueError):
+        PointArray([1, 2], [3])
+    with pytest.raises(ValueError):
+        PointArray([1], [2], "f")
@@ -0,0 +1,68 @@
+import math
+import random
+from fractions import Fraction
+
+import pytest
+
+from models import Line, Parallelogram, Point, Polygon
+from models.predicates import orient
+
+def _brute_force_contains(vertices, P):
+    inside = False
+    for k in range(len(vertices)):
+        A, B = vertices[k], vertices[(k + 1) % len(vertices)]
+        if orient(A.x, A.y, B.x, B.y, P.x, P.y) == 0 and min(A.x, B.x) <= P.x <= max(A.x, B.x) and min(A.y, B.y) <= P.y <= max(A.y, B.y):
+            return True
+        if (A.y > P.y) != (B.y > P.y) and Fraction(P.x) < A.x + (Fraction(P.y) - A.y) / (B.y - A.y) * (B.x - A.x):
+            inside = not inside
+    return inside
+
+def _star_polygon(n, seed):
+    # a simple (star shaped) polygon from random points sorted around the centre.
+    rng = random.Random(seed)
+    vertices = []
+    for k in range(n):
+        angle = 2 * math.pi * k / n
+        r = rng.randint(3, 10)
+        vertices.append(Point(round(10 + r * math.cos(angle)), round(10 + r * math.sin(angle))))
+    return [P for k, P in enumerate(vertices) if P != vertices[k - 1]]
+
+POLYGONS = [
+    [Point(0, 0), Point(6, 0), Point(6, 6), Point(3, 2), Point(0, 6)],
+    [Point(0, 0), Point(4, 0), Point(4, 2), Point(2, 2), Point(2, 4), Point(4, 4), Point(4, 6), Point(0, 6)],
+    [Point(1, 1), Point(5, 3), Point(1, 5), Point(3, 3)],
+] + [_star_polygon(12, seed) for seed in range(4)]
+
+@pytest.mark.parametrize("vertices", POLYGONS)
+def test_contains_matches_brute_force(vertices):
+    polygon = Polygon.from_vertices(*vertices)
+    queries = [Point(x, y) for x in range(-1, 22) for y in range(-1, 22)]
+    queries += [Point(x + 0.5, y + 0.25) for x in range(-1, 21) for y in range(-1, 21)]
+    expected = [_brute_force_contains(vertices, P) for P in queries]
+    assert [polygon.contains_point(P) for P in queries] == expected
+    assert list(polygon.contains_points(queries)) == expected
+
+def test_measurements():
+    square = Polygon.from_vertices(Point(0, 0), Point(0, 4), Point(4, 4), Point(4, 0))
+    assert square.signed_area == -16
+    assert square.area == 16
+    assert square.perimeter == 16
+    assert square.centroid == Point(2, 2)
+    assert Polygon.from_vertices(*reversed(list(square))).signed_area == 16
+
+    sides = [Line.from_AB_coordinates(Point(0, 0), Point(4, 0)), Line.from_AB_coordinates(Point(4, 0), Point(0, 3)), Line.from_AB_coordinates(Point(0, 3), Point(0, 0))]
+    assert Polygon.from_sides(*sides).area == 6
+
+def test_invalid_polygons():
+    with pytest.raises(ValueError):
+        Polygon.from_vertices(Point(0, 0), Point(1, 1))
+    with pytest.raises(ValueError):
+        Polygon.from_vertices(Point(0, 0), Point(1, 1), Point(2, 2))
+
+def test_coordinates_out_of_int64_range():
+    with pytest.raises(ValueError, match="int64 range"):
+        Parallelogram.from_vertices(Point(0, 0), Point(2 ** 64, 0), Point(0, 1), Point(2 ** 64, 1))
+    with pytest.raises(ValueError, match="int64 range"):
+        Polygon.from_vertices(Point(0, 0), Point(-2 ** 63 - 1, 0), Point(0, 1))
+    # floats of the same size are fine.
+    assert Polygon.from_vertices(Point(0, 0), Point(2.0 ** 64, 0), Point(0, 1)).area == 2.0 ** 63
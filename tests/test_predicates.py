@@ -0,0 +1,97 @@
+import random
+from fractions import Fraction
+
+import pytest
+
+from models.predicates import cross_sign, dot_sign, incircle, line_side, orient, point_on_line, segments_intersect
+
+def _sign(value):
+    return (value > 0) - (value < 0)
+
+def _exact(*values):
+    return [Fraction(v) for v in values]
+
+def _orient(ax, ay, bx, by, cx, cy):
+    ax, ay, bx, by, cx, cy = _exact(ax, ay, bx, by, cx, cy)
+    return _sign((bx - ax) * (cy - ay) - (by - ay) * (cx - ax))
+
+def _incircle(ax, ay, bx, by, cx, cy, dx, dy):
+    ax, ay, bx, by, cx, cy, dx, dy = _exact(ax, ay, bx, by, cx, cy, dx, dy)
+    rows = [(px - dx, py - dy) for px, py in ((ax, ay), (bx, by), (cx, cy))]
+    (a1, a2), (b1, b2), (c1, c2) = rows
+    return _sign(
+        (a1 * a1 + a2 * a2) * (b1 * c2 - c1 * b2)
+        - (b1 * b1 + b2 * b2) * (a1 * c2 - c1 * a2)
+        + (c1 * c1 + c2 * c2) * (a1 * b2 - b1 * a2)
+    )
+
+def _near_degenerate_floats(seed, count):
+    # points on (or a rounding error away from) the line y = x * 0.1 + 0.3, where naive float orientation tests go wrong.
+    rng = random.Random(seed)
+    for _ in range(count):
+        values = []
+        for _ in range(3):
+            x = rng.uniform(-1e3, 1e3)
+            values += [x, x * 0.1 + 0.3]
+        yield values
+
+def test_orient_matches_exact_on_near_degenerate_floats():
+    for values in _near_degenerate_floats(0, 2000):
+        assert orient(*values) == _orient(*values)
+
+def test_orient_on_integers_and_fractions():
+    assert orient(0, 0, 10 ** 30, 1, 2 * 10 ** 30, 2) == 0
+    assert orient(0, 0, 10 ** 30, 1, 2 * 10 ** 30, 3) == 1
+    assert orient(Fraction(1, 3), 0, 0, Fraction(1, 3), Fraction(2, 3), Fraction(-1, 3)) == 0
+    # 2^53 + 1 isn't a float, so it must not go through the float filter.
+    assert orient(0, 0, 2 ** 53 + 1, 1, 2 ** 54 + 2, 2) == 0
+
+def test_incircle_matches_exact():
+    rng = random.Random(1)
+    for _ in range(500):
+        # a tiny perturbation away from a few grid values, so many of the points are nearly cocircular.
+        values = [rng.choice([-1, 0, 1]) * 0.5 + rng.uniform(-1e-9, 1e-9) for _ in range(8)]
+        assert incircle(*values) == _incircle(*values)
+
+    assert incircle(1, 0, 0, 1, -1, 0, 0, -1) == 0
+    assert incircle(1, 0, 0, 1, -1, 0, 0, 0) == 1
+    assert incircle(1, 0, 0, 1, -1, 0, 5, 5) == -1
+
+def test_products_and_lines_match_exact():
+    rng = random.Random(2)
+    for _ in range(2000):
+        ux, uy = rng.uniform(-1, 1), rng.uniform(-1, 1)
+        k = rng.uniform(-3, 3)
+        vx, vy = ux * k, uy * k
+        ex = _exact(ux, uy, vx, vy)
+        assert cross_sign(ux, uy, vx, vy) == _sign(ex[0] * ex[3] - ex[1] * ex[2])
+        assert dot_sign(ux, uy, -vy, vx) == _sign(ex[0] * -ex[3] + ex[1] * ex[2])
+
+        a, b, c, x = rng.uniform(-5, 5), rng.uniform(-5, 5), rng.uniform(-5, 5), rng.uniform(-5, 5)
+        y = -(a * x + c) / b
+        fa, fb, fc, fx, fy = _exact(a, b, c, x, y)
+        assert line_side(a, b, c, x, y) == _sign(fa * fx + fb * fy + fc)
+        assert point_on_line(a, b, c, x, y) == (fa * fx + fb * fy + fc == 0)
+
+def _brute_force_intersect(ax, ay, bx, by, cx, cy, dx, dy):
+    ax, ay, bx, by, cx, cy, dx, dy = _exact(ax, ay, bx, by, cx, cy, dx, dy)
+    den = (bx - ax) * (dy - cy) - (by - ay) * (dx - cx)
+    if den == 0:
+        if (bx - ax) * (cy - ay) - (by - ay) * (cx - ax) != 0:
+            return False
+        # collinear, overlapping when their projections do.
+        key = (lambda x, y: x) if ax != bx else (lambda x, y: y)
+        lo1, hi1 = sorted((key(ax, ay), key(bx, by)))
+        lo2, hi2 = sorted((key(cx, cy), key(dx, dy)))
+        return max(lo1, lo2) <= min(hi1, hi2)
+    t = ((cx - ax) * (dy - cy) - (cy - ay) * (dx - cx)) / den
+    u = ((cx - ax) * (by - ay) - (cy - ay) * (bx - ax)) / den
+    return 0 <= t <= 1 and 0 <= u <= 1
+
+def test_segments_intersect_matches_exact():
+    rng = random.Random(3)
+    for _ in range(3000):
+        values = [rng.randint(0, 6) for _ in range(8)]
+        if values[:2] == values[2:4] or values[4:6] == values[6:]:
+            continue
+        assert segments_intersect(*values) == _brute_force_intersect(*values), values
@@ -0,0 +1,104 @@
+import io
+import random
+from array import array
+
+import pytest
+
+from models import LineArray, Point, PointArray
+from storage import mapped_coordinates, stream_binary, stream_csv, stream_lines, stream_triangles
+
+def _records(n, fields, seed=0):
+    rng = random.Random(seed)
+    return [[rng.randint(-1000, 1000) for _ in range(fields)] for _ in range(n)]
+
+def _concat(chunks):
+    # the chunks of every point of a record joined back together.
+    chunks = list(chunks)
+    return [PointArray([x for c in chunks for x in c[i].xs], [y for c in chunks for y in c[i].ys]) for i in range(len(chunks[0]))]
+
+def test_csv_chunks_round_trip(tmp_path):
+    records = _records(250, 4)
+    path = tmp_path / "segments.csv"
+    path.write_text("x1,y1,x2,y2\n" + "\n".join(",".join(map(str, r)) for r in records) + "\n\n")
+
+    chunks = list(stream_csv(path, fields=4, header=True, chunk_size=100))
+    assert [len(A) for A, _ in chunks] == [100, 100, 50]
+    assert all(A.typecode == "q" for A, _ in chunks)
+    A, B = _concat(chunks)
+    assert A == PointArray([r[0] for r in records], [r[1] for r in records])
+    assert B == PointArray([r[2] for r in records], [r[3] for r in records])
+
+def test_csv_columns_typecode_and_errors():
+    text = "id;y;x\n1;2.5;3\n2;4;5\n"
+    (points,), = stream_csv(io.StringIO(text), columns=(2, 1), header=True, delimiter=";")
+    assert points == PointArray([3, 5], [2.5, 4.0])
+    assert points.typecode == "d"
+
+    (points,), = stream_csv(io.StringIO("1,2\n3,4\n"), typecode="d")
+    assert points.typecode == "d"
+
+    with pytest.raises(ValueError):
+        list(stream_csv(io.StringIO("1,2\n3\n")))
+    with pytest.raises(ValueError):
+        list(stream_csv(io.StringIO("1,a\n")))
+    with pytest.raises(ValueError):
+        list(stream_csv(io.StringIO("1,2,3\n"), fields=3))
+
+def test_csv_infers_one_typecode_per_chunk():
+    # the first point is all integers but the second isn't, so both use float64.
+    (A, B), = stream_csv(io.StringIO("1,2,3.5,4\n5,6,7,8\n"), fields=4)
+    assert A.typecode == B.typecode == "d"
+    # integers too large for int64 make the whole chunk float64 as well.
+    (A, B), = stream_csv(io.StringIO(f"1,2,{2 ** 63},4\n"), fields=4)
+    assert A.typecode == B.typecode == "d"
+    # chunks are still inferred on their own.
+    chunks = list(stream_csv(io.StringIO("1,2,3,4\n5,6,7.5,8\n"), fields=4, chunk_size=1))
+    assert [(A.typecode, B.typecode) for A, B in chunks] == [("q", "q"), ("d", "d")]
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_chunk_size_below_one_raises(tmp_path, chunk_size):
+    path = tmp_path / "points.bin"
+    path.write_bytes(array("d", [1, 2]).tobytes())
+    with pytest.raises(ValueError, match="chunk size"):
+        list(stream_csv(io.StringIO("1,2\n"), chunk_size=chunk_size))
+    with pytest.raises(ValueError, match="chunk size"):
+        list(stream_binary(path, chunk_size=chunk_size))
+
+@pytest.mark.parametrize("typecode", ["d", "q"])
+def test_binary_chunks_round_trip(tmp_path, typecode):
+    records = _records(130, 6)
+    values = array(typecode, [v for r in records for v in r])
+    path = tmp_path / "triangles.bin"
+    path.write_bytes(values.tobytes())
+
+    chunks = list(stream_binary(path, fields=6, typecode=typecode, chunk_size=50))
+    assert [len(A) for A, _, _ in chunks] == [50, 50, 30]
+    for i, points in enumerate(_concat(chunks)):
+        assert list(points.xs) == [r[2 * i] for r in records]
+        assert list(points.ys) == [r[2 * i + 1] for r in records]
+
+    with mapped_coordinates(path, typecode) as view:
+        assert list(view) == list(values)
+
+def test_binary_rejects_partial_records(tmp_path):
+    path = tmp_path / "broken.bin"
+    path.write_bytes(array("d", [1, 2, 3]).tobytes())
+    with pytest.raises(ValueError):
+        list(stream_binary(path, fields=2))
+
+    path.write_bytes(b"\0" * 7)
+    with pytest.raises(ValueError):
+        list(stream_binary(path))
+
+    path.write_bytes(b"")
+    assert list(stream_binary(path)) == []
+
+def test_stream_lines_and_triangles():
+    segments = io.StringIO("0,0,1,1\n2,3,4,7\n")
+    (lines,) = stream_lines(stream_csv(segments, fields=4))
+    expected = LineArray.from_AB_coordinates([Point(0, 0), Point(2, 3)], [Point(1, 1), Point(4, 7)])
+    assert lines.x_coefficients == expected.x_coefficients
+    assert lines.constants == expected.constants
+
+    (triangles,) = stream_triangles(stream_csv(io.StringIO("0,0,4,0,0,3\n"), fields=6))
+    assert list(triangles.areas) == [6]
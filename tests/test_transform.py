@@ -0,0 +1,81 @@
+from fractions import Fraction
+
+import pytest
+
+from models import AffineTransform, Line, LineArray, Point, PointArray, Triangle, TriangleArray
+
+def _lines(points_A, points_B):
+    return LineArray.from_AB_coordinates(points_A, points_B)
+
+def test_points_and_inverse():
+    M = AffineTransform.translation(5, -2) @ AffineTransform.scaling(2, 3) @ AffineTransform.shear(1)
+    P = Point(3, 4)
+    assert M.inverse()(M(P)) == P
+    assert AffineTransform.rotation(90)(Point(1, 0)) == Point(0, 1)
+    assert AffineTransform.scaling(2).inverse() == AffineTransform.scaling(Fraction(1, 2))
+
+def test_singular_transform_raises():
+    with pytest.raises(ValueError):
+        AffineTransform(1, 2, 0, 2, 4, 0).inverse()
+
+@pytest.mark.parametrize("M", [
+    AffineTransform.scaling(2),
+    AffineTransform.rotation(90, Point(1, 1)) @ AffineTransform.scaling(2),
+    AffineTransform(2, 1, 3, 1, 1, -4),
+    AffineTransform(3, 0, 1, 0, -1, 2),
+])
+def test_int64_line_array_matches_transformed_points(M):
+    A = [Point(0, 0), Point(1, 1), Point(-2, 5), Point(3, 3)]
+    B = [Point(2, 3), Point(5, 1), Point(-2, 7), Point(8, 3)]
+    lines = M(_lines(A, B))
+    expected = _lines([M(P) for P in A], [M(P) for P in B])
+
+    assert lines.x_coefficients.typecode == "q"
+    for name in ("x_coefficients", "y_coefficients", "constants", "points_A", "points_B", "slopes", "lengths", "midpoints"):
+        assert getattr(lines, name) == getattr(expected, name), name
+
+def test_int64_line_array_rejects_non_integer_transform():
+    lines = _lines([Point(0, 0)], [Point(1, 2)])
+    with pytest.raises(ValueError):
+        AffineTransform.scaling(0.5).apply_in_place(lines)
+
+    # a copy is made with float64 buffers instead.
+    assert AffineTransform.scaling(0.5)(lines).x_coefficients.typecode == "d"
+
+def test_line_and_triangle():
+    M = AffineTransform(2, 1, 3, 1, 1, -4)
+    line = Line.from_AB_coordinates(Point(0, 0), Point(2, 1))
+    assert M(line) == Line.from_AB_coordinates(M(Point(0, 0)), M(Point(2, 1)))
+
+    triangle = Triangle.from_vertices(Point(0, 0), Point(4, 0), Point(0, 3))
+    assert M(triangle).area == triangle.area * abs(M.determinant)
+
+def test_arrays_in_place():
+    points = PointArray([1, 2, 3], [4, 5, 6])
+    AffineTransform.translation(1, 1).apply_in_place(points)
+    assert points == PointArray([2, 3, 4], [5, 6, 7])
+
+    triangles = TriangleArray.from_vertices([Point(0, 0)], [Point(4, 0)], [Point(0, 3)])
+    AffineTransform.scaling(2).apply_in_place(triangles)
+    assert list(triangles.areas) == [24]
+
+def test_int64_overflow_leaves_batch_unchanged():
+    M = AffineTransform.scaling(4)
+    points = PointArray([1, 2 ** 62], [5, 0])
+    lines = _lines([Point(0, 0), Point(1, 1)], [Point(2 ** 62, 1), Point(2, 3)])
+    # only the determinant of the triangle leaves the int64 range.
+    triangles = TriangleArray.from_vertices([Point(0, 0)], [Point(2 ** 31, 0)], [Point(0, 2 ** 31)])
+    for batch in (points, lines, triangles):
+        copy = batch[:]
+        with pytest.raises(ValueError, match="int64 range"):
+            M.apply_in_place(batch)
+        for name in ("xs", "ys", "x_coefficients", "y_coefficients", "constants", "points_A", "points_B", "slopes", "lengths", "midpoints", "vertices_A", "vertices_B", "vertices_C", "_det"):
+            if hasattr(batch, name):
+                assert getattr(batch, name) == getattr(copy, name), name
+
+    # a transformed copy falls back to float64 buffers instead.
+    moved = M(points)
+    assert moved.typecode == "d" and list(moved.xs) == [4, 2 ** 64] and list(moved.ys) == [20, 0]
+    assert points == PointArray([1, 2 ** 62], [5, 0])
+    assert M(lines).points_B.xs[0] == 2 ** 64
+    assert list(M(triangles).areas) == [2 ** 65]
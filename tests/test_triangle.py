@@ -0,0 +1,78 @@
+import math
+import random
+
+import pytest
+
+from models import Line, Point, Polygon, Triangle, TriangleArray
+
+VERTICES = [
+    (Point(0, 0), Point(4, 0), Point(0, 3)),
+    (Point(0, 3), Point(0, 0), Point(4, 0)),
+    (Point(1, 1), Point(-2, 5), Point(7, -3)),
+    (Point(0.5, 0.25), Point(3.5, 1), Point(-1, 2.75)),
+]
+
+def test_area_matches_triangle_array():
+    triangles = TriangleArray.from_vertices(*([v[i] for v in VERTICES] for i in range(3)))
+    assert list(triangles.areas) == [Triangle.from_vertices(*v).area for v in VERTICES]
+    assert list(triangles.areas) == [abs(a) for a in triangles.signed_areas]
+
+def test_area_matches_polygon():
+    for v in VERTICES:
+        assert Triangle.from_vertices(*v).area == Polygon.from_vertices(*v).area
+
+def test_area_from_sides():
+    A, B, C = Point(0, 3), Point(0, 0), Point(4, 0)
+    triangle = Triangle.from_sides(Line.from_AB_coordinates(B, C), Line.from_AB_coordinates(A, C), Line.from_AB_coordinates(A, B))
+    assert triangle.area == 6
+
+@pytest.mark.parametrize("A, B, C", [
+    (Point(0, 0), Point(1, 1), Point(5, 5)),
+    (Point(0, 0), Point(0, 0), Point(1, 2)),
+    (Point(3, 3), Point(3, 3), Point(3, 3)),
+    (Point(0.5, 0.25), Point(1.0, 0.5), Point(3.0, 1.5)),
+    (Point(10 ** 18, 1), Point(2 * 10 ** 18, 2), Point(3 * 10 ** 18, 3)),
+])
+def test_from_vertices_rejects_collinear_points(A, B, C):
+    with pytest.raises(ValueError):
+        Triangle.from_vertices(A, B, C)
+
+def test_from_vertices_accepts_nearly_collinear_points():
+    # off by one over 10^18, which float arithmetic would round away.
+    triangle = Triangle.from_vertices(Point(10 ** 18, 1), Point(2 * 10 ** 18, 2), Point(3 * 10 ** 18 + 1, 3))
+    assert triangle.area == 0.5
+
+# not collinear, but (B - A) x (C - A) rounds to 0 in float arithmetic.
+NEARLY_COLLINEAR = (
+    Point(0.021489705265908876, 0.8375779756625729),
+    Point(0.5564543226524334, 0.6422943629324456),
+    Point(0.12094297967003403, 0.8012735284294847),
+)
+
+def test_triangle_array_accepts_what_triangle_accepts():
+    triangle = Triangle.from_vertices(*NEARLY_COLLINEAR)
+    triangles = TriangleArray.from_vertices(*([P] for P in NEARLY_COLLINEAR))
+    assert triangles.signed_areas[0] > 0
+    assert triangle.area > 0
+    with pytest.raises(ValueError, match="at index 1"):
+        TriangleArray.from_vertices([Point(0, 0), Point(0.5, 0.25)], [Point(1, 0), Point(1.0, 0.5)], [Point(0, 1), Point(3.0, 1.5)])
+
+def test_triangle_array_classification_matches_brute_force():
+    rng = random.Random(0)
+    vertices = []
+    while len(vertices) < 300:
+        A, B, C = (Point(rng.randint(-4, 4), rng.randint(-4, 4)) for _ in range(3))
+        if (B.x - A.x) * (C.y - A.y) != (B.y - A.y) * (C.x - A.x):
+            vertices.append((A, B, C))
+
+    triangles = TriangleArray.from_vertices(*([v[i] for v in vertices] for i in range(3)))
+    for k, (A, B, C) in enumerate(vertices):
+        squared = lambda P, Q: (P.x - Q.x) ** 2 + (P.y - Q.y) ** 2
+        dot = lambda P, Q, R: (Q.x - P.x) * (R.x - P.x) + (Q.y - P.y) * (R.y - P.y)
+        a, b, c = squared(B, C), squared(A, C), squared(A, B)
+        assert triangles.is_isoceles[k] == (a == b or b == c or a == c)
+        assert triangles.is_equilateral[k] == (a == b == c)
+        assert triangles.is_scalene[k] == (len({a, b, c}) == 3)
+        assert triangles.is_right_angled[k] == (0 in (dot(A, B, C), dot(B, A, C), dot(C, A, B)))
+        assert [lengths[k] for lengths in triangles.side_lengths] == pytest.approx([math.sqrt(a), math.sqrt(b), math.sqrt(c)])
+        assert sum(angles[k] for angles in triangles.angles) == pytest.approx(180)
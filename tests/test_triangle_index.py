@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from algorithms import TriangleIndex, delaunay_triangulation
+from models import Point, Triangle, TriangleArray
+from models.predicates import orient
+
+def _contains(vertices, P):
+    (ax, ay), (bx, by), (cx, cy) = vertices
+    signs = {orient(ax, ay, bx, by, P.x, P.y), orient(bx, by, cx, cy, P.x, P.y), orient(cx, cy, ax, ay, P.x, P.y)}
+    return not (1 in signs and -1 in signs)
+
+def _random_triangles(n, seed):
+    rng = random.Random(seed)
+    triangles = []
+    while len(triangles) < n:
+        x, y = rng.randint(0, 100), rng.randint(0, 100)
+        vertices = [(x + rng.randint(-8, 8), y + rng.randint(-8, 8)) for _ in range(3)]
+        (ax, ay), (bx, by), (cx, cy) = vertices
+        if orient(ax, ay, bx, by, cx, cy) != 0:
+            triangles.append(vertices)
+    return triangles
+
+def test_matches_brute_force():
+    triangles = _random_triangles(150, 0)
+    index = TriangleIndex(TriangleArray.from_vertices(*([Point(*v[i]) for v in triangles] for i in range(3))))
+    rng = random.Random(1)
+    queries = [Point(rng.randint(-10, 110), rng.randint(-10, 110)) for _ in range(300)]
+    for P in queries:
+        expected = [i for i, vertices in enumerate(triangles) if _contains(vertices, P)]
+        assert index.locate_all(P) == expected
+        assert index.locate(P) == (expected[0] if expected else None)
+
+    assert list(index.locate_many(queries)) == [index.locate(P) if index.locate(P) is not None else -1 for P in queries]
+
+def test_triangulation_and_triangle_objects():
+    rng = random.Random(2)
+    triangulation = delaunay_triangulation([Point(rng.randint(0, 50), rng.randint(0, 50)) for _ in range(80)])
+    index = TriangleIndex(triangulation)
+    assert len(index) == len(triangulation)
+    for k, (a, b, c) in enumerate(triangulation.triples()):
+        points = triangulation.points
+        centroid = Point((points[a].x + points[b].x + points[c].x) / 3, (points[a].y + points[b].y + points[c].y) / 3)
+        # triangles of a triangulation don't overlap, so only the triangle itself contains its centroid.
+        assert index.locate_all(centroid) == [k]
+
+    triangle = Triangle.from_vertices(Point(0, 0), Point(4, 0), Point(0, 4))
+    index = TriangleIndex([triangle])
+    assert index.locate(Point(1, 1)) == 0
+    assert index.locate(Point(2, 2)) == 0
+    assert index.locate(Point(3, 3)) is None
+
+def test_empty_input_raises():
+    with pytest.raises(ValueError):
+        TriangleIndex([])